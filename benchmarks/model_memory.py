@@ -0,0 +1,187 @@
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
+
+
+""" Report the memory used by the model of a project with and without the
+models storing their fields in slots.  The project is loaded and then copied
+twice, once using the model classes and once using ordinary dataclass copies of
+them.  Both copies share the same strings and tuples so the difference between
+the memory allocated for each is the memory saved by the slots.  If no project
+file is given then a synthetic one is created.
+
+The memory is measured using tracemalloc rather than the RSS of the process.
+The RSS includes memory freed while loading the project that hasn't been
+returned to the operating system by the allocator and so varies with the
+platform and with the history of the process.
+"""
+
+
+import argparse
+from dataclasses import fields, is_dataclass, make_dataclass
+import os
+import sys
+import tempfile
+import tracemalloc
+
+
+# The root directory of the metasip source tree.
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main():
+    """ The entry point for the benchmark. """
+
+    parser = argparse.ArgumentParser(description=__doc__)
+
+    parser.add_argument('project', help="the project file to load", nargs='?')
+    parser.add_argument('--sip-files',
+            help="the number of .sip files in the synthetic project "
+                    "(default: %(default)s)",
+            metavar='N', type=int, default=400)
+
+    args = parser.parse_args()
+
+    sys.path.insert(0, _ROOT_DIR)
+
+    from metasip.models import Project
+    from metasip.project_io import load_project
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_name = args.project
+
+        if project_name is None:
+            project_name = os.path.join(temp_dir, 'synthetic.msp')
+            _create_project(project_name, args.sip_files)
+
+        print(f"{project_name}: {os.path.getsize(project_name) / 2**20:.1f}MB")
+
+        tracemalloc.start()
+
+        project = Project(project_name)
+        load_project(project)
+        loaded, _ = tracemalloc.get_traced_memory()
+
+        slotted_classes = _model_classes()
+        slotted = _measure_copy(project, {cls: cls for cls in slotted_classes})
+
+        unslotted = _measure_copy(project,
+                {cls: make_dataclass(cls.__name__,
+                                [(f.name, f.type) for f in fields(cls)])
+                        for cls in slotted_classes})
+
+        tracemalloc.stop()
+
+    no_slots = loaded + unslotted - slotted
+
+    print(f"no-slots: model {no_slots / 2**20:.1f}MB")
+    print(f"   slots: model {loaded / 2**20:.1f}MB")
+    print(f"  saving: model {_saving(no_slots, loaded)}")
+
+
+def _create_project(project_name, nr_sip_files):
+    """ Create a synthetic project with a number of .sip files. """
+
+    from metasip.helpers import (interned_tags, interned_version_range,
+            interned_version_ranges)
+    from metasip.models import (Argument, Class, Constructor, Destructor,
+            Enum, EnumValue, Function, Method, Module, Project, SipFile)
+    from metasip.project_io import save_project
+
+    project = Project(name=project_name, versions=['v1', 'v2', 'v3'],
+            platforms=['Linux', 'Windows'], features=['Feature'])
+
+    module = Module(name='Module')
+    project.modules.append(module)
+
+    for sip_file_nr in range(nr_sip_files):
+        sip_file = SipFile(name=f'file{sip_file_nr}.h')
+        module.content.append(sip_file)
+
+        for class_nr in range(5):
+            klass = Class(name=f'Class{sip_file_nr}_{class_nr}',
+                    bases='public QObject')
+            sip_file.content.append(klass)
+
+            klass.content.append(
+                    Constructor(name=klass.name,
+                            args=[Argument(type='QObject *', name='parent',
+                                    default='nullptr')]))
+            klass.content.append(Destructor(name=klass.name, virtual=True))
+            klass.content.append(
+                    Enum(name='Enum',
+                            content=[EnumValue(name='A'),
+                                    EnumValue(name='B')]))
+
+            for method_nr in range(30):
+                method = Method(name=f'method{method_nr}', rtype='int',
+                        const=(method_nr % 3 == 0),
+                        args=[Argument(type='int', name=f'a{arg_nr}')
+                                for arg_nr in range(method_nr % 4)])
+
+                if method_nr % 5 == 0:
+                    method.versions = interned_version_ranges(
+                            [interned_version_range('v2', '')])
+
+                if method_nr % 7 == 0:
+                    method.platforms = interned_tags(['Linux'])
+
+                klass.content.append(method)
+
+        sip_file.content.append(
+                Function(name=f'function{sip_file_nr}', rtype='int',
+                        args=[Argument(type='int', name='a')]))
+
+    save_project(project, None)
+
+
+def _model_classes():
+    """ Return the list of the concrete model classes, i.e. those that have
+    slots.
+    """
+
+    from metasip import models
+
+    return [cls for cls in vars(models).values()
+            if isinstance(cls, type) and is_dataclass(cls) and
+                    cls.__dict__.get('__slots__')]
+
+
+def _measure_copy(project, class_map):
+    """ Return the memory allocated for a copy of the model of a project
+    created using a map of model classes to the classes of the copy.
+    """
+
+    before, _ = tracemalloc.get_traced_memory()
+    copy = _copy(project, class_map)
+    after, _ = tracemalloc.get_traced_memory()
+
+    del copy
+
+    return after - before
+
+
+def _copy(value, class_map):
+    """ Return a copy of a value from a model.  Strings, tuples and anything
+    else that isn't a list or a model are shared with the original.
+    """
+
+    if isinstance(value, list):
+        return [_copy(v, class_map) for v in value]
+
+    cls = class_map.get(type(value))
+    if cls is None:
+        return value
+
+    return cls(**{f.name: _copy(getattr(value, f.name), class_map)
+            for f in fields(value)})
+
+
+def _saving(before, after):
+    """ Return a string describing a saving. """
+
+    return f"{(before - after) / 2**20:.1f}MB ({(before - after) / before:.0%})"
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,10 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
+import os
+import sys
+
+
 class UserException(Exception):
     """ An exception capturing user friendly information. """
 
@@ -15,3 +19,35 @@ class UserException(Exception):
 
         self.text = text
         self.detail = detail
+
+    def __reduce__(self):
+        """ Reimplemented so that the exception can be passed between
+        processes.
+        """
+
+        return (type(self), (self.text, ), {'detail': self.detail})
+
+
+def handle_exception(e):
+    """ Tell the user of a console script about an exception.  A UserException
+    causes the script to exit and any other exception is re-raised.
+    """
+
+    if isinstance(e, UserException):
+        # An "expected" exception.
+        if e.detail is not None:
+            message = "{0}: {1}".format(e.text, e.detail)
+        else:
+            message = e.text
+
+        print("{0}: {1}".format(os.path.basename(sys.argv[0]), message),
+                file=sys.stderr)
+
+        sys.exit(1)
+
+    # An internal error.
+    print("{0}: An internal error occurred...".format(
+            os.path.basename(sys.argv[0])),
+            file=sys.stderr)
+
+    raise e
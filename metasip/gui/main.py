@@ -28,6 +28,9 @@ def main():
     # Parse the command line.
     parser = argparse.ArgumentParser()
     parser.add_argument('project', help="the project to edit", nargs='?')
+    parser.add_argument('--use-cache',
+            help="load the project from a cache that is created if necessary",
+            dest='use_cache', default=False, action='store_true')
     args = parser.parse_args()
 
     project_name = args.project
@@ -41,7 +44,8 @@ def main():
     # Load any project.
     if project_name:
         project = Project(project_name)
-        if not load_project(project, ui=ProjectUi()):
+        if not load_project(project, ui=ProjectUi(),
+                use_cache=args.use_cache):
             return 0
     else:
         project = Project('Untitled.msp')
@@ -3,6 +3,7 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
+from contextlib import contextmanager
 from enum import auto, Enum
 
 from PyQt6.QtCore import QSettings, Qt
@@ -20,6 +21,14 @@ class EventType(Enum):
     that don't have an event because there is no consequent impact on the GUI.
     """
 
+    # A batch of API_STATUS, API_VERSIONS, CONTAINER_API_ADD and
+    # CONTAINER_API_DELETE events made within a Shell.batched_updates()
+    # context.  The event argument is a list of 2-tuples of the
+    # event type and event argument in the order the events were notified.
+    # Only the first API_STATUS and API_VERSIONS event for each API is
+    # included.
+    API_CHANGES = auto()
+
     # The status of an API model has changed.  The event argument is the API.
     API_STATUS = auto()
 
@@ -101,11 +110,20 @@ class Shell:
         ShellToolLocation.BOTTOM: Qt.DockWidgetArea.BottomDockWidgetArea,
     }
 
+    # The events that are batched within a batched_updates() context.
+    _BATCHED_EVENTS = (EventType.API_STATUS, EventType.API_VERSIONS,
+            EventType.CONTAINER_API_ADD, EventType.CONTAINER_API_DELETE)
+
     def __init__(self, *tool_factories):
         """ Initialise the shell. """
 
         self._project = None
 
+        # The state of any batch of updates.
+        self._update_depth = 0
+        self._api_changes = []
+        self._api_changes_seen = set()
+
         # Create the widget that implements the shell.
         self.widget = _ShellWidget(self._handle_close_event)
 
@@ -195,6 +213,25 @@ class Shell:
 
         settings.endGroup()
 
+    @contextmanager
+    def batched_updates(self):
+        """ A context manager for a batch of updates to the project's APIs.
+        Within the context the API-related events are not notified individually
+        but are delivered to the tools as a single API_CHANGES event when the
+        context is left, even if it is left because of an exception.  Batches
+        may be nested.
+        """
+
+        self._update_depth += 1
+
+        try:
+            yield
+        finally:
+            self._update_depth -= 1
+
+            if self._update_depth == 0:
+                self._notify_api_changes()
+
     @property
     def dirty(self):
         """ Get the project's dirty state. """
@@ -227,6 +264,16 @@ class Shell:
     def notify(self, event_type, event_arg=None):
         """ Notify all tools about a project-specific event. """
 
+        if self._update_depth != 0:
+            if event_type in self._BATCHED_EVENTS:
+                self._batch_api_change(event_type, event_arg)
+                return
+
+            # Other events (apart from log messages which don't depend on the
+            # state of the project) must not overtake the batched ones.
+            if event_type is not EventType.LOG_MESSAGE:
+                self._notify_api_changes()
+
         for tool in self._tools:
             tool.event(event_type, event_arg)
 
@@ -284,6 +331,33 @@ f"""This is msip v{version}, part of MetaSIP.
 msip is a tool for creating .sip files from C/C++ header files.
 """)
 
+    def _batch_api_change(self, event_type, event_arg):
+        """ Add an API-related event to the current batch. """
+
+        # An API only needs to be redrawn once.
+        if event_type in (EventType.API_STATUS, EventType.API_VERSIONS):
+            key = (event_type, id(event_arg))
+
+            if key in self._api_changes_seen:
+                return
+
+            self._api_changes_seen.add(key)
+
+        self._api_changes.append((event_type, event_arg))
+
+    def _notify_api_changes(self):
+        """ Notify all tools about any batched API-related events. """
+
+        if len(self._api_changes) == 0:
+            return
+
+        api_changes = self._api_changes
+        self._api_changes = []
+        self._api_changes_seen = set()
+
+        for tool in self._tools:
+            tool.event(EventType.API_CHANGES, api_changes)
+
     def _handle_close_event(self):
         """ Handle a close event and return True if the event should be
         accepted.
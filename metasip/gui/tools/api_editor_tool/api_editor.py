@@ -8,16 +8,18 @@ from typing import Callable, Optional
 
 from PyQt6.QtCore import QByteArray, QMimeData, Qt
 from PyQt6.QtGui import QDrag
-from PyQt6.QtWidgets import (QApplication, QMenu, QMessageBox, QProgressDialog,
-        QTreeWidget, QTreeWidgetItem, QTreeWidgetItemIterator)
+from PyQt6.QtWidgets import (QMenu, QMessageBox, QTreeWidget,
+        QTreeWidgetItem, QTreeWidgetItemIterator)
 
+from ....helpers import interned_version_range, interned_version_ranges
 from ....models import (Access, Class, Constructor, Destructor, Enum,
         EnumValue, ExtendedAccess, Function, ManualCode, Method, Module,
         Namespace, OperatorCast, OpaqueClass, OperatorFunction, OperatorMethod,
-        Tagged, Typedef, Variable, VersionRange)
+        Tagged, Typedef, Variable)
 from ....models.adapters import adapt
 
 from ...helpers import warning
+from ...shell import EventType
 
 from .dialogs import (ArgumentPropertiesDialog, CallablePropertiesDialog,
         ClassPropertiesDialog, EnumPropertiesDialog,
@@ -53,48 +55,135 @@ class ApiEditor(QTreeWidget):
         self.setDropIndicatorShown(True)
         self.setDragDropMode(self.DragDropMode.InternalMove)
 
+        # The views of child APIs are created when a view is first expanded.
+        self.itemExpanded.connect(lambda view: view.populate())
+
         self.dragged = None
 
+        # The view of each API keyed by the id() of the API.
+        self._views = {}
+
+        # The container of each API keyed by the id() of the API.  It is
+        # created when first needed and is then kept up to date by the add and
+        # delete events and by the changes made by the editor itself.
+        self._containers = None
+
+    def add_view(self, view):
+        """ Add a view to the map of APIs and views. """
+
+        self._views[id(view.api)] = view
+
+    def add_containers(self, container, api):
+        """ Add an API, and its descendants, to the map of containers. """
+
+        if self._containers is not None:
+            self._containers[id(api)] = container
+
+            for child_api in getattr(api, 'content', ()):
+                self.add_containers(api, child_api)
+
+    def api_changes(self, api_changes):
+        """ Handle a batch of changes to APIs. """
+
+        # Bring the views of each container up to date with its contents.
+        containers = {}
+        redraws = []
+        reveals = {}
+
+        for event_type, event_arg in api_changes:
+            if event_type in (EventType.CONTAINER_API_ADD,
+                    EventType.CONTAINER_API_DELETE):
+                container, api = event_arg
+                containers.setdefault(id(container), container)
+
+                if event_type is EventType.CONTAINER_API_ADD:
+                    self.add_containers(container, api)
+
+                    if self.get_view(container) is None:
+                        if _needs_revealing(api):
+                            reveals.setdefault(id(container), container)
+                else:
+                    self.remove_containers(api)
+            else:
+                redraws.append((event_type, event_arg))
+
+        for container in containers.values():
+            view = self.get_view(container)
+            if view is not None:
+                view.content_changed()
+
+        for event_type, api in redraws:
+            view = self.get_view(api)
+            if view is not None:
+                if event_type is EventType.API_STATUS:
+                    view.draw_status()
+                else:
+                    view.draw_versions()
+            elif event_type is EventType.API_STATUS and _needs_attention(api):
+                container = self._get_container(api)
+                if container is not None:
+                    reveals.setdefault(id(container), container)
+
+        # Make sure anything that now needs the user's attention but doesn't
+        # have a view is revealed.
+        for container in reveals.values():
+            self._reveal_container(container)
+
     def api_status(self, api):
         """ Handle the change of status of an API. """
 
-        for view in self._all_views():
-            if view.api is api:
-                view.draw_status()
-                break
+        view = self.get_view(api)
+        if view is not None:
+            view.draw_status()
+        elif _needs_attention(api):
+            container = self._get_container(api)
+            if container is not None:
+                self._reveal_container(container)
 
     def api_versions(self, api):
         """ Handle the change of versions of an API. """
 
-        for view in self._all_views():
-            if view.api is api:
-                view.draw_versions()
-                break
+        view = self.get_view(api)
+        if view is not None:
+            view.draw_versions()
 
     def container_api_add(self, container, api):
         """ Handle the addition of an API to a container. """
 
-        for view in self._all_views():
-            if view.api is container:
-                view.api_add(api)
-                break
+        self.add_containers(container, api)
+
+        view = self.get_view(container)
+        if view is not None:
+            view.api_add(api)
+        elif _needs_revealing(api):
+            self._reveal_container(container)
 
     def container_api_delete(self, container, api):
         """ Handle the deletion of an API from a container. """
 
-        for view in self._all_views():
-            if view.api is container:
-                view.api_delete(api)
-                break
+        self.remove_containers(api)
+
+        view = self.get_view(container)
+        if view is not None:
+            view.api_delete(api)
+
+    def get_view(self, api):
+        """ Return the view of an API or None if there is no view. """
+
+        return self._views.get(id(api))
 
     def module_add(self, module):
         """ Handle the addition of a module. """
 
+        self.add_containers(self._shell.project, module)
+
         self._project_view.module_add(module)
 
     def module_delete(self, module):
         """ Handle the deletion of a module. """
 
+        self.remove_containers(module)
+
         self._project_view.module_delete(module)
 
     def module_rename(self, module):
@@ -102,6 +191,26 @@ class ApiEditor(QTreeWidget):
 
         self._project_view.module_rename(module)
 
+    def remove_containers(self, api):
+        """ Remove an API, and its descendants, from the map of containers. """
+
+        if self._containers is not None:
+            self._containers.pop(id(api), None)
+
+            for child_api in getattr(api, 'content', ()):
+                self.remove_containers(child_api)
+
+    def remove_view(self, view):
+        """ Remove a view, and the views of its children, from the map of APIs
+        and views.
+        """
+
+        if self._views.get(id(view.api)) is view:
+            del self._views[id(view.api)]
+
+        for child_view in view.all_child_views():
+            self.remove_view(child_view)
+
     def restore_state(self, settings):
         """ Restore the widget's state. """
 
@@ -113,6 +222,8 @@ class ApiEditor(QTreeWidget):
         """ Set the current project. """
 
         self.clear()
+        self._views = {}
+        self._containers = None
         self._project_view = ProjectView(self._shell, self)
 
     def root_module_updated(self):
@@ -229,6 +340,35 @@ class ApiEditor(QTreeWidget):
             target.drop(source)
             ev.accept()
 
+    def _get_container(self, api):
+        """ Return the container of an API or None if the API isn't part of
+        the project.
+        """
+
+        if self._containers is None:
+            project = self._shell.project
+
+            self._containers = {}
+
+            for module in project.modules:
+                self.add_containers(project, module)
+
+        return self._containers.get(id(api))
+
+    def _reveal_container(self, container):
+        """ Reveal the nearest view of a container, or of one of its ancestors,
+        so that the views of any of its descendants that need the user's
+        attention are created.
+        """
+
+        while container is not None:
+            view = self.get_view(container)
+            if view is not None:
+                view.reveal()
+                break
+
+            container = self._get_container(container)
+
     def _source_target(self, ev):
         """ Return a 2-tuple of source and target views or None if the drop
         wasn't appropriate.
@@ -267,18 +407,6 @@ class ApiEditor(QTreeWidget):
 
         return source, target
 
-    def _all_views(self, container_view=None):
-        """ A generator for all API views. """
-
-        if container_view is None:
-            container_view = self._project_view
-
-        for view in container_view.all_child_views():
-            yield view
-
-            for sub_view in self._all_views(view):
-                yield sub_view
-
 
 @dataclass
 class MenuOption:
@@ -342,6 +470,12 @@ class APIView(QTreeWidgetItem):
         self.api = api
         self.shell = shell
 
+        self.treeWidget().add_view(self)
+
+        # The views of any child APIs are created when needed.
+        self._populated = False
+        self._update_child_indicator()
+
     def all_child_views(self):
         """ A generator for all the views's children. """
 
@@ -351,23 +485,99 @@ class APIView(QTreeWidgetItem):
     def api_add(self, api):
         """ An API has been added. """
 
+        if not self._populated:
+            self._update_child_indicator()
+            self.reveal()
+            return
+
         # The order of views must match the order of APIs.
         index = self.api.content.index(api)
         after = self if index == 0 else self.child(index - 1)
-        self.get_child_factory()(api, self.shell, self, after)
+        self.get_child_factory()(api, self.shell, self, after).reveal()
 
     def api_delete(self, api):
         """ An API has been deleted. """
 
+        view = self.treeWidget().get_view(api)
+        if view is not None and view.parent() is self:
+            self.remove_child_view(view)
+
+        if not self._populated:
+            self._update_child_indicator()
+
+    def child_apis(self):
+        """ Return the sequence of child APIs. """
+
+        return getattr(self.api, 'content', ())
+
+    def content_changed(self):
+        """ The content of the API has changed. """
+
+        if not self._populated:
+            self._update_child_indicator()
+            self.reveal()
+            return
+
+        # Remove the views of any APIs that have gone.
+        content_ids = {id(api) for api in self.api.content}
+
+        for view in list(self.all_child_views()):
+            if id(view.api) not in content_ids:
+                self.remove_child_view(view)
+
+        # Create the views of any new APIs.  The order of views must match the
+        # order of APIs.
+        editor = self.treeWidget()
+        child_factory = self.get_child_factory()
+
+        for index, api in enumerate(self.api.content):
+            view = editor.get_view(api)
+
+            if view is None or view.parent() is not self:
+                after = self if index == 0 else self.child(index - 1)
+                child_factory(api, self.shell, self, after).reveal()
+
+    def populate(self):
+        """ Create the views of the child APIs if they haven't already been
+        created.
+        """
+
+        if self._populated:
+            return
+
+        self._populated = True
+
+        for api in self.child_apis():
+            self.get_child_factory()(api, self.shell, self)
+
+        self._update_child_indicator()
+
         for view in self.all_child_views():
-            if view.api is api:
-                self.removeChild(view)
-                break
+            view.reveal()
+
+    def reveal(self):
+        """ Make sure that the views of any descendant APIs that need the
+        user's attention have been created.  Creating such a view will expand
+        its parents.
+        """
+
+        if _contains_attention(self.api):
+            if self._populated:
+                for view in self.all_child_views():
+                    view.reveal()
+            else:
+                self.populate()
+
+    def remove_child_view(self, view):
+        """ Remove a child view that will no longer be used. """
+
+        self.treeWidget().remove_view(view)
+        self.removeChild(view)
 
     def api_as_str(self):
         """ Returns the API as a string for display purposes. """
 
-        return adapt(self.api).as_str()
+        return adapt(self.api).as_str(self.api)
 
     def get_child_factory(self):
         """ Return the callable that will return a child instance. """
@@ -384,6 +594,18 @@ class APIView(QTreeWidgetItem):
         # This default implementation doesn't have a menu.
         return None
 
+    def _update_child_indicator(self):
+        """ Update the policy for showing the child indicator. """
+
+        if self._populated:
+            policy = self.ChildIndicatorPolicy.DontShowIndicatorWhenChildless
+        elif len(self.child_apis()) != 0:
+            policy = self.ChildIndicatorPolicy.ShowIndicator
+        else:
+            policy = self.ChildIndicatorPolicy.DontShowIndicator
+
+        self.setChildIndicatorPolicy(policy)
+
 
 class ProjectView(APIView):
     """ This class implements a view of a project. """
@@ -394,27 +616,10 @@ class ProjectView(APIView):
         super().__init__(shell.project, shell, parent)
 
         self.root_module_updated()
-        self.setExpanded(True)
 
-        project = self.api
-
-        # Progress will be reported against .sip files so count them all.
-        nr_steps = 0
-        for module in project.modules:
-            nr_steps += len(module.content)
-
-        # Display the progress dialog.
-        progress = QProgressDialog("Building the GUI...", None, 0, nr_steps)
-        progress.setWindowTitle(project.name)
-        progress.setValue(0)
-
-        so_far = 0
-        for module in project.modules:
-            ModuleView(module, self.shell, self)
-
-            so_far += len(module.content)
-            progress.setValue(so_far)
-            QApplication.processEvents()
+        # Only the modules are shown initially.
+        self.populate()
+        self.setExpanded(True)
 
         self._sort()
 
@@ -426,6 +631,16 @@ class ProjectView(APIView):
 
         return [MenuOption("Properties...", self._handle_project_properties)]
 
+    def child_apis(self):
+        """ Return the sequence of child APIs. """
+
+        return self.api.modules
+
+    def get_child_factory(self):
+        """ Return the callable that will return a child view. """
+
+        return ModuleView
+
     def module_add(self, module):
         """ Handle the addition of a module. """
 
@@ -435,10 +650,9 @@ class ProjectView(APIView):
     def module_delete(self, module):
         """ Handle the deletion of a module. """
 
-        for view in self.all_child_views():
-            if view.api is module:
-                self.removeChild(view)
-                break
+        view = self.treeWidget().get_view(module)
+        if view is not None:
+            self.remove_child_view(view)
 
     def module_rename(self, module):
         """ A module has been renamed. """
@@ -450,6 +664,14 @@ class ProjectView(APIView):
 
         self._sort()
 
+    def reveal(self):
+        """ Make sure that the views of any descendant APIs that need the
+        user's attention have been created.
+        """
+
+        for view in self.all_child_views():
+            view.reveal()
+
     def root_module_updated(self):
         """ The name of the root module has been updated. """
 
@@ -484,9 +706,6 @@ class ModuleView(APIView, DropSite):
 
         self.setText(ApiEditor.NAME, module.name)
 
-        for sip_file in module.content:
-            SipFileView(sip_file, self.shell, self)
-
     def droppable(self, view):
         """ Return True if a view can be dropped. """
 
@@ -498,6 +717,10 @@ class ModuleView(APIView, DropSite):
 
         view_parent = view.parent()
 
+        # Make sure the views of the module's .sip files have been created so
+        # that the view can be moved rather than discarded.
+        self.populate()
+
         # Remove the view from its parent and the API item from its container.
         api = view.api
         view_parent.api.content.remove(api)
@@ -506,6 +729,7 @@ class ModuleView(APIView, DropSite):
         # The .sip file is always placed at the top.
         self.api.content.insert(0, api)
         self.insertChild(0, view)
+        self.treeWidget().add_containers(self.api, api)
 
         self.shell.dirty = True
 
@@ -543,10 +767,6 @@ class ContainerView(APIView, DropSite):
 
         super().__init__(container, shell, parent, after)
 
-        if hasattr(container, 'content'):
-            for code in container.content:
-                CodeView(code, self.shell, self)
-
     @classmethod
     def add_editor_option(cls, menu, name, handler, value, editor_id):
         """ Add the option that will invoke the external editor to a menu. """
@@ -613,8 +833,8 @@ class ContainerView(APIView, DropSite):
 
         project_versions = self.shell.project.versions
         if project_versions:
-            manual_code.versions.append(
-                    VersionRange(startversion=project_versions[-1]))
+            manual_code.versions = interned_version_ranges(
+                    [interned_version_range(project_versions[-1])])
 
         return manual_code
 
@@ -629,6 +849,9 @@ class SipFileView(ContainerView):
 
         self._targets = []
 
+        # Set if ignored code is shown.
+        self.ignored_visible = False
+
         self.setText(ApiEditor.NAME, sip_file.name)
 
     def droppable(self, view):
@@ -667,6 +890,9 @@ class SipFileView(ContainerView):
                 parent_content.append(api)
                 parent.addChild(view)
 
+            # The .sip file may have been moved from a different module.
+            self.treeWidget().add_containers(parent.api, api)
+
         elif view_parent is self:
             # Dropping a child is interpreted as moving it to the top.
             self.api.content.insert(0, api)
@@ -738,6 +964,7 @@ class SipFileView(ContainerView):
 
             src_module.content.remove(self.api)
             dst_module.content.append(self.api)
+            self.treeWidget().add_containers(dst_module, self.api)
 
     def _deleteFile(self):
         """ Delete an empty .sip file. """
@@ -753,7 +980,8 @@ class SipFileView(ContainerView):
 
             parent = self.parent()
             parent.api.content.remove(self.api)
-            parent.removeChild(self)
+            self.treeWidget().remove_containers(self.api)
+            parent.remove_child_view(self)
 
     def _handle_add_manual_code(self):
         """ Slot to handle the creation of manual code. """
@@ -763,9 +991,9 @@ class SipFileView(ContainerView):
         dialog = ManualCodeDialog(manual_code, "Add Manual Code", self.shell)
 
         if dialog.update():
-            CodeView(manual_code, self.shell, self, after=self)
-
             self.api.content.insert(0, manual_code)
+            self.treeWidget().add_containers(self.api, manual_code)
+            self.api_add(manual_code)
             self.shell.dirty = True
 
     def _exportedHeaderCodeSlot(self):
@@ -917,6 +1145,8 @@ class SipFileView(ContainerView):
     def _setIgnoredVisibility(self, visible):
         """ Set the visibility of all ignored scope elements. """
 
+        self.ignored_visible = visible
+
         it = QTreeWidgetItemIterator(self)
         itm = it.value()
 
@@ -940,9 +1170,6 @@ class ArgumentView(APIView):
 
         self.draw_name()
 
-        # Stash this so that an argument can re-draw itself.
-        argument._view = self
-
     def draw_name(self):
         """ Draw the name column. """
 
@@ -986,12 +1213,27 @@ class CodeView(ContainerView):
         self.draw_versions()
 
         if code.status == 'ignored':
-            self.setHidden(True)
+            view = self.parent()
+            while not isinstance(view, SipFileView):
+                view = view.parent()
+
+            self.setHidden(not view.ignored_visible)
+
+    def child_apis(self):
+        """ Return the sequence of child APIs. """
+
+        if hasattr(self.api, 'args'):
+            return self.api.args
+
+        return super().child_apis()
+
+    def get_child_factory(self):
+        """ Return the callable that will return a child instance. """
+
+        if hasattr(self.api, 'args'):
+            return ArgumentView
 
-        # Create any children.
-        if hasattr(code, 'args'):
-            for arg in code.args:
-                ArgumentView(arg, self.shell, self)
+        return super().get_child_factory()
 
     def draw_name(self):
         """ Update the item's name. """
@@ -1009,28 +1251,6 @@ class CodeView(ContainerView):
 
         self.setText(ApiEditor.ACCESS, access)
 
-    def _has_unnamed_args(self):
-        """ Returns ``True`` if the code has unnamed arguments. """
-
-        # These types don't use named arguments.
-        if isinstance(self.api, (OperatorMethod, OperatorCast, OperatorFunction)):
-            return False
-
-        # Ignore private items.
-        try:
-            private = (self.api.access == 'private')
-        except AttributeError:
-            private = False
-
-        if private:
-            return False
-
-        for arg in self.api.args:
-            if arg.unnamed and arg.default != '':
-                return True
-
-        return False
-
     def draw_status(self):
         """ Update the item's status. """
 
@@ -1056,7 +1276,7 @@ class CodeView(ContainerView):
         if text:
             status.append(text)
 
-        if s != 'ignored' and hasattr(self.api, 'args') and self._has_unnamed_args():
+        if s != 'ignored' and hasattr(self.api, 'args') and _has_unnamed_args(self.api):
             status.append("Unnamed arguments")
             expand = True
 
@@ -1076,7 +1296,7 @@ class CodeView(ContainerView):
         """ Update the item's versions. """
 
         self.setText(ApiEditor.VERSIONS,
-                adapt(self.api, Tagged).versions_as_str())
+                adapt(self.api, Tagged).versions_as_str(self.api))
 
     def get_menu(self, siblings):
         """ Return the list of context menu options. """
@@ -1410,9 +1630,13 @@ class CodeView(ContainerView):
         for arg in self.api.args:
             if arg.unnamed and arg.default != '':
                 arg.unnamed = False
-                arg._view.draw_name()
                 updated = True
 
+                # The view of the argument may not have been created yet.
+                arg_view = self.treeWidget().get_view(arg)
+                if arg_view is not None:
+                    arg_view.draw_name()
+
         if updated:
             self.draw_name()
             self.draw_status()
@@ -1450,6 +1674,7 @@ class CodeView(ContainerView):
             parent_content = self.parent().api.content
             parent_content.insert(parent_content.index(self.api) + 1,
                     manual_code)
+            self.treeWidget().add_containers(self.parent().api, manual_code)
             self.shell.dirty = True
 
     def _handle_modify_manual_code(self):
@@ -1493,10 +1718,12 @@ class CodeView(ContainerView):
             self.shell.dirty = True
 
             parent = self.parent()
+            editor = self.treeWidget()
 
             for target in self._targets:
                 parent.api.content.remove(target.api)
-                parent.removeChild(target)
+                editor.remove_containers(target.api)
+                parent.remove_child_view(target)
 
     def _accessCodeSlot(self):
         """ Slot to handle %AccessCode. """
@@ -1896,7 +2123,7 @@ class CodeView(ContainerView):
             # Apply the version range to all targets.
             for view in self._targets:
                 if view.api is not self.api:
-                    view.api.versions = list(self.api.versions)
+                    view.api.versions = self.api.versions
                     view.draw_versions()
 
             self.shell.dirty = True
@@ -2071,3 +2298,62 @@ class CodeView(ContainerView):
 
                 # FIXME: Observe the access attribute.
                 view._draw_access()
+
+
+def _contains_attention(api):
+    """ Returns ``True`` if any descendant of an API needs the user's
+    attention.
+    """
+
+    # The contents of ignored code are never revealed.
+    if getattr(api, 'status', '') == 'ignored':
+        return False
+
+    for code in getattr(api, 'content', ()):
+        if _needs_revealing(code):
+            return True
+
+    return False
+
+
+def _has_unnamed_args(code):
+    """ Returns ``True`` if some code has unnamed arguments. """
+
+    # These types don't use named arguments.
+    if isinstance(code, (OperatorMethod, OperatorCast, OperatorFunction)):
+        return False
+
+    # Ignore private items.
+    try:
+        private = (code.access == 'private')
+    except AttributeError:
+        private = False
+
+    if private:
+        return False
+
+    for arg in code.args:
+        if arg.unnamed and arg.default != '':
+            return True
+
+    return False
+
+
+def _needs_attention(api):
+    """ Returns ``True`` if an API needs the user's attention. """
+
+    status = getattr(api, 'status', '')
+
+    if status in ('removed', 'todo', 'unknown'):
+        return True
+
+    return (status != 'ignored' and hasattr(api, 'args') and
+            _has_unnamed_args(api))
+
+
+def _needs_revealing(api):
+    """ Returns ``True`` if an API, or any of its descendants, needs the
+    user's attention.
+    """
+
+    return _needs_attention(api) or _contains_attention(api)
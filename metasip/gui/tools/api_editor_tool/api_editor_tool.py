@@ -48,7 +48,9 @@ class ApiEditorTool(ShellTool):
     def event(self, event_type, event_arg):
         """ Reimplemented to handle project-specific events. """
 
-        if event_type is EventType.API_STATUS:
+        if event_type is EventType.API_CHANGES:
+            self._api_editor.api_changes(event_arg)
+        elif event_type is EventType.API_STATUS:
             self._api_editor.api_status(event_arg)
         elif event_type is EventType.API_VERSIONS:
             self._api_editor.api_versions(event_arg)
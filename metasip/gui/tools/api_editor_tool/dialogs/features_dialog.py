@@ -5,6 +5,8 @@
 
 from PyQt6.QtWidgets import QComboBox, QGridLayout, QLabel
 
+from .....helpers import interned_tags
+
 from ....helpers import BaseDialog
 
 
@@ -60,6 +62,6 @@ class FeaturesDialog(BaseDialog):
             elif index == 1:
                 features.append(feature)
 
-        self.model.features = features
+        self.model.features = interned_tags(features)
 
         return True
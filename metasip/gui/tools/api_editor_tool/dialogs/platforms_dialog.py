@@ -5,6 +5,8 @@
 
 from PyQt6.QtWidgets import QCheckBox, QDialog
 
+from .....helpers import interned_tags
+
 from ....helpers import BaseDialog
 
 
@@ -39,6 +41,6 @@ class PlatformsDialog(BaseDialog):
             if check_box.isChecked():
                 platforms.append(platform)
 
-        self.model.platforms = platforms
+        self.model.platforms = interned_tags(platforms)
 
         return True
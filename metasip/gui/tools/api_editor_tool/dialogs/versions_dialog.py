@@ -5,7 +5,7 @@
 
 from PyQt6.QtWidgets import QComboBox, QFormLayout
 
-from .....models import VersionRange
+from .....helpers import interned_version_range, interned_version_ranges
 
 from ....helpers import BaseDialog
 
@@ -81,6 +81,7 @@ class VersionsDialog(BaseDialog):
         start_version = start_combo_box.itemData(start_combo_box.currentIndex())
         end_version = end_combo_box.itemData(end_combo_box.currentIndex())
 
-        self.model.versions = [VersionRange(startversion=start_version, endversion=end_version)]
+        self.model.versions = interned_version_ranges(
+                [interned_version_range(start_version, end_version)])
 
         return True
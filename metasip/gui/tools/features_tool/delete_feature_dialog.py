@@ -5,6 +5,8 @@
 
 from PyQt6.QtWidgets import QCheckBox, QComboBox
 
+from ....helpers import interned_tags
+
 from ...helpers import BaseDialog
 from ...shell import EventType
 
@@ -71,13 +73,15 @@ class DeleteFeatureDialog(BaseDialog):
             else:
                 # Note that we deal with a feature appearing multiple times,
                 # even though that is probably a user bug.
-                for f in remove_features:
-                    api_item.features.remove(f)
-
-        for api_item, container_item in remove_items:
-            container_item.content.remove(api_item)
-            self.shell.notify(EventType.CONTAINER_API_DELETE,
-                    (container_item, api_item))
+                api_item.features = interned_tags(
+                        [f for f in api_item.features
+                                if f not in remove_features])
+
+        with self.shell.batched_updates():
+            for api_item, container_item in remove_items:
+                container_item.content.remove(api_item)
+                self.shell.notify(EventType.CONTAINER_API_DELETE,
+                        (container_item, api_item))
 
         # Delete from the project's list.
         if feature in project.externalfeatures:
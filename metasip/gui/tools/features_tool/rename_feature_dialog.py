@@ -5,6 +5,8 @@
 
 from PyQt6.QtWidgets import QComboBox, QFormLayout, QLineEdit
 
+from ....helpers import interned_tags
+
 from ...helpers import BaseDialog
 from ...shell import EventType
 
@@ -46,12 +48,17 @@ class RenameFeatureDialog(BaseDialog):
 
         # Rename in each API item it appears.
         for api_item, _ in tagged_items(project):
-            for i, f in enumerate(api_item.features):
+            # The tags are shared so they are replaced.
+            features = list(api_item.features)
+
+            for i, f in enumerate(features):
                 if f[0] == '!':
                     if f[1:] == old_name:
-                        api_item.features[i] = '!' + new_name
+                        features[i] = '!' + new_name
                 elif f == old_name:
-                    api_item.features[i] = new_name
+                    features[i] = new_name
+
+            api_item.features = interned_tags(features)
 
         # Rename in the project's list.
         if old_name in project.externalfeatures:
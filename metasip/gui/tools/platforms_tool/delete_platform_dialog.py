@@ -5,6 +5,8 @@
 
 from PyQt6.QtWidgets import QCheckBox, QComboBox
 
+from ....helpers import interned_tags
+
 from ...helpers import BaseDialog
 from ...shell import EventType
 
@@ -71,13 +73,15 @@ class DeletePlatformDialog(BaseDialog):
             else:
                 # Note that we deal with a platform appearing multiple times,
                 # even though that is probably a user bug.
-                for p in remove_platforms:
-                    api_item.platforms.remove(p)
-
-        for api_item, container_item in remove_items:
-            container_item.content.remove(api_item)
-            self.shell.notify(EventType.CONTAINER_API_DELETE,
-                    (container_item, api_item))
+                api_item.platforms = interned_tags(
+                        [p for p in api_item.platforms
+                                if p not in remove_platforms])
+
+        with self.shell.batched_updates():
+            for api_item, container_item in remove_items:
+                container_item.content.remove(api_item)
+                self.shell.notify(EventType.CONTAINER_API_DELETE,
+                        (container_item, api_item))
 
         # Delete from the project's list.
         project.platforms.remove(platform)
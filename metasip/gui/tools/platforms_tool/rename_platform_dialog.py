@@ -5,6 +5,8 @@
 
 from PyQt6.QtWidgets import QComboBox, QFormLayout, QLineEdit
 
+from ....helpers import interned_tags
+
 from ...helpers import BaseDialog
 from ...shell import EventType
 
@@ -46,12 +48,17 @@ class RenamePlatformDialog(BaseDialog):
 
         # Rename in each API item it appears.
         for api_item, _ in tagged_items(project):
-            for i, p in enumerate(api_item.platforms):
+            # The tags are shared so they are replaced.
+            platforms = list(api_item.platforms)
+
+            for i, p in enumerate(platforms):
                 if p[0] == '!':
                     if p[1:] == old_name:
-                        api_item.platforms[i] = '!' + new_name
+                        platforms[i] = '!' + new_name
                 elif p == old_name:
-                    api_item.platforms[i] = new_name
+                    platforms[i] = new_name
+
+            api_item.platforms = interned_tags(platforms)
 
         # Rename in the project's list.
         project.platforms[project.platforms.index(old_name)] = new_name
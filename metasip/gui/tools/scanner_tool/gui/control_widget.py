@@ -3,21 +3,20 @@
 # Copyright (c) 2025 Phil Thompson <phil@riverbankcomputing.com>
 
 
-import glob
-import hashlib
 import os
 
+from PyQt6.QtCore import QStandardPaths, Qt
 from PyQt6.QtWidgets import (QApplication, QCheckBox, QComboBox, QFileDialog,
         QFormLayout, QGridLayout, QGroupBox, QHBoxLayout, QInputDialog, QLabel,
-        QLineEdit, QMessageBox, QPushButton, QStyle, QTabWidget, QToolButton,
-        QVBoxLayout, QWidget)
+        QLineEdit, QMessageBox, QProgressDialog, QPushButton, QSpinBox, QStyle,
+        QTabWidget, QToolButton, QVBoxLayout, QWidget)
 
+from .....exceptions import UserException
 from .....helpers import (get_platform_name, get_supported_platforms,
-        header_directory_platform, VersionMap)
-from .....models import (Callable, CodeContainer, Constructor, Enum,
-        HeaderDirectory, HeaderFile, HeaderFileVersion, ManualCode, Platform,
-        SipFile, VersionRange)
-from .....models.adapters import adapt
+        header_directory_platform)
+from .....models import HeaderDirectory, HeaderFileVersion, Platform
+from .....scanner import (AbstractScannerUi, CastXMLCache, parse_header_file,
+        parse_header_files, scan_header_directory)
 
 from ....helpers import warning
 from ....shell import EventType
@@ -37,6 +36,13 @@ class ControlWidget(QWidget):
         self._header_directory = None
         self._header_file = None
 
+        # castxml output is cached between sessions.
+        self._castxml_cache = CastXMLCache(
+                os.path.join(
+                        QStandardPaths.writableLocation(
+                                QStandardPaths.StandardLocation.CacheLocation),
+                        'castxml'))
+
         layout = QVBoxLayout()
         self.setLayout(layout)
 
@@ -60,6 +66,9 @@ class ControlWidget(QWidget):
                 clicked=self._handle_browse_source_directory)
         h_box.addWidget(button)
 
+        self._jobs = QSpinBox(minimum=1, maximum=256, value=os.cpu_count())
+        form.addRow("Concurrent jobs", self._jobs)
+
         group_box = QGroupBox("Header Directory")
         layout.addWidget(group_box)
 
@@ -148,6 +157,25 @@ class ControlWidget(QWidget):
                 clicked=self._handle_update_header_file_properties)
         grid.addWidget(self._update_file_button, 0, 1)
 
+        h_box = QHBoxLayout()
+        layout.addLayout(h_box)
+
+        self._parse_all_button = QPushButton("Parse all",
+                clicked=self._handle_parse_all_header_files)
+        h_box.addWidget(self._parse_all_button)
+
+        self._parse_directories = QCheckBox(
+                "Parse each header directory as a whole?",
+                toolTip="Run castxml once for all the header files of a "
+                        "header directory.  This is much faster but a "
+                        "declaration that is repeated in several header "
+                        "files will only appear in one of them.  A header "
+                        "file that appears to have lost a declaration that it "
+                        "had previously is parsed again separately.  A "
+                        "header file being parsed for the first time is "
+                        "always parsed separately.")
+        h_box.addWidget(self._parse_directories)
+
         button = QPushButton("Reset workflow",
                 clicked=self._handle_reset_workflow)
         layout.addWidget(button)
@@ -174,10 +202,20 @@ class ControlWidget(QWidget):
         if state is not None:
             self._source_directory.setText(state)
 
+        state = settings.value('jobs')
+        if state is not None:
+            self._jobs.setValue(int(state))
+
+        self._parse_directories.setChecked(
+                settings.value('parse_directories', False, type=bool))
+
     def save_state(self, settings):
         """ Save the widget's state. """
 
         settings.setValue('source_directory', self._source_directory.text())
+        settings.setValue('jobs', self._jobs.value())
+        settings.setValue('parse_directories',
+                self._parse_directories.isChecked())
 
     def set_header_file(self, header_file, header_directory, showing_ignored):
         """ Set the current header file. """
@@ -283,6 +321,10 @@ class ControlWidget(QWidget):
 
         self._parse_button.setEnabled(enabled)
 
+        # The 'Parse all' button is enabled if there is a source directory.
+        self._parse_all_button.setEnabled(
+                self._source_directory.text() != '')
+
     @staticmethod
     def _enable_layout(layout, enabled):
         """ Enable or disable all the items in a layout. """
@@ -334,64 +376,56 @@ class ControlWidget(QWidget):
                     working_version)
             self._tool.shell.dirty = True
 
-    def _handle_parse_header_file(self):
-        """ Handle the button to parse a header file. """
-
-        from ..cast_xml import CastXMLParser
-
-        project = self._tool.shell.project
-        header_directory = self._header_directory
-        header_file = self._header_file
-        source_directory = self._source_directory.text()
-
-        parser = CastXMLParser()
+    def _handle_parse_all_header_files(self):
+        """ Handle the button to parse all header files that need parsing. """
 
-        header_directory_name = os.path.dirname(
-                header_directory_platform(header_directory).inputdirpattern)
-        name = os.path.join(source_directory, header_directory_name,
-                header_file.name)
+        shell = self._tool.shell
 
-        if not os.access(name, os.R_OK):
-            warning("Parse", f"Unable to read '{name}'.", parent=self)
+        # The rest of the GUI is only updated once everything has been merged.
+        try:
+            with shell.batched_updates():
+                parsed = parse_header_files(shell.project,
+                        shell.project.headers, self._source_directory.text(),
+                        self._working_version.currentText(),
+                        _ScannerUi(self._tool, parent=self),
+                        jobs=self._jobs.value(), cache=self._castxml_cache,
+                        whole_directories=self._parse_directories.isChecked())
+        except UserException as e:
+            warning("Parse all", e.text, detail=e.detail, parent=self)
             return
 
-        _, name, _ = self._read_header(name)
+        # A cancelled parse may have merged some header files.
+        if parsed is None:
+            shell.dirty = True
+            return
 
-        parsed_header_file = parser.parse(project, source_directory,
-                header_directory, header_file, name, self._tool.shell.log)
+        changed, diagnostics = parsed
 
-        if parsed_header_file is None:
-            warning("Parse", parser.diagnostic, parent=self)
-            return
+        if changed:
+            shell.dirty = True
 
-        # Find the corresponding .sip file creating it if is a new header file.
-        # FIXME: Assuming we ultimately want to be able to create a complete
-        #        project without parsing .h files then we will need the ability
-        #        (in the main editor) to manually create a SipFile instance.
-        for module in project.modules:
-            if module.name == header_file.module:
-                for sip_file in module.content:
-                    if sip_file.name == header_file.name:
-                        break
-                else:
-                    sip_file = SipFile(name=header_file.name)
-                    module.content.append(sip_file)
-                    self._tool.shell.notify(EventType.CONTAINER_API_ADD,
-                            (module, sip_file))
+        if diagnostics:
+            warning("Parse all",
+                    f"{len(diagnostics)} header file(s) could not be parsed.",
+                    detail='\n'.join(diagnostics), parent=self)
 
-                self._merge_code(sip_file, parsed_header_file)
-                break
+    def _handle_parse_header_file(self):
+        """ Handle the button to parse a header file. """
 
-        # The file version no longer needs parsing.
-        working_version = self._working_version.currentText()
+        shell = self._tool.shell
 
-        for header_file_version in header_file.versions:
-            if header_file_version.version == working_version:
-                header_file_version.parse = False
-                self._tool.header_file_status(header_file)
-                break
+        try:
+            with shell.batched_updates():
+                parse_header_file(shell.project, self._header_directory,
+                        self._header_file, self._source_directory.text(),
+                        self._working_version.currentText(),
+                        _ScannerUi(self._tool, parent=self),
+                        cache=self._castxml_cache)
+        except UserException as e:
+            warning("Parse", e.text, detail=e.detail, parent=self)
+            return
 
-        self._tool.shell.dirty = True
+        shell.dirty = True
 
     def _handle_reset_workflow(self):
         """ Handle the button to reset the workflow. """
@@ -412,70 +446,22 @@ class ControlWidget(QWidget):
         """ Handle the button to scan a header directory. """
 
         shell = self._tool.shell
-        project = shell.project
-        header_directory = self._header_directory
-        platform = header_directory_platform(header_directory)
-
-        source_directory = os.path.abspath(self._source_directory.text())
-        source_pattern = os.path.join(source_directory,
-                platform.inputdirpattern)
-
-        header_directory_path = os.path.dirname(source_pattern)
-        shell.log(f"Scanning header directory '{header_directory_path}'")
-
-        # Save the files that were in the directory.
-        saved = list(header_directory.content)
 
-        for header_path in glob.iglob(source_pattern):
-            if not os.path.isfile(header_path):
-                continue
-
-            if os.access(header_path, os.R_OK):
-                header_file = self._scan_header_file(header_path)
-
-                for saved_header_file in saved:
-                    if saved_header_file is header_file:
-                        saved.remove(saved_header_file)
-                        break
-                else:
-                    # It's a new header file.
-                    header_directory.content.append(header_file)
-                    shell.dirty = True
-
-                shell.log(f"Scanned '{header_path}'")
-            else:
-                shell.log(f"Skipping unreadable header file '{header_path}'")
-
-        # Anything left in the saved list has gone missing or was already
-        # missing.
-        working_version = self._working_version.currentText()
+        # The rest of the GUI is only updated once the scan has finished.
+        try:
+            with shell.batched_updates():
+                changed = scan_header_directory(shell.project,
+                        self._header_directory, self._source_directory.text(),
+                        self._working_version.currentText(),
+                        _ScannerUi(self._tool, parent=self),
+                        jobs=self._jobs.value(), use_cache=True,
+                        use_threads=True)
+        except UserException as e:
+            warning("Scan", e.text, detail=e.detail, parent=self)
+            return
 
-        for header_file in saved:
-            for header_file_version in header_file.versions:
-                if header_file_version.version == working_version:
-                    header_file.versions.remove(header_file_version)
-
-                    # If there is only one version left then remove the file
-                    # itself.
-                    if len(header_file.versions) == 0:
-                        header_directory.content.remove(header_file)
-                        self._remove_from_module(header_file)
-                    else:
-                        # FIXME: Go through the corresponding SipFile and make
-                        # sure that all top-level APIs have an upper version
-                        # set.
-                        pass
-
-                    shell.log(f"'{header_file.name}' is no longer in the header directory")
-
-                    self._tool.header_file_removed(header_file)
-                    shell.dirty = True
-                    break
-
-        # This version no longer needs scanning.
-        if working_version in header_directory.scan:
-            header_directory.scan.remove(working_version)
-            self._tool.header_directory_status(header_directory)
+        # A cancelled scan may have changed some header files.
+        if changed is None or changed:
             shell.dirty = True
 
     def _handle_showing_ignored(self, state):
@@ -533,371 +519,161 @@ class ControlWidget(QWidget):
         self._working_version.addItems(self._tool.shell.project.versions)
         self._working_version.blockSignals(blocked)
 
-    def _merge_code(self, dst_code, src_code):
-        """ Merge source code into destination code. """
-
-        working_version = self._working_version.currentText()
-
-        # Go though each existing code API.
-        for dst_api in list(dst_code.content):
-            # Manual code is always retained.
-            if isinstance(dst_api, ManualCode):
-                continue
-
-            # Go through each potentially new code API.
-            for src_api in list(src_code):
-                if adapt(dst_api) == adapt(src_api):
-                    # Make sure the versions include the working version.
-                    if working_version != '':
-                        self._add_working_version(dst_api)
-
-                    # Discard the new code API.
-                    src_code.remove(src_api)
-
-                    # Merge any child code.
-                    if isinstance(dst_api, (CodeContainer, Enum)):
-                        self._merge_code(dst_api, src_api.content)
-
-                    break
-            else:
-                # The existing one doesn't exist in the working version.
-                if working_version == '':
-                    # If it is ignored then forget about it because there are
-                    # no other versions that might refer to it.
-                    if dst_api.status == 'ignored':
-                        dst_code.content.remove(dst_api)
-                        self._tool.shell.notify(
-                                EventType.CONTAINER_API_DELETE,
-                                (dst_code, dst_api))
-                    else:
-                        dst_api.status = 'removed'
-                        self._tool.shell.notify(EventType.API_STATUS, dst_api)
-                else:
-                    version_status = self._remove_working_version(dst_api)
-                    if version_status == 'no_longer_working':
-                        # It's removal needs checking.
-                        if dst_api.status == '':
-                            dst_api.status = 'unknown'
-                            self._tool.shell.notify(EventType.API_STATUS,
-                                    dst_api)
-                    elif version_status == 'no_longer_any':
-                        # Forget about it because there are no other versions
-                        # that refer to it.
-                        dst_code.content.remove(dst_api)
-                        self._tool.shell.notify(
-                                EventType.CONTAINER_API_DELETE,
-                                (dst_code, dst_api))
-
-        # Anything left in the source code is new.
-
-        if working_version == '':
-            startversion = endversion = ''
-        else:
-            versions = self._tool.shell.project.versions
-            working_idx = versions.index(working_version)
-
-            # If the working version is the first then assume that the new API
-            # will appear in earlier versions, otherwise it is restricted to
-            # this version.
-            startversion = '' if working_idx == 0 else working_version
-
-            # If the working version is the latest then assume that the new API
-            # will appear in later versions, otherwise it is restricted to this
-            # version.
-            try:
-                endversion = versions[working_idx + 1]
-            except IndexError:
-                endversion = ''
-
-        for src_api in src_code:
-            if startversion != '' or endversion != '':
-                src_api.versions.append(
-                        VersionRange(startversion=startversion,
-                                endversion=endversion))
-                self._tool.shell.notify(EventType.API_VERSIONS, src_api)
-
-            # Try and place the new API with any similar one.
-            pos = -1
-            for idx, code in enumerate(dst_code.content):
-                if type(code) is not type(src_api):
-                    continue
-
-                if isinstance(src_api, Constructor):
-                    pos = idx
-                    break
-
-                if isinstance(src_api, Callable) and code.name == src_api.name:
-                    pos = idx
-                    break
-
-            if pos >= 0:
-                dst_code.content.insert(pos, src_api)
-            else:
-                dst_code.content.append(src_api)
-
-            self._tool.shell.notify(EventType.CONTAINER_API_ADD,
-                    (dst_code, src_api))
-
-    def _add_working_version(self, api):
-        """ Add the working version to an API's version ranges. """
-
-        # There is only something to do if the API is currently versioned.
-        if len(api.versions) != 0:
-            project = self._tool.shell.project
-
-            # Add the working version.
-            vmap = VersionMap(project, api.versions)
-            vmap[self._working_version.currentText()] = True
-            api.versions = vmap.as_version_ranges()
-
-            self._tool.shell.notify(EventType.API_VERSIONS, api)
-
-    def _remove_working_version(self, api):
-        """ Remove the working version from an API's version ranges.  Returns
-        'wasnt_working' if the API wasn't in the working version,
-        'no_longer_working' if the API is no longer in the working version and
-        'no_longer_any' if the API is no longer in any version.
-        """
-
-        project = self._tool.shell.project
-
-        # Construct the existing list of version ranges to a version map.
-        vmap = VersionMap(project, api.versions)
-
-        # Update the version map appropriately using the working version.
-        # First take a shortcut to see if anything has changed.
-        working_version = self._working_version.currentText()
+    def _set_module_selector(self, ignored):
+        """ Set the module selector for a header file. """
 
-        if not vmap[working_version]:
-            return 'wasnt_working'
+        self._module.clear()
 
-        vmap[working_version] = False
+        if not ignored:
+            for module in self._tool.shell.project.modules:
+                self._module.addItem(module.name, module)
 
-        # Convert the version map back to a list of version ranges.
-        versions = vmap.as_version_ranges()
+            self._module.model().sort(0)
 
-        if versions is None:
-            return 'no_longer_any'
+            # See if we have just un-ignored the file.
+            module_name = self._header_file.module
 
-        api.versions = versions
-        self._tool.shell.notify(EventType.API_VERSIONS, api)
+            if module_name == '':
+                # If there is a module with the same name of the header
+                # directory then assume that's where the file is going.
+                for module in self._tool.shell.project.modules:
+                    if module.name == self._header_directory.name:
+                        module_name = module.name
+                        break
 
-        return 'no_longer_working'
+            self._module.setCurrentText(module_name)
 
-    @classmethod
-    def _read_header(cls, name):
-        """ Read the contents of a header file.  Handle the special case of the
-        file just being a #include redirect to another header file.
+    def _get_platform_widgets(self):
+        """ A generator that returns a 3-tuple of the name and each field
+        widget for each supported platform.
         """
 
-        contents, actual_name, encoding = cls._read_single_header(name)
-        while actual_name != name:
-            name = actual_name
-            contents, actual_name, encoding = cls._read_single_header(name)
+        for i in range(self._platforms.count()):
+            platform_name = self._platforms.tabText(i)
 
-        return contents, actual_name, encoding
+            page = self._platforms.widget(i)
+            inputdirpattern = page.findChild(QLineEdit, 'inputdirpattern')
+            parserargs = page.findChild(QLineEdit, 'parserargs')
 
-    @staticmethod
-    def _read_single_header(name):
-        """ Read the contents of a single header file. """
-
-        with open(name, 'r') as f:
-            contents = f.read()
-            encoding = f.encoding
-
-        lines = contents.strip().split('\n')
-        if len(lines) == 1:
-            words = lines[0].split()
-            if len(words) == 2 and words[0] == '#include':
-                include_name = words[1]
-                if include_name.startswith('".') and include_name.endswith('"'):
-                    name = os.path.dirname(name) + '/' + include_name[1:-1]
-
-        return contents, name, encoding
-
-    def _remove_from_module(self, header_file):
-        """ Handle the removal of a header file from the project. """
-
-        # Find the corresponding .sip file.
-        for mod in self.current_project.modules:
-            if mod.name == header_file.module:
-                for sip_file in mod.content:
-                    if sip_file.name == header_file.name:
-                        for code in list(sip_file.content):
-                            if code.status == 'ignored':
-                                # Remove any ignored API elements.
-                                sip_file.content.remove(code)
-                                self._tool.shell.notify(
-                                        EventType.CONTAINER_API_DELETE,
-                                        (sip_file, code))
-                            else:
-                                # Mark any non-ignored API elements so that the
-                                # user can decide what to do.
-                                code.status = 'removed'
-                                self._tool.shell.notify(EventType.API_STATUS,
-                                        code)
-
-    def _scan_header_file(self, header_path):
-        """ Scan a header file and return the header file instance. """
+            yield (platform_name, inputdirpattern, parserargs)
 
-        shell = self._tool.shell
 
-        # Calculate the MD5 signature ignoring any comments.  Note that nested
-        # C style comments aren't handled very well.
-        m = hashlib.md5()
+class _ScannerUi(AbstractScannerUi):
+    """ The scanner UI that updates the rest of the GUI. """
 
-        src, _, encoding = self._read_header(header_path)
+    def __init__(self, tool, parent):
+        """ Initialise the UI. """
 
-        lnr = 1
-        state = 'copy'
-        copy = ''
-        idx = 0
+        self._tool = tool
+        self._parent = parent
+        self._progress = None
 
-        for ch in src:
-            # Get the previous character.
-            if idx > 0:
-                prev = src[idx - 1]
-            else:
-                prev = ''
+    def api_added(self, container, api):
+        """ Called when an API has been added to its container. """
 
-            idx += 1
+        self._tool.shell.notify(EventType.CONTAINER_API_ADD, (container, api))
 
-            # Line numbers must be accurate.
-            if ch == '\n':
-                lnr += 1
+    def api_removed(self, container, api):
+        """ Called when an API has been removed from its container. """
 
-            # Handle the end of a C style comment.
-            if state == 'ccmnt':
-                if ch == '/' and prev == '*':
-                    state = 'copy'
+        self._tool.shell.notify(EventType.CONTAINER_API_DELETE,
+                (container, api))
 
-                continue
+    def api_status_changed(self, api):
+        """ Called when the workflow status of an API has changed. """
 
-            # Handle the end of a C++ style comment.
-            if state == 'cppcmnt':
-                if ch == '\n':
-                    state = 'copy'
+        self._tool.shell.notify(EventType.API_STATUS, api)
 
-                continue
+    def api_versions_changed(self, api):
+        """ Called when the versions of an API have changed. """
 
-            # We must be in the copy state.
+        self._tool.shell.notify(EventType.API_VERSIONS, api)
 
-            if ch == '*' and prev == '/':
-                # The start of a C style comment.
-                state = 'ccmnt'
-                continue
+    def header_directory_status(self, header_directory):
+        """ Called when the status of a header directory has changed. """
 
-            if ch == '/' and prev == '/':
-                # The start of a C++ style comment.
-                state = 'cppcmnt'
-                continue
+        self._tool.header_directory_status(header_directory)
 
-            # At this point we know the previous character wasn't part of a
-            # comment.
-            if prev:
-                m.update(prev.encode(encoding))
+    def header_file_added(self, header_file, header_directory,
+            working_version):
+        """ Called when a header file has been added to a header directory.
+        """
 
-        # Note that we didn't add the last character, but it would normally be
-        # a newline.
-        md5 = m.hexdigest()
+        self._tool.header_file_added(header_file, header_directory,
+                working_version)
 
-        # See if we already know about the file.
-        header_directory = self._header_directory
-        header_file_name = os.path.basename(header_path)
+    def header_file_removed(self, header_file):
+        """ Called when a header file has been removed from a header
+        directory.
+        """
 
-        for header_file in header_directory.content:
-            if header_file.name == header_file_name:
-                new_header_file = False
-                break
-        else:
-            # It's a new file.
-            header_file = HeaderFile(name=header_file_name)
-            new_header_file = True
+        self._tool.header_file_removed(header_file)
 
-        # See if we already know about this version.
-        working_version = self._working_version.currentText()
+    def header_file_status(self, header_file):
+        """ Called when the status of a header file has changed. """
 
-        for header_file_version in header_file.versions:
-            if header_file_version.version == working_version:
-                # See if the version's contents have changed.
-                if header_file_version.md5 != md5:
-                    header_file_version.md5 = md5
-                    header_file_version.parse = True
-                    self._tool.header_file_status(header_file)
-                    shell.dirty = True
+        self._tool.header_file_status(header_file)
 
-                break
-        else:
-            # It's a new version.
-            header_file_version = HeaderFileVersion(md5=md5, parse=True,
-                    version=working_version)
-            header_file.versions.append(header_file_version)
-
-            # Check that the project has versions.
-            if len(shell.project.versions) != 0:
-                # Find the immediately preceding version if there is one.
-                versions_sorted = sorted(header_file.versions,
-                        key=lambda v: shell.project.versions.index(v.version))
-
-                prev_md5 = ''
-                prev_parse = True
-                for hfv in versions_sorted:
-                    if hfv.version == working_version:
-                        break
+    def log(self, message):
+        """ Called to log a progress message. """
 
-                    prev_md5 = hfv.md5
-                    prev_parse = hfv.parse
+        self._tool.shell.log(message)
 
-                if prev_md5 == md5:
-                    header_file_version.parse = prev_parse
-            else:
-                # It must be a new file of an unversioned project.
-                header_file_version.parse = True
+    def parse_starting(self, nr_steps):
+        """ Called to initialise the UI prior to parsing header files that will
+        take a specific number of steps.
+        """
 
-            if new_header_file:
-                self._tool.header_file_added(header_file, header_directory,
-                        working_version)
-            else:
-                self._tool.header_file_status(header_file)
+        self._progress = QProgressDialog("Parsing header files...", "Cancel",
+                0, nr_steps, self._parent)
+        self._progress.setWindowTitle("Parse all")
 
-            shell.dirty = True
+        # Events are processed while the project is being changed so the user
+        # must be prevented from doing anything else.
+        self._progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self._progress.setValue(0)
 
-        return header_file
+    def parse_step(self):
+        """ Called to update the UI once the next step of parsing header files
+        has been completed.  Return True if the user didn't cancel.
+        """
 
-    def _set_module_selector(self, ignored):
-        """ Set the module selector for a header file. """
+        self._progress.setValue(self._progress.value() + 1)
+        QApplication.processEvents()
 
-        self._module.clear()
+        return not self._progress.wasCanceled()
 
-        if not ignored:
-            for module in self._tool.shell.project.modules:
-                self._module.addItem(module.name, module)
+    def parse_waiting(self):
+        """ Called periodically while waiting for castxml to parse header
+        files.  Return True if the user didn't cancel.
+        """
 
-            self._module.model().sort(0)
+        QApplication.processEvents()
 
-            # See if we have just un-ignored the file.
-            module_name = self._header_file.module
+        return not self._progress.wasCanceled()
 
-            if module_name == '':
-                # If there is a module with the same name of the header
-                # directory then assume that's where the file is going.
-                for module in self._tool.shell.project.modules:
-                    if module.name == self._header_directory.name:
-                        module_name = module.name
-                        break
+    def scan_starting(self, header_directory, nr_steps):
+        """ Called to initialise the UI prior to scanning a header directory
+        that will take a specific number of steps.
+        """
 
-            self._module.setCurrentText(module_name)
+        self._progress = QProgressDialog(
+                f"Scanning {header_directory.name}...", "Cancel", 0, nr_steps,
+                self._parent)
+        self._progress.setWindowTitle("Scan")
 
-    def _get_platform_widgets(self):
-        """ A generator that returns a 3-tuple of the name and each field
-        widget for each supported platform.
+        # Events are processed while the project is being changed so the user
+        # must be prevented from doing anything else.
+        self._progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self._progress.setValue(0)
+
+    def scan_step(self):
+        """ Called to update the UI once the next step of scanning a header
+        directory has been completed.  Return True if the user didn't cancel.
         """
 
-        for i in range(self._platforms.count()):
-            platform_name = self._platforms.tabText(i)
+        self._progress.setValue(self._progress.value() + 1)
+        QApplication.processEvents()
 
-            page = self._platforms.widget(i)
-            inputdirpattern = page.findChild(QLineEdit, 'inputdirpattern')
-            parserargs = page.findChild(QLineEdit, 'parserargs')
+        return not self._progress.wasCanceled()
 
-            yield (platform_name, inputdirpattern, parserargs)
@@ -3,6 +3,9 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
+from ....helpers import (interned_version_range, interned_version_ranges,
+        versions_changed)
+
 from ...shell import EventType
 
 from ..helpers import tagged_items, validate_identifier, validation_error
@@ -46,47 +49,52 @@ def delete_version(version, shell, *, migrate_items):
         if len(api_item.versions) == 0:
             continue
 
-        remove_ranges = []
+        # The version ranges are shared so the updated ones are new ones.
+        new_ranges = []
 
         for r in api_item.versions:
-            if r.startversion == version:
+            startversion = r.startversion
+            endversion = r.endversion
+
+            if startversion == version:
                 # It now starts with the version after the one we are deleting.
                 # If that is the same as the end version then we delete the API
                 # item.
                 new_start = '' if versions[-1] == version else versions[versions.index(version) + 1]
 
-                if new_start == r.endversion:
+                if new_start == endversion:
                     remove_items.append((api_item, container))
                     break
 
-                r.startversion = new_start
+                startversion = new_start
 
             # If the start version is now what the first version will now be
             # then we clear it.
-            if r.startversion != '' and removing_first_version and r.startversion == versions[1]:
-                r.startversion = ''
+            if startversion != '' and removing_first_version and startversion == versions[1]:
+                startversion = ''
 
-            if r.endversion == version:
+            if endversion == version:
                 if migrate_items:
                     # It now ends with the version after the one we are
                     # deleting.
                     new_end = '' if versions[-1] == version else versions[versions.index(version) + 1]
 
-                    r.endversion = new_end
+                    endversion = new_end
                 else:
                     remove_items.append((api_item, container))
                     break
 
-            if r.startversion == '' and r.endversion == '':
-                remove_ranges.append(r)
+            if startversion != '' or endversion != '':
+                new_ranges.append(
+                        interned_version_range(startversion, endversion))
         else:
-            for r in remove_ranges:
-                api_item.versions.remove(r)
+            api_item.versions = interned_version_ranges(new_ranges)
 
-    for api_item, container_item in remove_items:
-        container_item.content.remove(api_item)
-        shell.notify(EventType.CONTAINER_API_DELETE,
-                (container_item, api_item))
+    with shell.batched_updates():
+        for api_item, container_item in remove_items:
+            container_item.content.remove(api_item)
+            shell.notify(EventType.CONTAINER_API_DELETE,
+                    (container_item, api_item))
 
     # Delete from the header file versions.
     remove_hfile_versions = []
@@ -117,4 +125,5 @@ def delete_version(version, shell, *, migrate_items):
 
     # Delete from the project's list.
     versions.remove(version)
+    versions_changed(project)
     shell.notify(EventType.VERSION_DELETE, version)
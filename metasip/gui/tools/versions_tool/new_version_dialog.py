@@ -5,6 +5,8 @@
 
 from PyQt6.QtWidgets import QComboBox, QFormLayout, QLineEdit
 
+from ....helpers import versions_changed
+
 from ...helpers import BaseDialog
 from ...shell import EventType
 
@@ -83,6 +85,8 @@ class NewVersionDialog(BaseDialog):
 
             project.versions.append(version)
 
+        versions_changed(project)
+
         self.shell.notify(EventType.VERSION_ADD, version)
 
         return True
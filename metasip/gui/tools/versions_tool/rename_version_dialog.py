@@ -5,6 +5,9 @@
 
 from PyQt6.QtWidgets import QComboBox, QFormLayout, QLineEdit
 
+from ....helpers import (interned_version_range, interned_version_ranges,
+        versions_changed)
+
 from ...helpers import BaseDialog
 from ...shell import EventType
 
@@ -45,13 +48,16 @@ class RenameVersionDialog(BaseDialog):
             return False
 
         # Rename in each API item it appears.
-        for api_item, _ in tagged_items(project):
-            for v in api_item.versions:
-                if v.startversion == old_name:
-                    v.startversion = new_name
+        def renamed(version):
+            return new_name if version == old_name else version
 
-                if v.endversion == old_name:
-                    v.endversion = new_name
+        for api_item, _ in tagged_items(project):
+            if api_item.versions:
+                # The version ranges are shared so they are replaced.
+                api_item.versions = interned_version_ranges(
+                        [interned_version_range(renamed(v.startversion),
+                                renamed(v.endversion))
+                                for v in api_item.versions])
 
         # Rename in the header file versions.
         for hdir in project.headers:
@@ -62,6 +68,7 @@ class RenameVersionDialog(BaseDialog):
 
         # Rename in the project's list.
         project.versions[project.versions.index(old_name)] = new_name
+        versions_changed(project)
 
         self.shell.notify(EventType.VERSION_RENAME, (old_name, new_name))
 
@@ -5,5 +5,8 @@
 
 from .header_directory import (get_platform_name, get_supported_platforms,
         header_directory_platform)
-from .version_map import VersionMap
+from .header_md5 import header_md5
+from .interned import (interned_tags, interned_version_range,
+        interned_version_ranges)
+from .version_map import VersionMap, versions_changed
 from .version_range import version_range
@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
+
+
+import codecs
+from functools import lru_cache
+import hashlib
+import re
+
+
+# The start of a C or C++ style comment.
+_COMMENT_START = re.compile(r'/[*/]')
+
+
+def header_md5(src, encoding):
+    """ Return the MD5 signature of the contents of a header file ignoring any
+    comments.  The signature is that calculated by earlier versions which
+    hashed the contents a character at a time, including their quirks, so
+    that existing signatures remain valid.  Specifically nested C style
+    comments aren't handled very well, the '/' ending a C style comment and
+    the newline ending a C++ style comment are included, a '/*/' is a complete
+    C style comment and the last character is never included.
+    """
+
+    # Find the slices of the source that are outside comments.
+    chunks = []
+    start = 0
+    end = len(src) - 1
+
+    while start < end:
+        comment = _COMMENT_START.search(src, start)
+
+        if comment is None:
+            chunks.append(src[start:end])
+            break
+
+        comment_start = comment.start()
+        chunks.append(src[start:comment_start])
+
+        if comment.group() == '/*':
+            # Note that the search includes the '*' of the start.
+            start = src.find('*/', comment_start + 1)
+            if start < 0:
+                break
+
+            # The copy restarts with the '/'.
+            start += 1
+        else:
+            # The copy restarts with the newline.
+            start = src.find('\n', comment_start + 2)
+            if start < 0:
+                break
+
+    m = hashlib.md5()
+
+    if _is_stateless(encoding):
+        m.update(''.join(chunks).encode(encoding))
+    else:
+        # The encoding of each character must be done separately.
+        for chunk in chunks:
+            for ch in chunk:
+                m.update(ch.encode(encoding))
+
+    return m.hexdigest()
+
+
+@lru_cache()
+def _is_stateless(encoding):
+    """ Return True if encoding a string gives the same result as encoding each
+    character separately (which isn't the case if the encoding includes a BOM
+    or shift sequences).
+    """
+
+    name = codecs.lookup(encoding).name
+
+    for probe in ('ab', 'éé'):
+        try:
+            if probe.encode(name) != b''.join(ch.encode(name) for ch in probe):
+                return False
+        except UnicodeError:
+            pass
+
+    return True
@@ -0,0 +1,42 @@
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
+
+
+from ..models import VersionRange
+
+
+# The interned tuples of tags.  A project only has a handful of distinct
+# values so these are never purged.
+_tags = {}
+
+# The interned version ranges and tuples of version ranges.
+_version_ranges = {}
+
+
+def interned_tags(tags):
+    """ Return the interned tuple of a sequence of tags (i.e. features or
+    platforms).
+    """
+
+    tags = tuple(tags)
+
+    return _tags.setdefault(tags, tags)
+
+
+def interned_version_range(startversion='', endversion=''):
+    """ Return the interned version range for a start and end version. """
+
+    version_range = VersionRange(startversion=startversion,
+            endversion=endversion)
+
+    return _version_ranges.setdefault(version_range, version_range)
+
+
+def interned_version_ranges(version_ranges):
+    """ Return the interned tuple of a sequence of version ranges. """
+
+    version_ranges = tuple(
+            _version_ranges.setdefault(vr, vr) for vr in version_ranges)
+
+    return _version_ranges.setdefault(version_ranges, version_ranges)
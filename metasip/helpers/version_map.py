@@ -3,100 +3,212 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
-from ..models import VersionRange
+from .interned import interned_version_range, interned_version_ranges
 
 
 class VersionMap:
     """ This class is a tool for consolidating and normalising ranges of
-    versions.
+    versions.  The map is a bitmask where bit n corresponds to the n'th version
+    of the project.
     """
 
     def __init__(self, project, version_ranges=None):
         """ Return a version map with each entry set to an initial value. """
 
-        self._versions = project.versions
-        self._initialise_map(False)
+        # The index is discarded by versions_changed() whenever the project's
+        # versions are changed.
+        index = project.version_index
+        if index is None:
+            index = project.version_index = _VersionIndex(project.versions)
+
+        self._index = index
+        self._map = 0
 
         if version_ranges is not None:
             self.update_from_version_ranges(version_ranges)
 
+    def __and__(self, other):
+        """ Return the intersection of two version maps. """
+
+        self._check_index(other)
+
+        return self._copy(self._map & other._map)
+
     def __bool__(self):
         """ Return True if the version map is unconditionally True. """
 
-        return all(self._map)
+        return self._map == self._index.all_mask
 
     def __getitem__(self, version):
         """ Return the map value for a version. """
 
-        return self._map[self._versions.index(version)]
+        return bool(self._map & self._index.version_mask(version))
 
-    def __setitem__(self, version, value):
-        """ Set the map value for a version. """
+    def __iand__(self, other):
+        """ Update the version map with the intersection of another. """
 
-        self._map[self._versions.index(version)] = value
+        self._check_index(other)
 
-    def update_from_version_ranges(self, version_ranges):
-        """ Update the version map from a list of version ranges. """
+        self._map &= other._map
 
-        # No version ranges means all versions are valid.
-        if len(version_ranges) == 0:
-            self._initialise_map(True)
-            return
+        return self
 
-        for version_range in version_ranges:
-            if version_range.startversion == '':
-                start_idx = 0
-            else:
-                start_idx = self._versions.index(version_range.startversion)
+    def __ior__(self, other):
+        """ Update the version map with the union of another. """
 
-            if version_range.endversion == '':
-                end_idx = len(self._versions)
-            else:
-                end_idx = self._versions.index(version_range.endversion)
+        self._check_index(other)
+
+        self._map |= other._map
+
+        return self
 
-            for i in range(start_idx, end_idx):
-                self._map[i] = True
+    def __or__(self, other):
+        """ Return the union of two version maps. """
+
+        self._check_index(other)
+
+        return self._copy(self._map | other._map)
+
+    def __setitem__(self, version, value):
+        """ Set the map value for a version. """
+
+        mask = self._index.version_mask(version)
+
+        if value:
+            self._map |= mask
+        else:
+            self._map &= ~mask
+
+    def update_from_version_ranges(self, version_ranges):
+        """ Update the version map from a sequence of version ranges. """
+
+        self._map |= self._index.version_ranges_mask(version_ranges)
 
     def as_version_ranges(self):
-        """ Convert a version map to a list of version ranges.  An empty list
-        means it is unconditionally True, None means it is unconditionally
-        False.
+        """ Convert a version map to an interned tuple of version ranges.  An
+        empty tuple means it is unconditionally True, None means it is
+        unconditionally False.
         """
 
+        index = self._index
+        map = self._map
+
         # See if the item is valid for all versions.
-        if all(self._map):
-            return []
+        if map == index.all_mask:
+            return ()
 
         # See if the item is valid for no versions.
-        for v in self._map:
-            if v:
-                break
-        else:
+        if map == 0:
             return None
 
-        # Construct the new list of version ranges.
+        # Construct the new list of version ranges from each run of set bits.
+        versions = index.versions
         version_ranges = []
-        vrange = None
 
-        for idx, v in enumerate(self._map):
-            if v:
-                # Start a new version range if there isn't one currently.
-                if vrange is None:
-                    vrange = VersionRange()
+        while map != 0:
+            start_idx = (map & -map).bit_length() - 1
+
+            # Find the first clear bit after the start of the run.
+            filled = map | ((1 << start_idx) - 1)
+            end_idx = (~filled & (filled + 1)).bit_length() - 1
+
+            map &= ~((1 << end_idx) - 1)
+
+            startversion = '' if start_idx == 0 else versions[start_idx]
+            endversion = versions[end_idx] if end_idx < len(versions) else ''
+
+            version_ranges.append(
+                    interned_version_range(startversion, endversion))
 
-                    if idx != 0:
-                        vrange.startversion = self._versions[idx]
-            elif vrange is not None:
-                vrange.endversion = self._versions[idx]
-                version_ranges.append(vrange)
-                vrange = None
+        return interned_version_ranges(version_ranges)
 
-        if vrange is not None:
-            version_ranges.append(vrange)
+    def _check_index(self, other):
+        """ Check that another version map was created for the same versions
+        and so can be combined with this one.
+        """
+
+        if self._index is not other._index:
+            raise ValueError(
+                    "version maps created for different versions of a project "
+                    "cannot be combined")
+
+    def _copy(self, map):
+        """ Return a copy of the version map with a different map. """
+
+        copy = VersionMap.__new__(VersionMap)
+        copy._index = self._index
+        copy._map = map
+
+        return copy
+
+
+def versions_changed(project):
+    """ Called when the versions of a project have been changed.  Any version
+    maps created before the change must not be used afterwards.  This must be
+    called after every change to the versions.
+    """
+
+    project.version_index = None
+
+
+class _VersionIndex:
+    """ This class maps the versions of a project to the indexes of their bits
+    in a version map.
+    """
+
+    def __init__(self, versions):
+        """ Initialise the index. """
+
+        # Take a copy so that the index is unaffected by any later changes to
+        # the project's versions.
+        self.versions = list(versions)
+        self.all_mask = (1 << len(versions)) - 1
+
+        self._indexes = {version: idx for idx, version in enumerate(versions)}
+
+        # The masks of the (interned) tuples of version ranges.
+        self._version_ranges_masks = {}
+
+    def version_mask(self, version):
+        """ Return the mask of a version. """
 
-        return version_ranges
+        return 1 << self._indexes[version]
+
+    def version_ranges_mask(self, version_ranges):
+        """ Return the mask of a sequence of version ranges. """
+
+        if isinstance(version_ranges, tuple):
+            mask = self._version_ranges_masks.get(version_ranges)
+            if mask is None:
+                mask = self._compute_mask(version_ranges)
+                self._version_ranges_masks[version_ranges] = mask
+        else:
+            mask = self._compute_mask(version_ranges)
+
+        return mask
+
+    def _compute_mask(self, version_ranges):
+        """ Return the mask of a sequence of version ranges. """
+
+        # No version ranges means all versions are valid.
+        if len(version_ranges) == 0:
+            return self.all_mask
+
+        mask = 0
+
+        for version_range in version_ranges:
+            if version_range.startversion == '':
+                start_idx = 0
+            else:
+                start_idx = self._indexes[version_range.startversion]
+
+            if version_range.endversion == '':
+                end_idx = len(self.versions)
+            else:
+                end_idx = self._indexes[version_range.endversion]
 
-    def _initialise_map(self, initial_state):
-        """ Initialise the map. """
+            # Note that this is 0 if the range is empty or inverted.
+            if end_idx > start_idx:
+                mask |= (1 << end_idx) - (1 << start_idx)
 
-        self._map = [initial_state for v in self._versions]
+        return mask
@@ -4,12 +4,10 @@
 
 
 import argparse
-import sys
-import os
 
-from .exceptions import UserException
+from .exceptions import handle_exception, UserException
 from .models import Project
-from .project_io import generate_sip_files, load_project
+from .project_io import generate_sip_files, load_project, project_file_key
 from ._version import version
 
 
@@ -26,20 +24,27 @@ def main():
     parser.add_argument('--ignore',
             help="do not generate .sip files for MODULE",
             metavar='MODULE', action='append')
+    parser.add_argument('--jobs',
+            help="generate the .sip files using N concurrent processes",
+            metavar='N', type=int, default=1)
     parser.add_argument('--output-dir', help="generate the .sip files in DIR",
             metavar='DIR', required=True)
+    parser.add_argument('--use-cache',
+            help="load the project from a cache that is created if necessary",
+            dest='use_cache', default=False, action='store_true')
     parser.add_argument('--verbose', help="display progress messages",
             dest='verbose', default=False, action='store_true')
 
     args = parser.parse_args()
 
     try:
-        _generate(args.project, args.output_dir, args.ignore, args.verbose)
+        _generate(args.project, args.output_dir, args.ignore, args.verbose,
+                args.jobs, args.use_cache)
     except Exception as e:
-        _handle_exception(e)
+        handle_exception(e)
 
 
-def _generate(project_name, output_dir, ignore, verbose):
+def _generate(project_name, output_dir, ignore, verbose, jobs, use_cache):
     """ Generate the .sip files for a project and return an exit code or 0 if
     there was no error.
     """
@@ -47,30 +52,16 @@ def _generate(project_name, output_dir, ignore, verbose):
     if not project_name:
         raise UserException("Specify the name of an existing project file")
 
-    project = Project(project_name)
-    load_project(project)
-
-    generate_sip_files(project, output_dir, ignore, verbose)
-
+    if jobs < 1:
+        raise UserException("The number of jobs must be at least 1")
 
-def _handle_exception(e):
-    """ Tell the user about an exception. """
+    # The state of the project file is determined before it is loaded so that
+    # it can't be newer than the model.
+    project_key = project_file_key(project_name)
 
-    if isinstance(e, UserException):
-        # An "expected" exception.
-        if e.detail is not None:
-            message = "{0}: {1}".format(e.text, e.detail)
-        else:
-            message = e.text
-
-        print("{0}: {1}".format(os.path.basename(sys.argv[0]), message),
-                file=sys.stderr)
-
-        sys.exit(1)
+    project = Project(project_name)
+    load_project(project, use_cache=use_cache)
 
-    # An internal error.
-    print("{0}: An internal error occurred...".format(
-            os.path.basename(sys.argv[0])),
-            file=sys.stderr)
+    generate_sip_files(project, output_dir, ignore, verbose, jobs=jobs,
+            project_key=project_key)
 
-    raise e
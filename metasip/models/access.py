@@ -12,6 +12,9 @@ class Access:
     specifiers.
     """
 
+    # The slots are defined by the sub-classes.
+    __slots__ = ()
+
     # The access specifier.  Values are '' (meaning public), 'protected' and
     # 'private'.
     access: str = ''
@@ -4,15 +4,35 @@
 
 
 def adapt(model, target_type=None):
-    """ Return an adapter for a model adapted to its type or super-type. """
-
-    from .adapter_map import ADAPTER_MAP
+    """ Return the adapter for a model adapted to its type or super-type.  An
+    adapter is stateless and is shared by all models of the same type.
+    """
 
     if target_type is None:
         target_type = type(model)
 
     assert isinstance(model, target_type)
 
-    adapter_factory = ADAPTER_MAP[target_type]
+    # The map can't be imported when this module is imported because of
+    # circular imports.
+    if _adapter_map is None:
+        _import_adapter_map()
+
+    return _adapter_map[target_type]
+
+
+# The map of adaptable models to adapter instances.
+_adapter_map = None
+
+
+def _import_adapter_map():
+    """ Import the map of adaptable models to adapters and create an instance
+    of each adapter.
+    """
+
+    global _adapter_map
+
+    from .adapter_map import ADAPTER_MAP
 
-    return adapter_factory(model)
+    _adapter_map = {model_type: adapter_factory()
+            for model_type, adapter_factory in ADAPTER_MAP.items()}
@@ -14,14 +14,14 @@ class AnnosAdapter(BaseAdapter):
         'annos':    AttributeType.STRING,
     }
 
-    def as_str(self):
+    def as_str(self, model):
         """ Return the standard string representation. """
 
-        annos = self.model.annos
+        annos = model.annos
 
         return f' /{annos}/' if annos != '' else ''
 
-    def save_attributes(self, output):
+    def save_attributes(self, model, output):
         """ Save the XML attributes. """
 
-        self.save_str('annos', output)
+        self.save_str(model, 'annos', output)
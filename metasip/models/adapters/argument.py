@@ -22,32 +22,19 @@ class ArgumentAdapter(BaseApiAdapter):
         'unnamed':      AttributeType.BOOL,
     }
 
-    def __eq__(self, other):
-        """ Compare for C/C++ equality. """
-
-        arg = self.model
-        other_arg = other.model
-
-        if type(arg) is not type(other_arg):
-            return False
-
-        if self.expand_type(arg.type) != self.expand_type(other_arg.type):
-            return False
-
-        if arg.default != other_arg.default:
-            return False
+    def signature(self, arg):
+        """ Return the hashable signature used to compare for C/C++ equality.
+        """
 
-        return True
+        return (type(arg), self.expand_type(arg.type), arg.default)
 
-    def as_py_str(self):
+    def as_py_str(self, arg):
         """ Return the Python representation of the argument. """
 
-        arg = self.model
-
         s = self.expand_type(arg.pytype if arg.pytype != '' else arg.type,
                 name=arg.name)
 
-        s += adapt(arg, Annos).as_str()
+        s += adapt(arg, Annos).as_str(arg)
 
         if arg.pydefault != '':
             s += ' = ' + arg.pydefault
@@ -56,11 +43,9 @@ class ArgumentAdapter(BaseApiAdapter):
 
         return s
 
-    def as_str(self):
+    def as_str(self, arg):
         """ Return the standard string representation. """
 
-        arg = self.model
-
         s = self.expand_type(arg.type, name=arg.name)
 
         if arg.default != '':
@@ -68,33 +53,31 @@ class ArgumentAdapter(BaseApiAdapter):
 
         return s
 
-    def generate_sip(self, sip_file, output):
+    def generate_sip(self, model, sip_file, output):
         """ Generate the .sip file content. """
 
-        output.write(self.as_py_str())
+        output.write(self.as_py_str(model))
 
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        super().load(element, project, ui)
+        super().load(model, element, project, ui)
 
-        adapt(self.model, Annos).load(element, project, ui)
+        adapt(model, Annos).load(model, element, project, ui)
 
-    def save(self, output):
+    def save(self, argument, output):
         """ Save the model to an output file. """
 
-        argument = self.model
-
         output.write('<Argument')
-        adapt(argument, Annos).save_attributes(output)
+        adapt(argument, Annos).save_attributes(argument, output)
         self.save_attribute('type', argument.type, output)
-        self.save_bool('unnamed', output)
-        self.save_str('name', output)
-        self.save_str('default', output)
-        self.save_str('pydefault', output)
-        self.save_str('pytype', output)
+        self.save_bool(argument, 'unnamed', output)
+        self.save_str(argument, 'name', output)
+        self.save_str(argument, 'default', output)
+        self.save_str(argument, 'pydefault', output)
+        self.save_str(argument, 'pytype', output)
 
         # Note that we are assuming Annos does not have any subelements.
         output.write('/>\n')
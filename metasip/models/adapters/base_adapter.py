@@ -24,27 +24,38 @@ class AttributeType(Enum):
 class BaseAdapter(ABC):
     """ This is the base class for all adapters and provides the ability to
     load and save a model to a project file and to provide a user-friendly, one
-    line string representation.
+    line string representation.  Adapters are stateless and the model is passed
+    to each method.
     """
 
     # The default attribute type map.
     ATTRIBUTE_TYPE_MAP = {}
 
-    def __init__(self, model):
-        """ Initialise the adapter. """
+    # The names of the attributes of each type in ATTRIBUTE_TYPE_MAP.  These
+    # are set for each sub-class when it is created.
+    _bool_attributes = ()
+    _literal_attributes = ()
+    _string_attributes = ()
+    _string_list_attributes = ()
 
-        self.model = model
+    def __init_subclass__(cls, **kwargs):
+        """ Initialise a sub-class. """
 
-    def __eq__(self, other):
-        """ Compare for C/C++ equality. """
+        super().__init_subclass__(**kwargs)
 
-        # This method must be reimplemented by those adapters that contribute
-        # to the comparison of two APIs.  However we don't want to make it
-        # abstract and have to provide a stub reimplementation in other
-        # adapters.
-        raise NotImplementedError
+        # Split the attribute type map once rather than interpret it every time
+        # an element is loaded.
+        def names(attribute_type):
+            return tuple(name
+                    for name, at in cls.ATTRIBUTE_TYPE_MAP.items()
+                            if at is attribute_type)
+
+        cls._bool_attributes = names(AttributeType.BOOL)
+        cls._literal_attributes = names(AttributeType.LITERAL)
+        cls._string_attributes = names(AttributeType.STRING)
+        cls._string_list_attributes = names(AttributeType.STRING_LIST)
 
-    def as_str(self):
+    def as_str(self, model):
         """ Return the standard string representation. """
 
         print("!!!", type(self))
@@ -54,6 +65,16 @@ class BaseAdapter(ABC):
         # adapters.
         raise NotImplementedError
 
+    def signature(self, model):
+        """ Return the hashable signature used to compare for C/C++ equality.
+        """
+
+        # This method must be reimplemented by those adapters that contribute
+        # to the comparison of two APIs.  However we don't want to make it
+        # abstract and have to provide a stub reimplementation in other
+        # adapters.
+        raise NotImplementedError
+
     @classmethod
     def expand_type(cls, type, name=None):
         """ Return the full type with an optional name. """
@@ -79,37 +100,45 @@ class BaseAdapter(ABC):
 
         return s
 
-    def generate_sip_directives(self, output):
+    def generate_sip_directives(self, model, output):
         """ Write any directives to a .sip file. """
 
         # This default implementation does nothing.
         pass
 
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
         # This default implementation loads attributes define by
         # ATTRIBUTE_TYPE_MAP.
-        for name, attribute_type in self.ATTRIBUTE_TYPE_MAP.items():
-            if attribute_type is AttributeType.BOOL:
-                value = bool(int(element.get(name, '0')))
-            elif attribute_type is AttributeType.LITERAL:
-                for subelement in element:
-                    if subelement.tag == 'Literal' and subelement.get('type') == name:
-                        value = subelement.text.strip()
-                        break
-                else:
-                    value = ''
-            elif attribute_type is AttributeType.STRING:
-                value = element.get(name, '')
-            elif attribute_type is AttributeType.STRING_LIST:
-                value = element.get(name, '').split()
+        get = element.get
+
+        for name in self._bool_attributes:
+            setattr(model, name, bool(int(get(name, '0'))))
 
-            setattr(self.model, name, value)
+        for name in self._string_attributes:
+            setattr(model, name, get(name, ''))
 
-    def save(self, output):
+        for name in self._string_list_attributes:
+            setattr(model, name, get(name, '').split())
+
+        if self._literal_attributes:
+            # Index the literals in a single pass.  If a type of literal is
+            # repeated then the first one is used.
+            literals = {}
+
+            for subelement in element:
+                if subelement.tag == 'Literal':
+                    literals.setdefault(subelement.get('type'), subelement)
+
+            for name in self._literal_attributes:
+                subelement = literals.get(name)
+                value = '' if subelement is None else subelement.text.strip()
+                setattr(model, name, value)
+
+    def save(self, model, output):
         """ Save the model to an output file. """
 
         # This method must be reimplemented by those adapters that write their
@@ -123,7 +152,7 @@ class BaseAdapter(ABC):
 
         output.write(f' {name}="{cls._escape(value)}"')
 
-    def save_attributes(self, output):
+    def save_attributes(self, model, output):
         """ Save the XML attributes of an adapter that does not write its own
         XML element.
         """
@@ -131,39 +160,39 @@ class BaseAdapter(ABC):
         # This default implementation assumes there are no attributes.
         pass
 
-    def save_bool(self, name, output):
+    def save_bool(self, model, name, output):
         """ Save a bool. """
 
-        value = getattr(self.model, name)
+        value = getattr(model, name)
 
         if value:
             self.save_attribute(name, '1', output)
 
-    def save_literal(self, name, output):
+    def save_literal(self, model, name, output):
         """ Save the value of a literal text attribute. """
 
-        value = getattr(self.model, name)
+        value = getattr(model, name)
 
         if value != '':
             output.write(f'<Literal type="{name}">\n{self._escape(value)}\n</Literal>\n', indent=False)
 
-    def save_str(self, name, output):
+    def save_str(self, model, name, output):
         """ Save a string. """
 
-        value = getattr(self.model, name)
+        value = getattr(model, name)
 
         if value != '':
             self.save_attribute(name, value, output)
 
-    def save_str_list(self, name, output):
+    def save_str_list(self, model, name, output):
         """ Save a list of strings. """
 
-        value = getattr(self.model, name)
+        value = getattr(model, name)
 
         if len(value) != 0:
             self.save_attribute(name, ' '.join(value), output)
 
-    def save_subelements(self, output):
+    def save_subelements(self, model, output):
         """ Save the XML subelements of an adapter that does not write its own
         XML element.
         """
@@ -202,19 +231,17 @@ class BaseApiAdapter(BaseAdapter):
     """
 
     @abstractmethod
-    def generate_sip(self, sip_file, output):
+    def generate_sip(self, model, sip_file, output):
         """ Generate the .sip file content. """
 
         ...
 
-    def version_start(self, output):
+    def version_start(self, api, output):
         """ Write the start of the version tests for an API.  Returns the
         number of %End statements needed to be passed to the corresponding call
         to version_end().
         """
 
-        api = self.model
-
         nr_ends = 0
 
         for vrange in api.versions:
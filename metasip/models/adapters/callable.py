@@ -23,63 +23,45 @@ class CallableAdapter(BaseAdapter):
         'rtype':    AttributeType.STRING,
     }
 
-    def __eq__(self, other):
-        """ Compare for C/C++ equality. """
-
-        callable = self.model
-        other_callable = other.model
-
-        # Note that we have already checked the types.
-
-        if callable.name != other_callable.name:
-            return False
-
-        if self.expand_type(callable.rtype) != self.expand_type(other_callable.rtype):
-            return False
-
-        if len(callable.args) != len(other_callable.args):
-            return False
-
-        for arg, other_arg in zip(callable.args, other_callable.args):
-            if adapt(arg) != adapt(other_arg):
-                return False
+    def signature(self, callable):
+        """ Return the hashable signature used to compare for C/C++ equality.
+        """
 
-        return True
+        # Note that the type isn't included as that is the responsibility of
+        # the adapter of the sub-class.
+        return (callable.name, self.expand_type(callable.rtype),
+                tuple(adapt(arg).signature(arg) for arg in callable.args))
 
-    def as_str(self):
+    def as_str(self, callable):
         """ Return the standard string representation. """
 
-        callable = self.model
-
         # This is the Python signature.
-        s = self.return_type_as_str(allow_py=True) + callable.name
+        s = self.return_type_as_str(callable, allow_py=True) + callable.name
 
         if callable.pyargs != '':
             s += callable.pyargs
         else:
-            args = ', '.join([adapt(arg).as_py_str() for arg in callable.args])
+            args = ', '.join([adapt(arg).as_py_str(arg) for arg in callable.args])
             s += '(' + args + ')'
 
-        s += adapt(callable, Annos).as_str()
+        s += adapt(callable, Annos).as_str(callable)
 
         # We include a separate C++ signature if it is different to the Python
         # signature.  This is so we always hint to the user that something has
         # been manually changed.
-        if self.has_different_signatures():
-            return_type = self.return_type_as_str().strip()
+        if self.has_different_signatures(callable):
+            return_type = self.return_type_as_str(callable).strip()
             if return_type != '':
                 return_type += ' '
 
-            args = ', '.join([adapt(arg).as_str() for arg in callable.args])
+            args = ', '.join([adapt(arg).as_str(arg) for arg in callable.args])
             s += f' [{return_type}({args})]'
 
         return s
 
-    def has_different_signatures(self):
+    def has_different_signatures(self, callable):
         """ Returns True if the Python and C/C++ signatures are different. """
 
-        callable = self.model
-
         if callable.pytype != '' or callable.pyargs != '':
             return True
 
@@ -89,31 +71,29 @@ class CallableAdapter(BaseAdapter):
 
         return False
 
-    def generate_sip_directives(self, output):
+    def generate_sip_directives(self, model, output):
         """ Write any directives to a .sip file. """
 
-        output.write_code_directive('%MethodCode', self.model.methcode)
+        output.write_code_directive('%MethodCode', model.methcode)
 
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        super().load(element, project, ui)
+        super().load(model, element, project, ui)
 
-        adapt(self.model, Code).load(element, project, ui)
+        adapt(model, Code).load(model, element, project, ui)
 
         for subelement in element:
             if subelement.tag == 'Argument':
                 arg = Argument()
-                adapt(arg).load(subelement, project, ui)
-                self.model.args.append(arg)
+                adapt(arg).load(arg, subelement, project, ui)
+                model.args.append(arg)
 
-    def return_type_as_str(self, allow_py=False):
+    def return_type_as_str(self, callable, allow_py=False):
         """ Return the return type as a string. """
 
-        callable = self.model
-
         if callable.pytype != '' and allow_py:
             s = callable.pytype
         elif callable.rtype != '':
@@ -126,23 +106,21 @@ class CallableAdapter(BaseAdapter):
 
         return s
 
-    def save_attributes(self, output):
+    def save_attributes(self, callable, output):
         """ Save the XML attributes. """
 
-        callable = self.model
-
-        adapt(callable, Code).save_attributes(output)
+        adapt(callable, Code).save_attributes(callable, output)
         self.save_attribute('name', callable.name, output)
-        self.save_str('rtype', output)
-        self.save_str('pytype', output)
-        self.save_str('pyargs', output)
+        self.save_str(callable, 'rtype', output)
+        self.save_str(callable, 'pytype', output)
+        self.save_str(callable, 'pyargs', output)
 
-    def save_subelements(self, output):
+    def save_subelements(self, model, output):
         """ Save the XML subelements. """
 
-        adapt(self.model, Code).save_subelements(output)
+        adapt(model, Code).save_subelements(model, output)
 
-        for argument in self.model.args:
-            adapt(argument).save(output)
+        for argument in model.args:
+            adapt(argument).save(argument, output)
 
-        self.save_literal('methcode', output)
+        self.save_literal(model, 'methcode', output)
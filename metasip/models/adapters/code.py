@@ -14,26 +14,26 @@ from .base_adapter import BaseAdapter
 class CodeAdapter(BaseAdapter):
     """ This is the Code adapter. """
 
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        adapt(self.model, Annos).load(element, project, ui)
-        adapt(self.model, Tagged).load(element, project, ui)
-        adapt(self.model, Workflow).load(element, project, ui)
+        adapt(model, Annos).load(model, element, project, ui)
+        adapt(model, Tagged).load(model, element, project, ui)
+        adapt(model, Workflow).load(model, element, project, ui)
 
-    def save_attributes(self, output):
+    def save_attributes(self, model, output):
         """ Save the XML attributes. """
 
         # The order is to match older versions.
-        adapt(self.model, Annos).save_attributes(output)
-        adapt(self.model, Workflow).save_attributes(output)
-        adapt(self.model, Tagged).save_attributes(output)
+        adapt(model, Annos).save_attributes(model, output)
+        adapt(model, Workflow).save_attributes(model, output)
+        adapt(model, Tagged).save_attributes(model, output)
 
-    def save_subelements(self, output):
+    def save_subelements(self, model, output):
         """ Save the XML subelements. """
 
-        adapt(self.model, Annos).save_subelements(output)
-        adapt(self.model, Tagged).save_subelements(output)
-        adapt(self.model, Workflow).save_subelements(output)
+        adapt(model, Annos).save_subelements(model, output)
+        adapt(model, Tagged).save_subelements(model, output)
+        adapt(model, Workflow).save_subelements(model, output)
@@ -10,7 +10,7 @@ from .base_adapter import BaseAdapter
 class CodeContainerAdapter(BaseAdapter):
     """ This is the CodeContainer adapter. """
 
-    def load(self, tag_code_map, element, project, ui):
+    def load(self, model, tag_code_map, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
@@ -18,12 +18,12 @@ class CodeContainerAdapter(BaseAdapter):
         for subelement in element:
             model_factory = tag_code_map.get(subelement.tag)
             if model_factory is not None:
-                model = model_factory()
-                adapt(model).load(subelement, project, ui)
-                self.model.content.append(model)
+                code = model_factory()
+                adapt(code).load(code, subelement, project, ui)
+                model.content.append(code)
 
-    def save_subelements(self, output):
+    def save_subelements(self, model, output):
         """ Save the XML subelements. """
 
-        for code in self.model.content:
-            adapt(code).save(output)
+        for code in model.content:
+            adapt(code).save(code, output)
@@ -19,81 +19,62 @@ class ConstructorAdapter(BaseApiAdapter):
         'explicit': AttributeType.BOOL,
     }
 
-    def __eq__(self, other):
-        """ Compare for C/C++ equality. """
-
-        ctor = self.model
-        other_ctor = other.model
-
-        if type(ctor) is not type(other_ctor):
-            return False
-
-        if adapt(ctor, Callable) != adapt(other_ctor, Callable):
-            return False
-
-        if ctor.access != other_ctor.access:
-            return False
-
-        if ctor.explicit != other_ctor.explicit:
-            return False
+    def signature(self, ctor):
+        """ Return the hashable signature used to compare for C/C++ equality.
+        """
 
-        return True
+        return (type(ctor), adapt(ctor, Callable).signature(ctor), ctor.access,
+                ctor.explicit)
 
-    def as_str(self):
+    def as_str(self, ctor):
         """ Return the standard string representation. """
 
-        ctor = self.model
-
-        s = adapt(ctor, Callable).as_str()
+        s = adapt(ctor, Callable).as_str(ctor)
 
         if ctor.explicit:
             s = 'explicit ' + s
 
         return s
 
-    def generate_sip(self, sip_file, output):
+    def generate_sip(self, ctor, sip_file, output):
         """ Generate the .sip file content. """
 
-        ctor = self.model
+        nr_ends = self.version_start(ctor, output)
 
-        nr_ends = self.version_start(output)
-
-        output.write(self.as_str())
+        output.write(self.as_str(ctor))
         output.write(';\n')
 
-        adapt(ctor, Docstring).generate_sip_directives(output)
-        adapt(ctor, Callable).generate_sip_directives(output)
+        adapt(ctor, Docstring).generate_sip_directives(ctor, output)
+        adapt(ctor, Callable).generate_sip_directives(ctor, output)
 
         self.version_end(nr_ends, output)
 
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        super().load(element, project, ui)
+        super().load(model, element, project, ui)
 
-        adapt(self.model, Callable).load(element, project, ui)
-        adapt(self.model, Docstring).load(element, project, ui)
-        adapt(self.model, Access).load(element, project, ui)
+        adapt(model, Callable).load(model, element, project, ui)
+        adapt(model, Docstring).load(model, element, project, ui)
+        adapt(model, Access).load(model, element, project, ui)
 
-    def save(self, output):
+    def save(self, ctor, output):
         """ Save the model to an output file. """
 
-        ctor = self.model
-
         output.write('<Constructor')
-        adapt(ctor, Callable).save_attributes(output)
-        adapt(ctor, Docstring).save_attributes(output)
-        adapt(ctor, Access).save_attributes(output)
-        self.save_bool('explicit', output)
+        adapt(ctor, Callable).save_attributes(ctor, output)
+        adapt(ctor, Docstring).save_attributes(ctor, output)
+        adapt(ctor, Access).save_attributes(ctor, output)
+        self.save_bool(ctor, 'explicit', output)
         output.write('>\n')
 
         output += 1
         # The order is to match older versions.
-        adapt(ctor, Docstring).save_subelements(output)
-        adapt(ctor, Callable).save_subelements(output)
-        adapt(ctor, Access).save_subelements(output)
+        adapt(ctor, Docstring).save_subelements(ctor, output)
+        adapt(ctor, Callable).save_subelements(ctor, output)
+        adapt(ctor, Access).save_subelements(ctor, output)
         output -= 1
 
         output.write('</Constructor>\n')
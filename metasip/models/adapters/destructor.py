@@ -22,46 +22,28 @@ class DestructorAdapter(BaseApiAdapter):
         'virtual':  AttributeType.BOOL,
     }
 
-    def __eq__(self, other):
-        """ Compare for C/C++ equality. """
-
-        dtor = self.model
-        other_dtor = other.model
-
-        if type(dtor) is not type(other_dtor):
-            return False
-
-        if dtor.access != other_dtor.access:
-            return False
-
-        if dtor.name != other_dtor.name:
-            return False
-
-        if dtor.virtual != other_dtor.virtual:
-            return False
+    def signature(self, dtor):
+        """ Return the hashable signature used to compare for C/C++ equality.
+        """
 
-        return True
+        return (type(dtor), dtor.access, dtor.name, dtor.virtual)
 
-    def as_str(self):
+    def as_str(self, dtor):
         """ Return the standard string representation. """
 
-        dtor = self.model
-
-        s = '~' + dtor.name + '()' + adapt(dtor, Annos).as_str()
+        s = '~' + dtor.name + '()' + adapt(dtor, Annos).as_str(dtor)
 
         if dtor.virtual:
             s = 'virtual ' + s
 
         return s
 
-    def generate_sip(self, sip_file, output):
+    def generate_sip(self, dtor, sip_file, output):
         """ Generate the .sip file content. """
 
-        dtor = self.model
+        nr_ends = self.version_start(dtor, output)
 
-        nr_ends = self.version_start(output)
-
-        output.write(self.as_str())
+        output.write(self.as_str(dtor))
         output.write(';\n')
 
         output.write_code_directive('%MethodCode', dtor.methcode)
@@ -69,33 +51,31 @@ class DestructorAdapter(BaseApiAdapter):
 
         self.version_end(nr_ends, output)
 
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        super().load(element, project, ui)
+        super().load(model, element, project, ui)
 
-        adapt(self.model, Code).load(element, project, ui)
-        adapt(self.model, Access).load(element, project, ui)
+        adapt(model, Code).load(model, element, project, ui)
+        adapt(model, Access).load(model, element, project, ui)
 
-    def save(self, output):
+    def save(self, dtor, output):
         """ Save the model to an output file. """
 
-        dtor = self.model
-
         output.write('<Destructor')
-        adapt(dtor, Code).save_attributes(output)
-        adapt(dtor, Access).save_attributes(output)
+        adapt(dtor, Code).save_attributes(dtor, output)
+        adapt(dtor, Access).save_attributes(dtor, output)
         self.save_attribute('name', dtor.name, output)
-        self.save_bool('virtual', output)
+        self.save_bool(dtor, 'virtual', output)
         output.write('>\n')
 
         output += 1
-        self.save_literal('methcode', output)
-        self.save_literal('virtcode', output)
-        adapt(dtor, Code).save_subelements(output)
-        adapt(dtor, Access).save_subelements(output)
+        self.save_literal(dtor, 'methcode', output)
+        self.save_literal(dtor, 'virtcode', output)
+        adapt(dtor, Code).save_subelements(dtor, output)
+        adapt(dtor, Access).save_subelements(dtor, output)
         output -= 1
 
         output.write('</Destructor>\n')
@@ -14,13 +14,13 @@ class DocstringAdapter(BaseAdapter):
         'docstring':    AttributeType.LITERAL,
     }
 
-    def generate_sip_directives(self, output):
+    def generate_sip_directives(self, model, output):
         """ Write any directives to a .sip file. """
 
-        output.write_code_directive('%Docstring', self.model.docstring,
+        output.write_code_directive('%Docstring', model.docstring,
                 indent=False)
 
-    def save_subelements(self, output):
+    def save_subelements(self, model, output):
         """ Save the XML subelements. """
 
-        self.save_literal('docstring', output)
+        self.save_literal(model, 'docstring', output)
@@ -21,31 +21,15 @@ class EnumAdapter(BaseApiAdapter):
         'name':         AttributeType.STRING,
     }
 
-    def __eq__(self, other):
-        """ Compare for C/C++ equality. """
-
-        enum = self.model
-        other_enum = other.model
-
-        if type(enum) is not type(other_enum):
-            return False
-
-        if enum.access != other_enum.access:
-            return False
-
-        if enum.name != other_enum.name:
-            return False
-
-        if enum.enumclass != other_enum.enumclass:
-            return False
+    def signature(self, enum):
+        """ Return the hashable signature used to compare for C/C++ equality.
+        """
 
-        return True
+        return (type(enum), enum.access, enum.name, enum.enumclass)
 
-    def as_str(self):
+    def as_str(self, enum):
         """ Return the standard string representation. """
 
-        enum = self.model
-
         s = 'enum'
 
         if enum.enumclass:
@@ -54,25 +38,23 @@ class EnumAdapter(BaseApiAdapter):
         if enum.name != '':
             s += ' ' + enum.name
 
-        s += adapt(enum, Annos).as_str()
+        s += adapt(enum, Annos).as_str(enum)
 
         return s
 
-    def generate_sip(self, sip_file, output):
+    def generate_sip(self, enum, sip_file, output):
         """ Generate the .sip file content. """
 
-        enum = self.model
-
-        nr_ends = self.version_start(output)
+        nr_ends = self.version_start(enum, output)
 
         output.blank()
-        output.write(self.as_str())
+        output.write(self.as_str(enum))
         output.write('\n{\n')
         output += 1
 
         for enum_value in enum.content:
             if enum_value.status == '':
-                adapt(enum_value).generate_sip(sip_file, output)
+                adapt(enum_value).generate_sip(enum_value, sip_file, output)
 
         output -= 1
         output.write('};\n')
@@ -80,40 +62,38 @@ class EnumAdapter(BaseApiAdapter):
 
         self.version_end(nr_ends, output)
 
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        super().load(element, project, ui)
+        super().load(model, element, project, ui)
 
-        adapt(self.model, Code).load(element, project, ui)
-        adapt(self.model, Access).load(element, project, ui)
+        adapt(model, Code).load(model, element, project, ui)
+        adapt(model, Access).load(model, element, project, ui)
 
         for subelement in element:
             if subelement.tag == 'EnumValue':
                 enum_value = EnumValue()
-                adapt(enum_value).load(subelement, project, ui)
-                self.model.content.append(enum_value)
+                adapt(enum_value).load(enum_value, subelement, project, ui)
+                model.content.append(enum_value)
 
-    def save(self, output):
+    def save(self, enum, output):
         """ Save the model to an output file. """
 
-        enum = self.model
-
         output.write('<Enum')
-        adapt(enum, Code).save_attributes(output)
-        adapt(enum, Access).save_attributes(output)
-        self.save_bool('enumclass', output)
+        adapt(enum, Code).save_attributes(enum, output)
+        adapt(enum, Access).save_attributes(enum, output)
+        self.save_bool(enum, 'enumclass', output)
         self.save_attribute('name', enum.name, output)
         output.write('>\n')
 
         output += 1
-        adapt(enum, Code).save_subelements(output)
-        adapt(enum, Access).save_subelements(output)
+        adapt(enum, Code).save_subelements(enum, output)
+        adapt(enum, Access).save_subelements(enum, output)
 
         for enum_value in enum.content:
-            adapt(enum_value).save(output)
+            adapt(enum_value).save(enum_value, output)
 
         output -= 1
 
@@ -19,64 +19,52 @@ class EnumValueAdapter(BaseApiAdapter):
         'name': AttributeType.STRING,
     }
 
-    def __eq__(self, other):
-        """ Compare for C/C++ equality. """
-
-        enum_value = self.model
-        other_enum_value = other.model
-
-        if type(enum_value) is not type(other_enum_value):
-            return False
-
-        if enum_value.name != other_enum_value.name:
-            return False
+    def signature(self, enum_value):
+        """ Return the hashable signature used to compare for C/C++ equality.
+        """
 
-        return True
+        return (type(enum_value), enum_value.name)
 
-    def as_str(self):
+    def as_str(self, enum_value):
         """ Return the standard string representation. """
 
-        enum_value = self.model
-
-        return enum_value.name + adapt(enum_value, Annos).as_str()
+        return enum_value.name + adapt(enum_value, Annos).as_str(enum_value)
 
-    def generate_sip(self, sip_file, output):
+    def generate_sip(self, model, sip_file, output):
         """ Generate the .sip file content. """
 
-        nr_ends = self.version_start(output)
+        nr_ends = self.version_start(model, output)
 
-        output.write(self.as_str())
+        output.write(self.as_str(model))
         output.write(',\n')
 
         self.version_end(nr_ends, output)
 
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        super().load(element, project, ui)
+        super().load(model, element, project, ui)
 
-        adapt(self.model, Annos).load(element, project, ui)
-        adapt(self.model, Tagged).load(element, project, ui)
-        adapt(self.model, Workflow).load(element, project, ui)
+        adapt(model, Annos).load(model, element, project, ui)
+        adapt(model, Tagged).load(model, element, project, ui)
+        adapt(model, Workflow).load(model, element, project, ui)
 
-    def save(self, output):
+    def save(self, enum_value, output):
         """ Save the model to an output file. """
 
-        enum_value = self.model
-
         output.write('<EnumValue')
-        adapt(enum_value, Annos).save_attributes(output)
-        adapt(enum_value, Workflow).save_attributes(output)
-        adapt(enum_value, Tagged).save_attributes(output)
+        adapt(enum_value, Annos).save_attributes(enum_value, output)
+        adapt(enum_value, Workflow).save_attributes(enum_value, output)
+        adapt(enum_value, Tagged).save_attributes(enum_value, output)
         self.save_attribute('name', enum_value.name, output)
         output.write('>\n')
 
         output += 1
-        adapt(enum_value, Annos).save_subelements(output)
-        adapt(enum_value, Tagged).save_subelements(output)
-        adapt(enum_value, Workflow).save_subelements(output)
+        adapt(enum_value, Annos).save_subelements(enum_value, output)
+        adapt(enum_value, Tagged).save_subelements(enum_value, output)
+        adapt(enum_value, Workflow).save_subelements(enum_value, output)
         output -= 1
 
         output.write('</EnumValue>\n')
@@ -14,7 +14,7 @@ class ExtendedAccessAdapter(BaseAdapter):
         'access':   AttributeType.STRING,
     }
 
-    def save_attributes(self, output):
+    def save_attributes(self, model, output):
         """ Save the XML attributes. """
 
-        self.save_str('access', output)
+        self.save_str(model, 'access', output)
@@ -14,74 +14,62 @@ from .base_adapter import BaseApiAdapter
 class FunctionAdapter(BaseApiAdapter):
     """ This is the Function adapter. """
 
-    def __eq__(self, other):
-        """ Compare for C/C++ equality. """
-
-        function = self.model
-        other_function = other.model
-
-        if type(function) is not type(other_function):
-            return False
-
-        if adapt(function, Callable) != adapt(other_function, Callable):
-            return False
+    def signature(self, function):
+        """ Return the hashable signature used to compare for C/C++ equality.
+        """
 
-        return True
+        return (type(function), adapt(function, Callable).signature(function))
 
-    def as_str(self):
+    def as_str(self, model):
         """ Return the standard string representation. """
 
-        return adapt(self.model, Callable).as_str()
+        return adapt(model, Callable).as_str(model)
 
-    def generate_sip(self, sip_file, output):
+    def generate_sip(self, function, sip_file, output):
         """ Generate the .sip file content. """
 
-        function = self.model
-
-        nr_ends = self.version_start(output)
+        nr_ends = self.version_start(function, output)
 
         # Note that we don't use CallableAdapter's implementation because we
         # dont want any C/C++ signature.
 
-        s = adapt(function, Callable).return_type_as_str(allow_py=True) + function.name
+        s = adapt(function, Callable).return_type_as_str(function, allow_py=True) + function.name
 
         if function.pyargs != '':
             s += function.pyargs
         else:
-            args = ', '.join([adapt(arg).as_py_str() for arg in function.args])
+            args = ', '.join([adapt(arg).as_py_str(arg) for arg in function.args])
             s += '(' + args + ')'
 
-        s += adapt(function, Annos).as_str()
+        s += adapt(function, Annos).as_str(function)
         output.write(s)
         output.write(';\n')
 
-        adapt(function, Docstring).generate_sip_directives(output)
-        adapt(function, Callable).generate_sip_directives(output)
+        adapt(function, Docstring).generate_sip_directives(function, output)
+        adapt(function, Callable).generate_sip_directives(function, output)
 
         self.version_end(nr_ends, output)
 
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        adapt(self.model, Callable).load(element, project, ui)
-        adapt(self.model, Docstring).load(element, project, ui)
+        adapt(model, Callable).load(model, element, project, ui)
+        adapt(model, Docstring).load(model, element, project, ui)
 
-    def save(self, output):
+    def save(self, function, output):
         """ Save the model to an output file. """
 
-        function = self.model
-
         output.write('<Function')
-        adapt(function, Callable).save_attributes(output)
-        adapt(function, Docstring).save_attributes(output)
+        adapt(function, Callable).save_attributes(function, output)
+        adapt(function, Docstring).save_attributes(function, output)
         output.write('>\n')
 
         output += 1
         # The order is to match older versions.
-        adapt(function, Docstring).save_subelements(output)
-        adapt(function, Callable).save_subelements(output)
+        adapt(function, Docstring).save_subelements(function, output)
+        adapt(function, Callable).save_subelements(function, output)
         output -= 1
 
         output.write('</Function>\n')
@@ -23,14 +23,12 @@ class HeaderDirectoryAdapter(BaseAdapter):
         'name':             AttributeType.STRING,
     }
 
-    def load(self, element, project, ui):
+    def load(self, header_directory, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        super().load(element, project, ui)
-
-        header_directory = self.model
+        super().load(header_directory, element, project, ui)
 
         scan = element.get('scan')
         if scan is None:
@@ -63,11 +61,11 @@ class HeaderDirectoryAdapter(BaseAdapter):
         for subelement in element:
             if subelement.tag == 'HeaderFile':
                 header_file = HeaderFile()
-                adapt(header_file).load(subelement, project, ui)
+                adapt(header_file).load(header_file, subelement, project, ui)
                 header_directory.content.append(header_file)
             elif subelement.tag == 'Platform':
                 platform = Platform()
-                adapt(platform).load(subelement, project, ui)
+                adapt(platform).load(platform, subelement, project, ui)
                 header_directory.platforms.append(platform)
 
         # Supply defaults for any missing supported platforms but don't mark
@@ -90,11 +88,9 @@ class HeaderDirectoryAdapter(BaseAdapter):
                                 inputdirpattern=inputdirpattern,
                                 parserargs=parserargs))
 
-    def save(self, output):
+    def save(self, header_directory, output):
         """ Save the model to an output file. """
 
-        header_directory = self.model
-
         output.write(f'<HeaderDirectory name="{header_directory.name}"')
 
         if header_directory.scan:
@@ -110,10 +106,10 @@ class HeaderDirectoryAdapter(BaseAdapter):
         output += 1
 
         for platform in header_directory.platforms:
-            adapt(platform).save(output)
+            adapt(platform).save(platform, output)
 
         for header_file in header_directory.content:
-            adapt(header_file).save(output)
+            adapt(header_file).save(header_file, output)
 
         output -= 1
         output.write('</HeaderDirectory>\n')
@@ -19,32 +19,31 @@ class HeaderFileAdapter(BaseAdapter):
         'name':     AttributeType.STRING,
     }
 
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        super().load(element, project, ui)
+        super().load(model, element, project, ui)
 
         for subelement in element:
             if subelement.tag == 'HeaderFileVersion':
                 header_file_version = HeaderFileVersion()
-                adapt(header_file_version).load(subelement, project, ui)
-                self.model.versions.append(header_file_version)
+                adapt(header_file_version).load(header_file_version, subelement,
+                        project, ui)
+                model.versions.append(header_file_version)
 
-    def save(self, output):
+    def save(self, header_file, output):
         """ Save the model to an output file. """
 
-        header_file = self.model
-
         output.write(f'<HeaderFile name="{header_file.name}"')
-        self.save_str('module', output)
-        self.save_bool('ignored', output)
+        self.save_str(header_file, 'module', output)
+        self.save_bool(header_file, 'ignored', output)
         output.write('>\n')
         output += 1
 
         for header_file_version in header_file.versions:
-            adapt(header_file_version).save(output)
+            adapt(header_file_version).save(header_file_version, output)
 
         output -= 1
         output.write('</HeaderFile>\n')
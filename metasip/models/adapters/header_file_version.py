@@ -16,11 +16,9 @@ class HeaderFileVersionAdapter(BaseAdapter):
         'version':  AttributeType.STRING,
     }
 
-    def save(self, output):
+    def save(self, header_file_version, output):
         """ Save the model to an output file. """
 
-        header_file_version = self.model
-
         output.write(f'<HeaderFileVersion md5="{header_file_version.md5}" version="{header_file_version.version}"')
-        self.save_bool('parse', output)
+        self.save_bool(header_file_version, 'parse', output)
         output.write('/>\n')
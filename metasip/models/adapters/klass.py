@@ -69,34 +69,16 @@ class ClassAdapter(BaseApiAdapter):
         'Variable':         Variable,
     }
 
-    def __eq__(self, other):
-        """ Compare for C/C++ equality. """
-
-        klass = self.model
-        other_klass = other.model
-
-        if type(klass) is not type(other_klass):
-            return False
-
-        if klass.access != other_klass.access:
-            return False
-
-        if klass.name != other_klass.name:
-            return False
-
-        if klass.struct != other_klass.struct:
-            return False
-
-        if klass.bases != other_klass.bases:
-            return False
+    def signature(self, klass):
+        """ Return the hashable signature used to compare for C/C++ equality.
+        """
 
-        return True
+        return (type(klass), klass.access, klass.name, klass.struct,
+                klass.bases)
 
-    def as_str(self):
+    def as_str(self, klass):
         """ Return the standard string representation. """
 
-        klass = self.model
-
         s = 'struct' if klass.struct else 'class'
 
         if klass.name != '':
@@ -105,16 +87,14 @@ class ClassAdapter(BaseApiAdapter):
         if klass.bases != '':
             s += ' : ' + klass.bases
 
-        s += adapt(klass, Annos).as_str()
+        s += adapt(klass, Annos).as_str(klass)
 
         return s
 
-    def generate_sip(self, sip_file, output):
+    def generate_sip(self, klass, sip_file, output):
         """ Generate the .sip file content. """
 
-        klass = self.model
-
-        nr_ends = self.version_start(output)
+        nr_ends = self.version_start(klass, output)
 
         output.blank()
 
@@ -134,9 +114,9 @@ class ClassAdapter(BaseApiAdapter):
 
             bases_s = ' : ' + ', '.join(bases)
 
-        output.write(type_type + klass.name + bases_s + adapt(klass, Annos).as_str() + '\n{\n')
+        output.write(type_type + klass.name + bases_s + adapt(klass, Annos).as_str(klass) + '\n{\n')
 
-        adapt(klass, Docstring).generate_sip_directives(output)
+        adapt(klass, Docstring).generate_sip_directives(klass, output)
         output.write_code_directive('%TypeHintCode', klass.typehintcode,
                 indent=False)
 
@@ -195,7 +175,7 @@ class ClassAdapter(BaseApiAdapter):
                     output.write(access_s + ':\n')
                     output += 1
 
-            adapt(api).generate_sip(sip_file, output)
+            adapt(api).generate_sip(api, sip_file, output)
 
         output -= 1
 
@@ -205,57 +185,55 @@ class ClassAdapter(BaseApiAdapter):
 
         self.version_end(nr_ends, output)
 
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        super().load(element, project, ui)
+        super().load(model, element, project, ui)
 
-        adapt(self.model, Code).load(element, project, ui)
-        adapt(self.model, CodeContainer).load(self._TAG_CODE_MAP, element,
+        adapt(model, Code).load(model, element, project, ui)
+        adapt(model, CodeContainer).load(model, self._TAG_CODE_MAP, element,
                 project, ui)
-        adapt(self.model, Docstring).load(element, project, ui)
-        adapt(self.model, Access).load(element, project, ui)
+        adapt(model, Docstring).load(model, element, project, ui)
+        adapt(model, Access).load(model, element, project, ui)
 
-    def save(self, output):
+    def save(self, klass, output):
         """ Save the model to an output file. """
 
-        klass = self.model
-
         output.write('<Class')
-        adapt(klass, Code).save_attributes(output)
-        adapt(klass, CodeContainer).save_attributes(output)
-        adapt(klass, Docstring).save_attributes(output)
-        adapt(klass, Access).save_attributes(output)
+        adapt(klass, Code).save_attributes(klass, output)
+        adapt(klass, CodeContainer).save_attributes(klass, output)
+        adapt(klass, Docstring).save_attributes(klass, output)
+        adapt(klass, Access).save_attributes(klass, output)
         self.save_attribute('name', klass.name, output)
-        self.save_str('bases', output)
-        self.save_str('pybases', output)
-        self.save_bool('struct', output)
+        self.save_str(klass, 'bases', output)
+        self.save_str(klass, 'pybases', output)
+        self.save_bool(klass, 'struct', output)
         output.write('>\n')
 
         output += 1
         # The order is to match older versions.
-        adapt(klass, Code).save_subelements(output)
-        adapt(klass, Docstring).save_subelements(output)
-        self.save_literal('typehintcode', output)
-        self.save_literal('typeheadercode', output)
-        self.save_literal('typecode', output)
-        self.save_literal('finalisationcode', output)
-        self.save_literal('subclasscode', output)
-        self.save_literal('convtotypecode', output)
-        self.save_literal('convfromtypecode', output)
-        self.save_literal('gctraversecode', output)
-        self.save_literal('gcclearcode', output)
-        self.save_literal('bigetbufcode', output)
-        self.save_literal('birelbufcode', output)
-        self.save_literal('bireadbufcode', output)
-        self.save_literal('biwritebufcode', output)
-        self.save_literal('bisegcountcode', output)
-        self.save_literal('bicharbufcode', output)
-        self.save_literal('picklecode', output)
-        adapt(klass, CodeContainer).save_subelements(output)
-        adapt(klass, Access).save_subelements(output)
+        adapt(klass, Code).save_subelements(klass, output)
+        adapt(klass, Docstring).save_subelements(klass, output)
+        self.save_literal(klass, 'typehintcode', output)
+        self.save_literal(klass, 'typeheadercode', output)
+        self.save_literal(klass, 'typecode', output)
+        self.save_literal(klass, 'finalisationcode', output)
+        self.save_literal(klass, 'subclasscode', output)
+        self.save_literal(klass, 'convtotypecode', output)
+        self.save_literal(klass, 'convfromtypecode', output)
+        self.save_literal(klass, 'gctraversecode', output)
+        self.save_literal(klass, 'gcclearcode', output)
+        self.save_literal(klass, 'bigetbufcode', output)
+        self.save_literal(klass, 'birelbufcode', output)
+        self.save_literal(klass, 'bireadbufcode', output)
+        self.save_literal(klass, 'biwritebufcode', output)
+        self.save_literal(klass, 'bisegcountcode', output)
+        self.save_literal(klass, 'bicharbufcode', output)
+        self.save_literal(klass, 'picklecode', output)
+        adapt(klass, CodeContainer).save_subelements(klass, output)
+        adapt(klass, Access).save_subelements(klass, output)
         output -= 1
 
         output.write('</Class>\n')
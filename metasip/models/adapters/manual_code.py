@@ -21,17 +21,15 @@ class ManualCodeAdapter(BaseApiAdapter):
         'precis':   AttributeType.STRING,
     }
 
-    def as_str(self):
+    def as_str(self, model):
         """ Return the standard string representation. """
 
-        return self.model.precis
+        return model.precis
 
-    def generate_sip(self, sip_file, output):
+    def generate_sip(self, manual_code, sip_file, output):
         """ Generate the .sip file content. """
 
-        manual_code = self.model
-
-        nr_ends = self.version_start(output)
+        nr_ends = self.version_start(manual_code, output)
 
         if manual_code.body != '':
             output.write(f'// {manual_code.precis}\n{manual_code.body}\n',
@@ -41,40 +39,40 @@ class ManualCodeAdapter(BaseApiAdapter):
         else:
             output.write(manual_code.precis + ';\n')
 
-        adapt(manual_code, Docstring).generate_sip_directives(output)
+        adapt(manual_code, Docstring).generate_sip_directives(manual_code,
+                output)
         output.write_code_directive('%MethodCode', manual_code.methcode)
 
         self.version_end(nr_ends, output)
 
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        super().load(element, project, ui)
+        super().load(model, element, project, ui)
 
-        adapt(self.model, Code).load(element, project, ui)
-        adapt(self.model, Docstring).load(element, project, ui)
-        adapt(self.model, ExtendedAccess).load(element, project, ui)
+        adapt(model, Code).load(model, element, project, ui)
+        adapt(model, Docstring).load(model, element, project, ui)
+        adapt(model, ExtendedAccess).load(model, element, project, ui)
 
-    def save(self, output):
+    def save(self, manual_code, output):
         """ Save the model to an output file. """
 
-        manual_code = self.model
-
         output.write('<ManualCode')
-        adapt(manual_code, Code).save_attributes(output)
-        adapt(manual_code, Docstring).save_attributes(output)
-        adapt(manual_code, ExtendedAccess).save_attributes(output)
+        adapt(manual_code, Code).save_attributes(manual_code, output)
+        adapt(manual_code, Docstring).save_attributes(manual_code, output)
+        adapt(manual_code, ExtendedAccess).save_attributes(manual_code, output)
         self.save_attribute('precis', manual_code.precis, output)
         output.write('>\n')
 
         output += 1
-        self.save_literal('body', output)
-        adapt(manual_code, Code).save_subelements(output)
-        adapt(manual_code, Docstring).save_subelements(output)
-        adapt(manual_code, ExtendedAccess).save_subelements(output)
-        self.save_literal('methcode', output)
+        self.save_literal(manual_code, 'body', output)
+        adapt(manual_code, Code).save_subelements(manual_code, output)
+        adapt(manual_code, Docstring).save_subelements(manual_code, output)
+        adapt(manual_code, ExtendedAccess).save_subelements(manual_code,
+                output)
+        self.save_literal(manual_code, 'methcode', output)
         output -= 1
 
         output.write('</ManualCode>\n')
@@ -24,53 +24,28 @@ class MethodAdapter(BaseApiAdapter):
         'virtual':  AttributeType.BOOL,
     }
 
-    def __eq__(self, other):
-        """ Compare for C/C++ equality. """
-
-        method = self.model
-        other_method = other.model
-
-        if type(method) is not type(other_method):
-            return False
-
-        if adapt(method, Callable) != adapt(other_method, Callable):
-            return False
+    def signature(self, method):
+        """ Return the hashable signature used to compare for C/C++ equality.
+        """
 
-        # This code is called when we are comparing a potentially new version
-        # of an API item (when the extended access hasn't been specified yet)
-        # with an existing one (when the extended access has been specified).
-        # Therefore we ignore the extension when doing the comparison.
+        # This is used when we are comparing a potentially new version of an
+        # API item (when the extended access hasn't been specified yet) with an
+        # existing one (when the extended access has been specified).
+        # Therefore we ignore the extension.
         access = method.access.replace('signals', '').replace(' slots', '').replace('public', '')
-        other_access = other_method.access.replace('signals', '').replace(' slots', '').replace('public', '')
-        if access != other_access:
-            return False
 
         # Note that we don't include 'final' because this is implemented as an
         # annotation (because it isn't handled by Cast-XML) and so would always
         # cause a comparison to fail.
+        return (type(method), adapt(method, Callable).signature(method), access,
+                method.virtual, method.static, method.const, method.abstract)
 
-        if method.virtual != other_method.virtual:
-            return False
-
-        if method.static != other_method.static:
-            return False
-
-        if method.const != other_method.const:
-            return False
-
-        if method.abstract != other_method.abstract:
-            return False
-
-        return True
-
-    def as_str(self):
+    def as_str(self, method):
         """ Return the standard string representation. """
 
         # We can't use the super class version because we might need to stick
         # some text in the middle of it.
 
-        method = self.model
-
         callable_adapter = adapt(method, Callable)
 
         s = ''
@@ -81,12 +56,12 @@ class MethodAdapter(BaseApiAdapter):
         if method.static:
             s += 'static '
 
-        s += callable_adapter.return_type_as_str(allow_py=True) + method.name
+        s += callable_adapter.return_type_as_str(method, allow_py=True) + method.name
 
         if method.pyargs != '':
             s += method.pyargs
         else:
-            args = ', '.join([adapt(arg).as_py_str() for arg in method.args])
+            args = ', '.join([adapt(arg).as_py_str(arg) for arg in method.args])
             s += '(' + args + ')'
 
         if method.const:
@@ -98,64 +73,60 @@ class MethodAdapter(BaseApiAdapter):
         if method.abstract:
             s += ' = 0'
 
-        s += adapt(method, Annos).as_str()
+        s += adapt(method, Annos).as_str(method)
 
-        if (method.virtual or method.access.startswith('protected') or method.methcode == '') and callable_adapter.has_different_signatures():
-            return_type = callable_adapter.return_type_as_str().strip()
-            args = ', '.join([adapt(arg).as_str() for arg in method.args])
+        if (method.virtual or method.access.startswith('protected') or method.methcode == '') and callable_adapter.has_different_signatures(method):
+            return_type = callable_adapter.return_type_as_str(method).strip()
+            args = ', '.join([adapt(arg).as_str(arg) for arg in method.args])
             s += f' [{return_type} ({args})]'
 
         return s
 
-    def generate_sip(self, sip_file, output):
+    def generate_sip(self, method, sip_file, output):
         """ Generate the .sip file content. """
 
-        method = self.model
-
-        nr_ends = self.version_start(output)
+        nr_ends = self.version_start(method, output)
 
-        output.write(self.as_str())
+        output.write(self.as_str(method))
         output.write(';\n')
 
-        adapt(method, Docstring).generate_sip_directives(output)
-        adapt(method, Callable).generate_sip_directives(output)
-        adapt(method, ExtendedAccess).generate_sip_directives(output)
+        adapt(method, Docstring).generate_sip_directives(method, output)
+        adapt(method, Callable).generate_sip_directives(method, output)
+        adapt(method, ExtendedAccess).generate_sip_directives(method, output)
         output.write_code_directive('%VirtualCatcherCode', method.virtcode)
 
         self.version_end(nr_ends, output)
 
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        super().load(element, project, ui)
+        super().load(model, element, project, ui)
 
-        adapt(self.model, Callable).load(element, project, ui)
-        adapt(self.model, Docstring).load(element, project, ui)
-        adapt(self.model, ExtendedAccess).load(element, project, ui)
+        adapt(model, Callable).load(model, element, project, ui)
+        adapt(model, Docstring).load(model, element, project, ui)
+        adapt(model, ExtendedAccess).load(model, element, project, ui)
 
-    def save(self, output):
+    def save(self, method, output):
         """ Save the model to an output file. """
 
-        method = self.model
-
         output.write('<Method')
-        adapt(method, Callable).save_attributes(output)
-        adapt(method, Docstring).save_attributes(output)
-        adapt(method, ExtendedAccess).save_attributes(output)
-        self.save_bool('virtual', output)
-        self.save_bool('const', output)
-        self.save_bool('final', output)
-        self.save_bool('static', output)
-        self.save_bool('abstract', output)
+        adapt(method, Callable).save_attributes(method, output)
+        adapt(method, Docstring).save_attributes(method, output)
+        adapt(method, ExtendedAccess).save_attributes(method, output)
+        self.save_bool(method, 'virtual', output)
+        self.save_bool(method, 'const', output)
+        self.save_bool(method, 'final', output)
+        self.save_bool(method, 'static', output)
+        self.save_bool(method, 'abstract', output)
         output.write('>\n')
 
         output += 1
-        adapt(method, Callable).save_subelements(output)
-        adapt(method, Docstring).save_subelements(output)
-        adapt(method, ExtendedAccess).save_subelements(output)
-        self.save_literal('virtcode', output)
+        adapt(method, Callable).save_subelements(method, output)
+        adapt(method, Docstring).save_subelements(method, output)
+        adapt(method, ExtendedAccess).save_subelements(method, output)
+        self.save_literal(method, 'virtcode', output)
         output -= 1
 
         output.write('</Method>\n')
@@ -23,19 +23,17 @@ class ModuleAdapter(BaseAdapter):
         'virtualerrorhandler':  AttributeType.STRING,
     }
 
-    def as_str(self):
+    def as_str(self, model):
         """ Return the standard string representation. """
 
-        return self.model.name
+        return model.name
 
-    def load(self, element, project, ui):
+    def load(self, module, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        module = self.model
-
-        super().load(element, project, ui)
+        super().load(module, element, project, ui)
 
         callsuperinit = int(element.get('callsuperinit', '-1'))
         if callsuperinit < 0:
@@ -54,32 +52,30 @@ class ModuleAdapter(BaseAdapter):
         for subelement in element:
             if subelement.tag == 'SipFile':
                 sip_file = SipFile()
-                adapt(sip_file).load(subelement, project, ui)
+                adapt(sip_file).load(sip_file, subelement, project, ui)
                 module.content.append(sip_file)
 
-    def save(self, output):
+    def save(self, module, output):
         """ Save the model to an output file. """
 
-        module = self.model
-
         output.write(f'<Module name="{module.name}"')
 
         if module.callsuperinit != 'undefined':
             self.save_attribute('callsuperinit',
                     '1' if module.callsuperinit == 'yes' else '0', output)
 
-        self.save_str('keywordarguments', output)
-        self.save_str('virtualerrorhandler', output)
-        self.save_bool('uselimitedapi', output)
-        self.save_bool('pyssizetclean', output)
-        self.save_str_list('imports', output)
+        self.save_str(module, 'keywordarguments', output)
+        self.save_str(module, 'virtualerrorhandler', output)
+        self.save_bool(module, 'uselimitedapi', output)
+        self.save_bool(module, 'pyssizetclean', output)
+        self.save_str_list(module, 'imports', output)
         output.write('>\n')
         output += 1
 
-        self.save_literal('directives', output)
+        self.save_literal(module, 'directives', output)
 
         for sip_file in module.content:
-            adapt(sip_file).save(output)
+            adapt(sip_file).save(sip_file, output)
 
         output -= 1
         output.write('</Module>\n')
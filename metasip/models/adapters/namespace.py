@@ -41,37 +41,25 @@ class NamespaceAdapter(BaseApiAdapter):
         'Variable':         Variable,
     }
 
-    def __eq__(self, other):
-        """ Compare for C/C++ equality. """
-
-        namespace = self.model
-        other_namespace = other.model
-
-        if type(namespace) is not type(other_namespace):
-            return False
-
-        if namespace.name != other_namespace.name:
-            return False
+    def signature(self, namespace):
+        """ Return the hashable signature used to compare for C/C++ equality.
+        """
 
-        return True
+        return (type(namespace), namespace.name)
 
-    def as_str(self):
+    def as_str(self, namespace):
         """ Return the standard string representation. """
 
-        namespace = self.model
+        return 'namespace ' + namespace.name + adapt(namespace, Annos).as_str(namespace)
 
-        return 'namespace ' + namespace.name + adapt(namespace, Annos).as_str()
-
-    def generate_sip(self, sip_file, output):
+    def generate_sip(self, namespace, sip_file, output):
         """ Generate the .sip file content. """
 
-        namespace = self.model
-
-        nr_ends = self.version_start(output)
+        nr_ends = self.version_start(namespace, output)
 
         output.blank()
 
-        output.write(self.as_str())
+        output.write(self.as_str(namespace))
         output.write('\n{\n')
 
         output.write('%TypeHeaderCode\n', indent=False)
@@ -89,7 +77,7 @@ class NamespaceAdapter(BaseApiAdapter):
 
         for api in namespace.content:
             if api.status == '':
-                adapt(api).generate_sip(sip_file, output)
+                adapt(api).generate_sip(api, sip_file, output)
 
         output -= 1
 
@@ -99,32 +87,30 @@ class NamespaceAdapter(BaseApiAdapter):
 
         self.version_end(nr_ends, output)
 
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        super().load(element, project, ui)
+        super().load(model, element, project, ui)
 
-        adapt(self.model, Code).load(element, project, ui)
-        adapt(self.model, CodeContainer).load(self._TAG_CODE_MAP, element,
+        adapt(model, Code).load(model, element, project, ui)
+        adapt(model, CodeContainer).load(model, self._TAG_CODE_MAP, element,
                 project, ui)
 
-    def save(self, output):
+    def save(self, namespace, output):
         """ Save the model to an output file. """
 
-        namespace = self.model
-
         output.write('<Namespace')
-        adapt(namespace, Code).save_attributes(output)
-        adapt(namespace, CodeContainer).save_attributes(output)
+        adapt(namespace, Code).save_attributes(namespace, output)
+        adapt(namespace, CodeContainer).save_attributes(namespace, output)
         self.save_attribute('name', namespace.name, output)
         output.write('>\n')
 
         output += 1
-        self.save_literal('typeheadercode', output)
-        adapt(namespace, Code).save_subelements(output)
-        adapt(namespace, CodeContainer).save_subelements(output)
+        self.save_literal(namespace, 'typeheadercode', output)
+        adapt(namespace, Code).save_subelements(namespace, output)
+        adapt(namespace, CodeContainer).save_subelements(namespace, output)
         output -= 1
 
         output.write('</Namespace>\n')
@@ -19,64 +19,49 @@ class OpaqueClassAdapter(BaseApiAdapter):
         'name': AttributeType.STRING,
     }
 
-    def __eq__(self, other):
-        """ Compare for C/C++ equality. """
-
-        klass = self.model
-        other_klass = other.model
-
-        if type(klass) is not type(other_klass):
-            return False
-
-        if klass.access != other_klass.access:
-            return False
-
-        if klass.name != other_klass.name:
-            return False
+    def signature(self, klass):
+        """ Return the hashable signature used to compare for C/C++ equality.
+        """
 
-        return True
+        return (type(klass), klass.access, klass.name)
 
-    def as_str(self):
+    def as_str(self, opaque_class):
         """ Return the standard string representation. """
 
-        opaque_class = self.model
-
-        return 'class ' + opaque_class.name + adapt(opaque_class, Annos).as_str()
+        return 'class ' + opaque_class.name + adapt(opaque_class, Annos).as_str(opaque_class)
 
-    def generate_sip(self, sip_file, output):
+    def generate_sip(self, model, sip_file, output):
         """ Generate the .sip file content. """
 
-        nr_ends = self.version_start(output)
+        nr_ends = self.version_start(model, output)
 
-        output.write(self.as_str())
+        output.write(self.as_str(model))
         output.write(';\n')
 
         self.version_end(nr_ends, output)
 
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        super().load(element, project, ui)
+        super().load(model, element, project, ui)
 
-        adapt(self.model, Code).load(element, project, ui)
-        adapt(self.model, Access).load(element, project, ui)
+        adapt(model, Code).load(model, element, project, ui)
+        adapt(model, Access).load(model, element, project, ui)
 
-    def save(self, output):
+    def save(self, opaque_class, output):
         """ Save the model to an output file. """
 
-        opaque_class = self.model
-
         output.write('<OpaqueClass')
-        adapt(opaque_class, Code).save_attributes(output)
-        adapt(opaque_class, Access).save_attributes(output)
+        adapt(opaque_class, Code).save_attributes(opaque_class, output)
+        adapt(opaque_class, Access).save_attributes(opaque_class, output)
         self.save_attribute('name', opaque_class.name, output)
         output.write('>\n')
 
         output += 1
-        adapt(opaque_class, Code).save_subelements(output)
-        adapt(opaque_class, Access).save_subelements(output)
+        adapt(opaque_class, Code).save_subelements(opaque_class, output)
+        adapt(opaque_class, Access).save_subelements(opaque_class, output)
         output -= 1
 
         output.write('</OpaqueClass>\n')
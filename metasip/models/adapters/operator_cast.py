@@ -18,74 +18,57 @@ class OperatorCastAdapter(BaseApiAdapter):
         'const':    AttributeType.BOOL,
     }
 
-    def __eq__(self, other):
-        """ Compare for C/C++ equality. """
-
-        cast = self.model
-        other_cast = other.model
-
-        if type(cast) is not type(other_cast):
-            return False
-
-        if adapt(cast, Callable) != adapt(other_cast, Callable):
-            return False
-
-        if cast.const != other_cast.const:
-            return False
+    def signature(self, cast):
+        """ Return the hashable signature used to compare for C/C++ equality.
+        """
 
-        return True
+        return (type(cast), adapt(cast, Callable).signature(cast), cast.const)
 
-    def as_str(self):
+    def as_str(self, cast):
         """ Return the standard string representation. """
 
-        cast = self.model
-
-        s = 'operator ' + adapt(cast, Callable).as_str()
+        s = 'operator ' + adapt(cast, Callable).as_str(cast)
 
         if cast.const:
             s += ' const'
 
         return s
 
-    def generate_sip(self, sip_file, output):
+    def generate_sip(self, cast, sip_file, output):
         """ Generate the .sip file content. """
 
-        cast = self.model
+        nr_ends = self.version_start(cast, output)
 
-        nr_ends = self.version_start(output)
-
-        output.write(self.as_str())
+        output.write(self.as_str(cast))
         output.write(';\n')
 
-        adapt(cast, Callable).generate_sip_directives(output)
-        adapt(cast, Access).generate_sip_directives(output)
+        adapt(cast, Callable).generate_sip_directives(cast, output)
+        adapt(cast, Access).generate_sip_directives(cast, output)
 
         self.version_end(nr_ends, output)
 
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        super().load(element, project, ui)
+        super().load(model, element, project, ui)
 
-        adapt(self.model, Callable).load(element, project, ui)
-        adapt(self.model, Access).load(element, project, ui)
+        adapt(model, Callable).load(model, element, project, ui)
+        adapt(model, Access).load(model, element, project, ui)
 
-    def save(self, output):
+    def save(self, cast, output):
         """ Save the model to an output file. """
 
-        cast = self.model
-
         output.write('<OperatorCast')
-        adapt(cast, Callable).save_attributes(output)
-        adapt(cast, Access).save_attributes(output)
-        self.save_bool('const', output)
+        adapt(cast, Callable).save_attributes(cast, output)
+        adapt(cast, Access).save_attributes(cast, output)
+        self.save_bool(cast, 'const', output)
         output.write('>\n')
 
         output += 1
-        adapt(cast, Callable).save_subelements(output)
-        adapt(cast, Access).save_subelements(output)
+        adapt(cast, Callable).save_subelements(cast, output)
+        adapt(cast, Access).save_subelements(cast, output)
         output -= 1
 
         output.write('</OperatorCast>\n')
@@ -13,75 +13,61 @@ from .base_adapter import BaseApiAdapter
 class OperatorFunctionAdapter(BaseApiAdapter):
     """ This is the OperatorFunction adapter. """
 
-    def __eq__(self, other):
-        """ Compare for C/C++ equality. """
-
-        function = self.model
-        other_function = other.model
-
-        if type(function) is not type(other_function):
-            return False
-
-        if adapt(function, Callable) != adapt(other_function, Callable):
-            return False
+    def signature(self, function):
+        """ Return the hashable signature used to compare for C/C++ equality.
+        """
 
-        return True
+        return (type(function), adapt(function, Callable).signature(function))
 
-    def as_str(self):
+    def as_str(self, function):
         """ Return the standard string representation. """
 
-        function = self.model
-
         callable_adapter = adapt(function, Callable)
 
-        s = callable_adapter.return_type_as_str(allow_py=True) + 'operator' + function.name
+        s = callable_adapter.return_type_as_str(function, allow_py=True) + 'operator' + function.name
 
         if function.pyargs != '':
             s += function.pyargs
         else:
-            args = ', '.join([adapt(arg).as_py_str() for arg in function.args])
+            args = ', '.join([adapt(arg).as_py_str(arg) for arg in function.args])
             s += '(' + args + ')'
 
-        s += adapt(function, Annos).as_str()
+        s += adapt(function, Annos).as_str(function)
 
-        if callable_adapter.has_different_signatures():
-            return_type = callable_adapter.return_type_as_str().strip()
-            args = ', '.join([adapt(arg).as_str() for arg in function.args])
+        if callable_adapter.has_different_signatures(function):
+            return_type = callable_adapter.return_type_as_str(function).strip()
+            args = ', '.join([adapt(arg).as_str(arg) for arg in function.args])
             s += f' [{return_type} ({args})]'
 
         return s
 
-    def generate_sip(self, sip_file, output):
+    def generate_sip(self, function, sip_file, output):
         """ Generate the .sip file content. """
 
-        function = self.model
-
-        nr_ends = self.version_start(output)
+        nr_ends = self.version_start(function, output)
 
-        output.write(self.as_str())
+        output.write(self.as_str(function))
         output.write(';\n')
-        adapt(function, Callable).generate_sip_directives(output)
+        adapt(function, Callable).generate_sip_directives(function, output)
 
         self.version_end(nr_ends, output)
 
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        adapt(self.model, Callable).load(element, project, ui)
+        adapt(model, Callable).load(model, element, project, ui)
 
-    def save(self, output):
+    def save(self, function, output):
         """ Save the model to an output file. """
 
-        function = self.model
-
         output.write('<OperatorFunction')
-        adapt(function, Callable).save_attributes(output)
+        adapt(function, Callable).save_attributes(function, output)
         output.write('>\n')
 
         output += 1
-        adapt(function, Callable).save_subelements(output)
+        adapt(function, Callable).save_subelements(function, output)
         output -= 1
 
         output.write('</OperatorFunction>\n')
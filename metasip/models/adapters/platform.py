@@ -16,10 +16,10 @@ class PlatformAdapter(BaseAdapter):
         'parserargs':       AttributeType.STRING,
     }
 
-    def save(self, output):
+    def save(self, model, output):
         """ Save the model to an output file. """
 
-        output.write(f'<Platform name="{self.model.name}"')
-        self.save_str('inputdirpattern', output)
-        self.save_str('parserargs', output)
+        output.write(f'<Platform name="{model.name}"')
+        self.save_str(model, 'inputdirpattern', output)
+        self.save_str(model, 'parserargs', output)
         output.write('/>\n')
@@ -25,12 +25,12 @@ class ProjectAdapter(BaseAdapter):
         'versions':             AttributeType.STRING_LIST,
     }
 
-    def as_str(self):
+    def as_str(self, model):
         """ Return the standard string representation. """
 
-        return self.model.rootmodule
+        return model.rootmodule
 
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
@@ -38,25 +38,24 @@ class ProjectAdapter(BaseAdapter):
         # Initialise any UI for the load.
         if ui is not None:
             # Each .sip file is a step of the load.
-            ui.load_starting(self.model, len(element.findall('.//SipFile')))
+            ui.load_starting(model, len(element.findall('.//SipFile')))
 
-        super().load(element, project, ui)
+        super().load(model, element, project, ui)
 
         for subelement in element:
             if subelement.tag == 'HeaderDirectory':
                 header_directory = HeaderDirectory()
-                adapt(header_directory).load(subelement, project, ui)
-                self.model.headers.append(header_directory)
+                adapt(header_directory).load(header_directory, subelement,
+                        project, ui)
+                model.headers.append(header_directory)
             elif subelement.tag == 'Module':
                 module = Module()
-                adapt(module).load(subelement, project, ui)
-                self.model.modules.append(module)
+                adapt(module).load(module, subelement, project, ui)
+                model.modules.append(module)
 
-    def save(self, output):
+    def save(self, project, output):
         """ Save the model to an output file. """
 
-        project = self.model
-
         # Note that we always use the current project version.
         major_version, minor_version = ProjectVersion
         if major_version == 0:
@@ -67,21 +66,21 @@ class ProjectAdapter(BaseAdapter):
         output.write('<?xml version="1.0"?>\n')
         output.write(
                 f'<Project {format_version} rootmodule="{project.rootmodule}"')
-        self.save_str_list('versions', output)
-        self.save_str_list('platforms', output)
-        self.save_str_list('features', output)
-        self.save_str_list('externalmodules', output)
-        self.save_str_list('externalfeatures', output)
+        self.save_str_list(project, 'versions', output)
+        self.save_str_list(project, 'platforms', output)
+        self.save_str_list(project, 'features', output)
+        self.save_str_list(project, 'externalmodules', output)
+        self.save_str_list(project, 'externalfeatures', output)
         output.write('>\n')
         output += 1
 
-        self.save_literal('sipcomments', output)
+        self.save_literal(project, 'sipcomments', output)
 
         for header_directory in project.headers:
-            adapt(header_directory).save(output)
+            adapt(header_directory).save(header_directory, output)
 
         for module in project.modules:
-            adapt(module).save(output)
+            adapt(module).save(module, output)
 
         output -= 1
         output.write('</Project>\n')
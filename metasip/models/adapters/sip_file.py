@@ -47,44 +47,42 @@ class SipFileAdapter(BaseAdapter):
         'Variable':         Variable,
     }
 
-    def as_str(self):
+    def as_str(self, model):
         """ Return the standard string representation. """
 
-        return self.model.name
+        return model.name
 
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        super().load(element, project, ui)
+        super().load(model, element, project, ui)
 
-        adapt(self.model, CodeContainer).load(self._TAG_CODE_MAP, element,
+        adapt(model, CodeContainer).load(model, self._TAG_CODE_MAP, element,
                 project, ui)
 
         # Progress any UI for the load.
         if ui is not None:
             ui.load_step()
 
-    def save(self, output):
+    def save(self, sip_file, output):
         """ Save the model to an output file. """
 
-        sip_file = self.model
-
         output.write(f'<SipFile name="{sip_file.name}"')
-        adapt(sip_file, CodeContainer).save_attributes(output)
+        adapt(sip_file, CodeContainer).save_attributes(sip_file, output)
         output.write('>\n')
 
         output += 1
-        adapt(sip_file, CodeContainer).save_subelements(output)
-        self.save_literal('exportedheadercode', output)
-        self.save_literal('moduleheadercode', output)
-        self.save_literal('modulecode', output)
-        self.save_literal('preinitcode', output)
-        self.save_literal('initcode', output)
-        self.save_literal('postinitcode', output)
-        self.save_literal('exportedtypehintcode', output)
-        self.save_literal('typehintcode', output)
+        adapt(sip_file, CodeContainer).save_subelements(sip_file, output)
+        self.save_literal(sip_file, 'exportedheadercode', output)
+        self.save_literal(sip_file, 'moduleheadercode', output)
+        self.save_literal(sip_file, 'modulecode', output)
+        self.save_literal(sip_file, 'preinitcode', output)
+        self.save_literal(sip_file, 'initcode', output)
+        self.save_literal(sip_file, 'postinitcode', output)
+        self.save_literal(sip_file, 'exportedtypehintcode', output)
+        self.save_literal(sip_file, 'typehintcode', output)
         output -= 1
 
         output.write('</SipFile>\n')
@@ -3,54 +3,50 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
-from ...helpers import version_range
+from ...helpers import (interned_tags, interned_version_range,
+        interned_version_ranges, version_range)
 
-from ..version_range import VersionRange
-
-from .base_adapter import AttributeType, BaseAdapter
+from .base_adapter import BaseAdapter
 
 
 class TaggedAdapter(BaseAdapter):
     """ This is the Tagged adapter. """
 
-    # The map of attribute names and types.
-    ATTRIBUTE_TYPE_MAP = {
-        'features':     AttributeType.STRING_LIST,
-        'platforms':    AttributeType.STRING_LIST,
-    }
-
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        # Load the simple attributes.
-        super().load(element, project, ui)
+        # The tuples are shared by all API items with the same tags.
+        for name in ('features', 'platforms'):
+            value = element.get(name)
+
+            if value is not None:
+                setattr(model, name, interned_tags(value.split()))
 
-        versions = element.get('versions')
+        value = element.get('versions')
 
-        if versions is not None:
-            for version in versions.split():
-                version_range = VersionRange()
-                version_range.startversion, version_range.endversion = version.split('-')
-                self.model.versions.append(version_range)
+        if value is not None:
+            model.versions = interned_version_ranges(
+                    [interned_version_range(*version.split('-'))
+                            for version in value.split()])
 
-    def save_attributes(self, output):
+    def save_attributes(self, model, output):
         """ Save the XML attributes. """
 
-        versions = self.versions_as_str(as_xml=True)
+        versions = self.versions_as_str(model, as_xml=True)
         if versions != '':
             self.save_attribute('versions', versions, output)
 
-        self.save_str_list('platforms', output)
-        self.save_str_list('features', output)
+        self.save_str_list(model, 'platforms', output)
+        self.save_str_list(model, 'features', output)
 
-    def versions_as_str(self, as_xml=False):
+    def versions_as_str(self, model, as_xml=False):
         """ Return the standard string representation of the versions. """
 
         version_ranges = []
 
-        for version in self.model.versions:
+        for version in model.versions:
             version_range_s = version_range(version)
 
             if as_xml:
@@ -20,69 +20,52 @@ class TypedefAdapter(BaseApiAdapter):
         'type': AttributeType.STRING,
     }
 
-    def __eq__(self, other):
-        """ Compare for C/C++ equality. """
-
-        typedef = self.model
-        other_typedef = other.model
-
-        if type(typedef) is not type(other_typedef):
-            return False
-
-        if typedef.name != other_typedef.name:
-            return False
-
-        if self.expand_type(typedef.type) != self.expand_type(other_typedef.type):
-            return False
+    def signature(self, typedef):
+        """ Return the hashable signature used to compare for C/C++ equality.
+        """
 
-        return True
+        return (type(typedef), typedef.name, self.expand_type(typedef.type))
 
-    def as_str(self):
+    def as_str(self, typedef):
         """ Return the standard string representation. """
 
-        typedef = self.model
-
-        return 'typedef ' + self.expand_type(typedef.type, typedef.name) + adapt(typedef, Annos).as_str()
+        return 'typedef ' + self.expand_type(typedef.type, typedef.name) + adapt(typedef, Annos).as_str(typedef)
 
-    def generate_sip(self, sip_file, output):
+    def generate_sip(self, typedef, sip_file, output):
         """ Generate the .sip file content. """
 
-        typedef = self.model
+        nr_ends = self.version_start(typedef, output)
 
-        nr_ends = self.version_start(output)
-
-        output.write(self.as_str())
+        output.write(self.as_str(typedef))
         output.write(';\n')
 
-        adapt(typedef, Docstring).generate_sip_directives(output)
+        adapt(typedef, Docstring).generate_sip_directives(typedef, output)
 
         self.version_end(nr_ends, output)
 
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        super().load(element, project, ui)
+        super().load(model, element, project, ui)
 
-        adapt(self.model, Code).load(element, project, ui)
-        adapt(self.model, Docstring).load(element, project, ui)
+        adapt(model, Code).load(model, element, project, ui)
+        adapt(model, Docstring).load(model, element, project, ui)
 
-    def save(self, output):
+    def save(self, typedef, output):
         """ Save the model to an output file. """
 
-        typedef = self.model
-
         output.write('<Typedef')
-        adapt(typedef, Code).save_attributes(output)
-        adapt(typedef, Docstring).save_attributes(output)
+        adapt(typedef, Code).save_attributes(typedef, output)
+        adapt(typedef, Docstring).save_attributes(typedef, output)
         self.save_attribute('name', typedef.name, output)
         self.save_attribute('type', typedef.type, output)
         output.write('>\n')
 
         output += 1
-        adapt(typedef, Code).save_subelements(output)
-        adapt(typedef, Docstring).save_subelements(output)
+        adapt(typedef, Code).save_subelements(typedef, output)
+        adapt(typedef, Docstring).save_subelements(typedef, output)
         output -= 1
 
         output.write('</Typedef>\n')
@@ -24,49 +24,29 @@ class VariableAdapter(BaseApiAdapter):
         'type':         AttributeType.STRING,
     }
 
-    def __eq__(self, other):
-        """ Compare for C/C++ equality. """
-
-        variable = self.model
-        other_variable = other.model
-
-        if type(variable) is not type(other_variable):
-            return False
-
-        if variable.access != other_variable.access:
-            return False
-
-        if variable.name != other_variable.name:
-            return False
-
-        if self.expand_type(variable.type) != self.expand_type(other_variable.type):
-            return False
-
-        if variable.static != other_variable.static:
-            return False
+    def signature(self, variable):
+        """ Return the hashable signature used to compare for C/C++ equality.
+        """
 
-        return True
+        return (type(variable), variable.access, variable.name,
+                self.expand_type(variable.type), variable.static)
 
-    def as_str(self):
+    def as_str(self, variable):
         """ Return the standard string representation. """
 
-        variable = self.model
-
-        s = self.expand_type(variable.type, variable.name) + adapt(variable, Annos).as_str()
+        s = self.expand_type(variable.type, variable.name) + adapt(variable, Annos).as_str(variable)
 
         if variable.static:
             s = 'static ' + s
 
         return s
 
-    def generate_sip(self, sip_file, output):
+    def generate_sip(self, variable, sip_file, output):
         """ Generate the .sip file content. """
 
-        variable = self.model
+        nr_ends = self.version_start(variable, output)
 
-        nr_ends = self.version_start(output)
-
-        output.write(self.as_str())
+        output.write(self.as_str(variable))
 
         need_brace = variable.accesscode != '' or variable.getcode != '' or variable.setcode != ''
 
@@ -84,35 +64,33 @@ class VariableAdapter(BaseApiAdapter):
 
         self.version_end(nr_ends, output)
 
-    def load(self, element, project, ui):
+    def load(self, model, element, project, ui):
         """ Load the model from the XML element.  An optional user interface
         may be available to inform the user of progress.
         """
 
-        super().load(element, project, ui)
+        super().load(model, element, project, ui)
 
-        adapt(self.model, Code).load(element, project, ui)
-        adapt(self.model, Access).load(element, project, ui)
+        adapt(model, Code).load(model, element, project, ui)
+        adapt(model, Access).load(model, element, project, ui)
 
-    def save(self, output):
+    def save(self, variable, output):
         """ Save the model to an output file. """
 
-        variable = self.model
-
         output.write('<Variable')
-        adapt(variable, Code).save_attributes(output)
-        adapt(variable, Access).save_attributes(output)
+        adapt(variable, Code).save_attributes(variable, output)
+        adapt(variable, Access).save_attributes(variable, output)
         self.save_attribute('name', variable.name, output)
         self.save_attribute('type', variable.type, output)
-        self.save_bool('static', output)
+        self.save_bool(variable, 'static', output)
         output.write('>\n')
 
         output += 1
-        adapt(variable, Code).save_subelements(output)
-        adapt(variable, Access).save_subelements(output)
-        self.save_literal('accesscode', output)
-        self.save_literal('getcode', output)
-        self.save_literal('setcode', output)
+        adapt(variable, Code).save_subelements(variable, output)
+        adapt(variable, Access).save_subelements(variable, output)
+        self.save_literal(variable, 'accesscode', output)
+        self.save_literal(variable, 'getcode', output)
+        self.save_literal(variable, 'setcode', output)
         output -= 1
 
         output.write('</Variable>\n')
@@ -15,12 +15,12 @@ class WorkflowAdapter(BaseAdapter):
         'status':   AttributeType.STRING,
     }
 
-    def save_attributes(self, output):
+    def save_attributes(self, model, output):
         """ Save the XML attributes. """
 
-        self.save_str('status', output)
+        self.save_str(model, 'status', output)
 
-    def save_subelements(self, output):
+    def save_subelements(self, model, output):
         """ Save the XML subelements. """
 
-        self.save_literal('comments', output)
+        self.save_literal(model, 'comments', output)
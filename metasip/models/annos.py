@@ -10,5 +10,8 @@ from dataclasses import dataclass
 class Annos:
     """ This class is a mixin for API models that may have SIP annotations. """
 
+    # The slots are defined by the sub-classes.
+    __slots__ = ()
+
     # The annotations.
     annos: str = ''
@@ -3,12 +3,11 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
-from dataclasses import dataclass
-
 from .annos import Annos
+from .slotted_dataclass import slotted_dataclass
 
 
-@dataclass
+@slotted_dataclass
 class Argument(Annos):
     """ This class implements an argument of a callable. """
 
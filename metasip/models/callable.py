@@ -16,6 +16,9 @@ class Callable(Code):
     everything except destructors).
     """
 
+    # The slots are defined by the sub-classes.
+    __slots__ = ()
+
     # The C/C++ arguments.
     args: List[Argument] = field(default_factory=list)
 
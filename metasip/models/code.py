@@ -15,3 +15,6 @@ class Code(Annos, Tagged, Workflow):
     """ This class implements APIs that can be annotated, are subject to
     version control and a workflow.
     """
+
+    # The slots are defined by the sub-classes.
+    __slots__ = ()
@@ -10,5 +10,8 @@ from dataclasses import dataclass
 class Docstring:
     """ This class is a mixin for APIs that can have a docstring. """
 
+    # The slots are defined by the sub-classes.
+    __slots__ = ()
+
     # The optional doc string.
     docstring: str = ''
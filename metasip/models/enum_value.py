@@ -3,14 +3,13 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
-from dataclasses import dataclass
-
 from .annos import Annos
+from .slotted_dataclass import slotted_dataclass
 from .tagged import Tagged
 from .workflow import Workflow
 
 
-@dataclass
+@slotted_dataclass
 class EnumValue(Annos, Tagged, Workflow):
     """ This class implements an enum value. """
 
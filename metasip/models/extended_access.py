@@ -12,6 +12,9 @@ class ExtendedAccess:
     specific) C++ access specifiers.
     """
 
+    # The slots are defined by the sub-classes.
+    __slots__ = ()
+
     # The access specifier.  Values are '' (meaning public), 'protected',
     # 'protected slots', 'private', 'public slots', 'signals'.
     access: str = ''
@@ -3,12 +3,11 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
-from dataclasses import dataclass
-
 from .callable import Callable
 from .docstring import Docstring
+from .slotted_dataclass import slotted_dataclass
 
 
-@dataclass
+@slotted_dataclass
 class Function(Callable, Docstring):
     """ This class implements a global C/C++ function. """
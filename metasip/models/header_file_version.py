@@ -3,10 +3,10 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
-from dataclasses import dataclass
+from .slotted_dataclass import slotted_dataclass
 
 
-@dataclass
+@slotted_dataclass
 class HeaderFileVersion:
     """ This class implements a single version of a C/C++ .h file. """
 
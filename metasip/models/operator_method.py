@@ -3,13 +3,12 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
-from dataclasses import dataclass
-
 from .access import Access
 from .callable import Callable
+from .slotted_dataclass import slotted_dataclass
 
 
-@dataclass
+@slotted_dataclass
 class OperatorMethod(Callable, Access):
     """ This class implements a C++ class operator. """
 
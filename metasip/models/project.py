@@ -3,15 +3,16 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
-from dataclasses import dataclass, field
-from typing import List, Tuple
+from dataclasses import field
+from typing import Any, List, Tuple
 
 from .header_directory import HeaderDirectory
 from .module import Module
 from .project_version import ProjectVersion
+from .slotted_dataclass import slotted_dataclass
 
 
-@dataclass
+@slotted_dataclass
 class Project:
     """ This class implements a project. """
 
@@ -52,3 +53,8 @@ class Project:
 
     # The ordered list of versions.
     versions: List[str] = field(default_factory=list)
+
+    # The index of the versions used by version maps.  It is created when first
+    # needed and must be discarded whenever the versions are changed.  Note
+    # that this isn't part of the project file itself.
+    version_index: Any = field(default=None, compare=False, repr=False)
@@ -3,12 +3,11 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
-from dataclasses import dataclass
-
 from .code_container import CodeContainer
+from .slotted_dataclass import slotted_dataclass
 
 
-@dataclass
+@slotted_dataclass
 class SipFile(CodeContainer):
     """ This class implements a .sip file. """
 
@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
+
+
+from dataclasses import dataclass, fields
+
+
+def slotted_dataclass(cls=None, *, frozen=False):
+    """ A class decorator that creates a dataclass whose instances store their
+    fields in slots rather than a dict.  This is the equivalent of
+    dataclass(slots=True) which requires Python v3.10.  A base class (i.e. one
+    of the mixins) must instead be a dataclass with an empty __slots__.  Note
+    that only one slotted class can appear in a class hierarchy.  The memory
+    saved is measured by benchmarks/model_memory.py.
+    """
+
+    if cls is None:
+        return lambda cls: _slotted_dataclass(cls, frozen)
+
+    return _slotted_dataclass(cls, frozen)
+
+
+def _slotted_dataclass(cls, frozen):
+    """ Return a slotted version of a dataclass. """
+
+    cls = dataclass(cls, frozen=frozen)
+
+    # The slots can only be added by creating a new class.
+    cls_dict = dict(cls.__dict__)
+
+    slots = tuple(f.name for f in fields(cls))
+    cls_dict['__slots__'] = slots
+
+    # Remove the default values of the fields (which would otherwise conflict
+    # with the slots) and the descriptors that the slots replace.
+    for name in slots + ('__dict__', '__weakref__'):
+        cls_dict.pop(name, None)
+
+    if frozen:
+        # Pickle would otherwise restore the state using setattr().
+        cls_dict['__getstate__'] = _frozen_getstate
+        cls_dict['__setstate__'] = _frozen_setstate
+
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+def _frozen_getstate(self):
+    """ Return the state of a frozen instance. """
+
+    return tuple(getattr(self, name) for name in self.__slots__)
+
+
+def _frozen_setstate(self, state):
+    """ Restore the state of a frozen instance. """
+
+    for name, value in zip(self.__slots__, state):
+        object.__setattr__(self, name, value)
@@ -3,8 +3,8 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
-from dataclasses import dataclass, field
-from typing import List
+from dataclasses import dataclass
+from typing import Tuple
 
 from .version_range import VersionRange
 
@@ -15,18 +15,23 @@ class Tagged:
     statement).
     """
 
-    # The optional list of logically or-ed features that the API item is
+    # The slots are defined by the sub-classes.
+    __slots__ = ()
+
+    # The optional tuple of logically or-ed features that the API item is
     # limited to.  A feature may be preceded by "!" to indicate the logical
-    # inverse.
-    features: List[str] = field(default_factory=list)
+    # inverse.  Note that the tuples of features, platforms and version ranges
+    # are immutable because they are shared between API items (see
+    # metasip.helpers.interned) and so must be replaced rather than modified.
+    features: Tuple[str, ...] = ()
 
-    # The optional list of logically or-ed platforms that the API item is
+    # The optional tuple of logically or-ed platforms that the API item is
     # limited to.  Note that SIP supports inverting a platform, as does the
     # MetaSIP platforms tool, but the MetaSIP UI for picking a platform doesn't
     # yet.
-    platforms: List[str] = field(default_factory=list)
+    platforms: Tuple[str, ...] = ()
 
-    # The optional list of logically and-ed version ranges.  Note that SIP
+    # The optional tuple of logically and-ed version ranges.  Note that SIP
     # supports multiple ranges, as does the MetaSIP versions tool, but the
     # MetaSIP UI for picking a version range doesn't yet.
-    versions: List[VersionRange] = field(default_factory=list)
+    versions: Tuple[VersionRange, ...] = ()
@@ -3,13 +3,12 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
-from dataclasses import dataclass
-
 from .code import Code
 from .docstring import Docstring
+from .slotted_dataclass import slotted_dataclass
 
 
-@dataclass
+@slotted_dataclass
 class Typedef(Code, Docstring):
     """ This class implements a typedef. """
 
@@ -3,12 +3,12 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
-from dataclasses import dataclass
+from .slotted_dataclass import slotted_dataclass
 
 
-@dataclass
+@slotted_dataclass(frozen=True)
 class VersionRange:
-    """ This class implements a range of versions. """
+    """ This class implements an immutable range of versions. """
 
     # The end version.
     endversion: str = ''
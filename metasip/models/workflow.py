@@ -10,6 +10,9 @@ from dataclasses import dataclass
 class Workflow:
     """ This class is a mixin for APIs that are subject to a workflow. """
 
+    # The slots are defined by the sub-classes.
+    __slots__ = ()
+
     # The multiline comments included in generated .sip files.
     comments: str = ''
 
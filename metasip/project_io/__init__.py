@@ -4,6 +4,6 @@
 
 
 from .abstract_project_ui import AbstractProjectUi
-from .generate_sip_files import generate_sip_files
+from .generate_sip_files import generate_sip_files, project_file_key
 from .load_project import load_project
 from .save_project import save_project
@@ -3,28 +3,69 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+import hashlib
+import io
+import json
 import os
+import pickle
 
+from .._version import version
 from ..exceptions import UserException
 from ..helpers import VersionMap, version_range
 from ..models import Enum, Function, Variable
 from ..models.adapters import adapt
 
 from .indent_file import IndentFile
+from .model_pickler import ModelPickler
 
 
-def generate_sip_files(project, output_dir, ignored_modules, verbose):
-    """ Generate the .sip files for a project. """
+# The name of the file, in the output directory, containing the signatures of
+# the generated .sip files.
+_MANIFEST_NAME = '.msipgen-manifest.json'
+
+
+def generate_sip_files(project, output_dir, ignored_modules, verbose,
+        jobs=1, project_key=None):
+    """ Generate the .sip files for a project.  If jobs is greater than 1 then
+    the files are generated concurrently by that number of processes.  A .sip
+    file is only generated if the parts of the project that determine its
+    contents have changed since it was last generated.  project_key is the
+    optional value returned by project_file_key() before the project was
+    loaded.  If it is given, the project hasn't been changed since and the
+    project file hasn't been changed since the .sip files were last generated
+    then their signatures aren't calculated at all.
+    """
 
     if ignored_modules is None:
         ignored_modules = []
 
-    for module in project.modules:
+    manifest, manifest_project_key = _load_manifest(output_dir)
+
+    if project.dirty:
+        project_key = None
+
+    project_unchanged = (project_key is not None and
+            project_key == manifest_project_key)
+
+    # Everything that may affect the contents of a .sip file apart from the
+    # module and SipFile it is generated from.  The name of the project and
+    # its dirty state are excluded because they have no effect.
+    inputs = _signature(version,
+            _field_values(project,
+                    excluding=('name', 'dirty', 'headers', 'modules')))
+
+    # Build the list of .sip files to generate in the order that progress
+    # messages are displayed.  Each entry is a 2-tuple of the name of the .sip
+    # file and the arguments to pass to _generate_file().  The arguments of
+    # an ignored module are None and the name is the message to display.
+    files = []
+
+    for module_nr, module in enumerate(project.modules):
         # See if the module should be ignored.
         if module.name in ignored_modules:
-            if verbose:
-                print(f"Ignoring {module.name}")
-
+            files.append((f"Ignoring {module.name}", None))
             continue
 
         # Create the module-specific output directory.
@@ -43,92 +84,297 @@ def generate_sip_files(project, output_dir, ignored_modules, verbose):
             pass
 
         # Generate .sip files for the module contents.
-        sip_file_names = []
+        for sip_file_nr, sip_file in enumerate(module.content):
+            file_name = _sip_file_name(sip_file)
+            pathname = os.path.join(module_output_dir, file_name)
 
-        for sip_file in module.content:
-            (file_name, _) = os.path.splitext(os.path.basename(sip_file.name))
-            file_name += '.sip'
-            sip_file_names.append(file_name)
+            files.append((file_name,
+                    (module_nr, sip_file_nr, pathname, inputs,
+                            manifest.get(pathname), project_unchanged)))
 
-            output = _create_sip_file(project, module, module_output_dir,
-                    file_name, verbose)
-            _generate_sip(sip_file, project, output)
-            output.close()
+        # Generate the .sip file defining the module itself.  This is
+        # identified by not having a .sip file number.
+        file_name = module.name + 'mod.sip'
+        pathname = os.path.join(module_output_dir, file_name)
 
-        # Generate the .sip file defining the module itself.
-        output = _create_sip_file(project, module, module_output_dir,
-                module.name + 'mod.sip', verbose)
+        files.append((file_name,
+                (module_nr, None, pathname, inputs, manifest.get(pathname),
+                        project_unchanged)))
 
-        root_name = project.rootmodule
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                initargs=(project, )) as executor:
+            futures = [executor.submit(_generate_file_in_worker, *args)
+                    if args is not None else None
+                    for _, args in files]
 
-        if root_name != '':
-            root_name += "."
+            # Wait for the results in order so that any progress messages are
+            # the same as if the files were generated serially.
+            for (file_name, args), future in zip(files, futures):
+                result = None if future is None else future.result()
+                _file_done(file_name, args, result, manifest, verbose)
+    else:
+        for file_name, args in files:
+            result = None if args is None else _generate_file(project, *args)
+            _file_done(file_name, args, result, manifest, verbose)
 
-        output.write('%Module(name=' + root_name + module.name)
+    if not project_unchanged:
+        # The signatures of any files that weren't generated (e.g. because
+        # their module was ignored) may not correspond to the project.
+        generated = {args[2] for _, args in files if args is not None}
+        manifest = {pathname: signature
+                for pathname, signature in manifest.items()
+                        if pathname in generated}
 
-        if module.callsuperinit != 'undefined':
-            output.write(', call_super_init=' + ('True' if module.callsuperinit == 'yes' else 'False'))
+    _save_manifest(output_dir, manifest, project_key)
 
-        if module.virtualerrorhandler != '':
-            output.write(', default_VirtualErrorHandler=' + module.virtualerrorhandler)
 
-        if module.keywordarguments != '':
-            output.write(f', keyword_arguments="{module.keywordarguments}"')
+def _file_done(file_name, args, result, manifest, verbose):
+    """ Handle the result of generating a .sip file. """
 
-        if module.uselimitedapi:
-            output.write(', use_limited_api=True')
+    if args is None:
+        if verbose:
+            # The name is the message.
+            print(file_name)
 
-        if module.pyssizetclean:
-            output.write(', py_ssize_t_clean=True')
+        return
 
-        output.write(')\n\n')
+    signature, generated = result
 
-        top_level_module = True
+    manifest[args[2]] = signature
 
-        if module.imports:
-            for imported in module.imports:
-                output.write(f'%Import {imported}/{imported}mod.sip\n')
+    if verbose:
+        if generated:
+            print(f"Generating '{file_name}'")
+        else:
+            print(f"Skipping unchanged '{file_name}'")
+
+
+def _generate_file(project, module_nr, sip_file_nr, pathname, inputs,
+        signature, project_unchanged):
+    """ Generate a single .sip file of a module.  If sip_file_nr is None then
+    the .sip file defining the module itself is generated.  inputs is the
+    project-wide part of the signature of the file's contents and signature is
+    the signature when the file was last generated (or None if it hasn't
+    been).  project_unchanged is set if the project is known to be unchanged
+    since then.  Return a 2-tuple of the new signature and True if the file was
+    generated.
+    """
 
-                if imported not in project.externalmodules:
-                    top_level_module = False
+    # Don't even calculate the signature if the project is unchanged.
+    if (project_unchanged and signature is not None and
+            os.path.isfile(pathname)):
+        return signature, False
+
+    module = project.modules[module_nr]
+
+    if sip_file_nr is None:
+        sip_file = None
+        new_signature = _signature(inputs,
+                _field_values(module, excluding=('content', )),
+                [_sip_file_name(sf) for sf in module.content])
+    else:
+        sip_file = module.content[sip_file_nr]
+        new_signature = _signature(inputs, module.name, sip_file)
+
+    # Don't touch the file if it already exists and would be unchanged.
+    if new_signature == signature and os.path.isfile(pathname):
+        return new_signature, False
+
+    output = _create_sip_file(project, module, pathname)
+
+    if sip_file is None:
+        _generate_module_sip(module, project, output)
+    else:
+        _generate_sip(sip_file, project, output)
+
+    output.close()
+
+    return new_signature, True
+
+
+def _generate_file_in_worker(module_nr, sip_file_nr, pathname, inputs,
+        signature, project_unchanged):
+    """ Generate a single .sip file of a module in a worker process. """
+
+    return _generate_file(_worker_project, module_nr, sip_file_nr, pathname,
+            inputs, signature, project_unchanged)
+
+
+def _signature(*values):
+    """ Return the signature of a sequence of values taken from a project.
+    The values are pickled so that every field of every model contributes to
+    the signature.
+    """
+
+    f = io.BytesIO()
+    ModelPickler(f, pickle.HIGHEST_PROTOCOL).dump(values)
+
+    return hashlib.md5(f.getvalue()).hexdigest()
+
+
+def _field_values(model, excluding):
+    """ Return a tuple of the values of the fields of a model excluding those
+    with the given names.
+    """
+
+    return tuple(getattr(model, field.name) for field in fields(model)
+            if field.compare and field.name not in excluding)
+
+
+def project_file_key(project_name):
+    """ Return the key that identifies the state of a project file or None if
+    it couldn't be determined.  It should be called before the project is
+    loaded so that the key is never newer than the model.
+    """
+
+    try:
+        stat = os.stat(project_name)
+    except OSError:
+        return None
+
+    return [os.path.abspath(project_name), stat.st_size, stat.st_mtime_ns]
+
+
+def _load_manifest(output_dir):
+    """ Return a 2-tuple of the manifest of the signatures of the .sip files
+    previously generated in an output directory and the key of the project
+    they were generated from (or None if it isn't known).  The manifest is a
+    dict keyed by the pathname of the .sip file.
+    """
+
+    try:
+        with open(os.path.join(output_dir, _MANIFEST_NAME),
+                encoding='UTF-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}, None
+
+    # Anything generated by a different version of metasip is out of date.
+    if not isinstance(manifest, dict) or manifest.get('version') != version:
+        return {}, None
+
+    files = manifest.get('files')
+    if not isinstance(files, dict):
+        return {}, None
+
+    files = {os.path.join(output_dir, name): signature
+            for name, signature in files.items()}
+
+    return files, manifest.get('project')
+
+
+def _save_manifest(output_dir, manifest, project_key):
+    """ Save the manifest of the signatures of the .sip files generated in an
+    output directory and the key of the project they were generated from.
+    """
+
+    manifest_name = os.path.join(output_dir, _MANIFEST_NAME)
+
+    files = {os.path.relpath(pathname, output_dir): signature
+            for pathname, signature in manifest.items()}
+
+    try:
+        with open(manifest_name, 'w', encoding='UTF-8') as f:
+            json.dump(
+                    {'version': version, 'project': project_key,
+                            'files': files},
+                    f, indent=1, sort_keys=True)
+    except OSError as e:
+        raise UserException(f"There was an error creating '{manifest_name}'",
+                detail=str(e)) from e
+
+
+# The project being generated by a worker process.
+_worker_project = None
+
+
+def _init_worker(project):
+    """ Initialise a worker process. """
+
+    global _worker_project
+
+    _worker_project = project
 
-            output.write('\n')
 
-        if top_level_module:
-            # Add any version, platform and feature information to all top
-            # level modules (ie. those that don't import anything).
+def _sip_file_name(sip_file):
+    """ Return the name of the .sip file generated for a SipFile. """
 
-            if project.versions:
-                versions = ' '.join(project.versions)
-                output.write(f'%Timeline {{{versions}}}\n\n')
+    (file_name, _) = os.path.splitext(os.path.basename(sip_file.name))
 
-            if project.platforms:
-                platforms = ' '.join(project.platforms)
-                output.write(f'%Platforms {{{platforms}}}\n\n')
+    return file_name + '.sip'
 
-            if project.features:
-                for feature in project.features:
-                    output.write(f'%Feature {feature}\n')
 
-                output.write('\n')
+def _generate_module_sip(module, project, output):
+    """ Generate the contents of the .sip file defining a module. """
 
-        if module.directives != '':
-            output.write(module.directives)
-            output.write('\n\n')
+    root_name = project.rootmodule
 
-        for file_name in sip_file_names:
-            output.write(f'%Include {file_name}\n')
+    if root_name != '':
+        root_name += "."
 
-        output.close()
+    output.write('%Module(name=' + root_name + module.name)
 
+    if module.callsuperinit != 'undefined':
+        output.write(', call_super_init=' + ('True' if module.callsuperinit == 'yes' else 'False'))
 
-def _create_sip_file(project, module, module_output_dir, file_name, verbose):
+    if module.virtualerrorhandler != '':
+        output.write(', default_VirtualErrorHandler=' + module.virtualerrorhandler)
+
+    if module.keywordarguments != '':
+        output.write(f', keyword_arguments="{module.keywordarguments}"')
+
+    if module.uselimitedapi:
+        output.write(', use_limited_api=True')
+
+    if module.pyssizetclean:
+        output.write(', py_ssize_t_clean=True')
+
+    output.write(')\n\n')
+
+    top_level_module = True
+
+    if module.imports:
+        for imported in module.imports:
+            output.write(f'%Import {imported}/{imported}mod.sip\n')
+
+            if imported not in project.externalmodules:
+                top_level_module = False
+
+        output.write('\n')
+
+    if top_level_module:
+        # Add any version, platform and feature information to all top level
+        # modules (ie. those that don't import anything).
+
+        if project.versions:
+            versions = ' '.join(project.versions)
+            output.write(f'%Timeline {{{versions}}}\n\n')
+
+        if project.platforms:
+            platforms = ' '.join(project.platforms)
+            output.write(f'%Platforms {{{platforms}}}\n\n')
+
+        if project.features:
+            for feature in project.features:
+                output.write(f'%Feature {feature}\n')
+
+            output.write('\n')
+
+    if module.directives != '':
+        output.write(module.directives)
+        output.write('\n\n')
+
+    for sip_file in module.content:
+        output.write(f'%Include {_sip_file_name(sip_file)}\n')
+
+
+def _create_sip_file(project, module, pathname):
     """ Create and return a boilerplate .sip file. """
 
-    if verbose:
-        print(f"Generating '{file_name}'")
+    output = _IndentSipFile.create(pathname, buffered=True)
 
-    output = _IndentSipFile.create(os.path.join(module_output_dir, file_name))
+    file_name = os.path.basename(pathname)
 
     # Add the standard header.
     output.write(
@@ -214,7 +460,7 @@ f'''%ModuleCode
 
     for api in sip_file.content:
         if api.status == '':
-            adapt(api).generate_sip(sip_file, output)
+            adapt(api).generate_sip(api, sip_file, output)
 
     output.blank()
 
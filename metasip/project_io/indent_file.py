@@ -3,17 +3,28 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
+import os
+
 from ..exceptions import UserException
 
 
 class IndentFile:
     """ This is a thin wrapper around a file object that supports indentation.
+    A buffered file is written in one go when it is closed and only if its
+    contents have changed.
     """
 
-    def __init__(self, file_name, indent):
+    def __init__(self, file_name, indent, buffered=False):
         """ Create a file for writing. """
 
-        self._f = open(file_name, 'w', encoding='UTF-8')
+        if buffered:
+            self._f = None
+            self._chunks = []
+            self._write = self._chunks.append
+        else:
+            self._f = open(file_name, 'w', encoding='UTF-8')
+            self._write = self._f.write
+
         self._indent = indent
         self._nr_indents = 0
         self._indent_next = True
@@ -46,17 +57,40 @@ class IndentFile:
             self._blank = True
 
     def close(self):
-        """ Close the file. """
+        """ Close the file.  An exception is raised if a buffered file could
+        not be written.
+        """
+
+        if self._f is not None:
+            self._f.close()
+            return
+
+        # Apply the same newline translation as a file opened in text mode.
+        contents = ''.join(self._chunks)
+        self._chunks = None
 
-        self._f.close()
+        if os.linesep != '\n':
+            contents = contents.replace('\n', os.linesep)
+
+        contents = contents.encode('UTF-8')
+
+        try:
+            if self._is_unchanged(contents):
+                return
+
+            with open(self.name, 'wb') as f:
+                f.write(contents)
+        except IOError as e:
+            raise UserException(f"There was an error creating '{self.name}'",
+                    detail=str(e)) from e
 
     @classmethod
-    def create(cls, file_name, indent=4):
+    def create(cls, file_name, indent=4, buffered=False):
         """ Return an indent file or raise an exception if there was an error.
         """
 
         try:
-            return cls(file_name, indent)
+            return cls(file_name, indent, buffered=buffered)
         except IOError as e:
             raise UserException(f"There was an error creating '{file_name}'",
                     detail=str(e)) from e
@@ -66,28 +100,38 @@ class IndentFile:
 
         if data:
             if self._blank:
-                self._f.write('\n')
+                self._write('\n')
                 self._blank = False
 
-            lines = data.split('\n')
+            if indent and self._nr_indents > 0:
+                prefix = ' ' * (self._indent * self._nr_indents)
 
-            for l in lines[:-1]:
-                if indent and self._indent_next:
-                    self._f.write(' ' * (self._indent * self._nr_indents))
+                # Indent every line after the first.
+                lines = data.split('\n')
+                data = ('\n' + prefix).join(lines)
 
-                self._f.write(l + '\n')
-                self._indent_next = True
+                # Don't indent the start of a line that hasn't been written.
+                if lines[-1] == '':
+                    data = data[:-len(prefix)]
 
-            # Handle the last line.
-            l = lines[-1]
+                # Indent the first line unless it is a continuation.
+                if self._indent_next:
+                    data = prefix + data
 
-            if l:
-                if indent and self._indent_next:
-                    self._f.write(' ' * (self._indent * self._nr_indents))
-
-                self._f.write(l)
-                self._indent_next = False
-            else:
-                self._indent_next = True
+            self._write(data)
 
+            self._indent_next = data.endswith('\n')
             self._suppress_blank = False
+
+    def _is_unchanged(self, contents):
+        """ Return True if the file already exists with the given contents.
+        """
+
+        try:
+            if os.path.getsize(self.name) != len(contents):
+                return False
+
+            with open(self.name, 'rb') as f:
+                return f.read() == contents
+        except FileNotFoundError:
+            return False
@@ -3,24 +3,31 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
+import re
 from xml.etree import ElementTree
 
 from ..exceptions import UserException
-from ..models import MinimumProjectVersion, ProjectVersion
+from ..models import (HeaderDirectory, MinimumProjectVersion, Module,
+        ProjectVersion, SipFile)
 from ..models.adapters import adapt
 
+from .project_cache import ProjectCache
 
-def load_project(project, ui=None):
+
+def load_project(project, ui=None, use_cache=False):
     """ Populate a project from its project file.  Return True if the user
-    didn't cancel.
+    didn't cancel.  If use_cache is set then the project is populated from any
+    valid cache of the project file, otherwise the cache is created after the
+    project file has been loaded.
     """
 
-    # Load the file.
-    tree = ElementTree.parse(project.name)
+    # Parse the file incrementally so that only the part of the project being
+    # loaded needs to be held in memory.  The first event is the start of the
+    # root element which will have all of its attributes.
+    events = ElementTree.iterparse(project.name, events=('start', 'end'))
+    _, root = next(events)
 
     # Do some basic sanity checks.
-    root = tree.getroot()
-
     major_version = root.get('majorversion')
     minor_version = root.get('minorversion')
 
@@ -52,23 +59,128 @@ def load_project(project, ui=None):
             raise UserException(
                     f"{project.name} was created with an earlier version of metasip and must be updated using the GUI")
 
+        # Updating the format needs the complete element tree.
+        del events
+        root = ElementTree.parse(project.name).getroot()
+
         if not ui.update_project_format(root, version, ProjectVersion):
             return False
 
         project.dirty = True
 
-    elif version[1] != ProjectVersion[1]:
+        # Populate the project.
+        adapt(project).load(project, root, project, ui)
+
+        return True
+
+    if version[1] != ProjectVersion[1]:
         if ui is not None:
             ui.warn_minor_version_update(version, ProjectVersion)
 
         project.version = version
 
+    if use_cache:
+        cache = ProjectCache(project)
+
+        if cache.load(ui):
+            # Close the project file.
+            del events
+
+            return True
+
     # Populate the project.
-    adapt(project).load(root, project, ui)
+    if ui is not None:
+        # Each .sip file is a step of the load.
+        ui.load_starting(project, _count_sip_files(project.name))
+
+    _load_incrementally(project, root, events, ui)
+
+    if use_cache:
+        cache.save()
 
     return True
 
 
+# The start of a SipFile element.
+_SIP_FILE_START = re.compile(rb'<SipFile[\s/>]')
+
+def _count_sip_files(file_name):
+    """ Return the number of SipFile elements in a project file without
+    parsing it.
+    """
+
+    count = 0
+    tail = b''
+
+    with open(file_name, 'rb') as f:
+        while True:
+            chunk = f.read(1024 * 1024)
+            if not chunk:
+                break
+
+            # Include the end of the previous chunk in case an element starts
+            # across the boundary.  It is too short to contain a whole match.
+            chunk = tail + chunk
+            count += len(_SIP_FILE_START.findall(chunk))
+            tail = chunk[-8:]
+
+    return count
+
+
+def _load_incrementally(project, root, events, ui):
+    """ Load a project from the remaining iterparse events.  Each header
+    directory and .sip file is loaded as soon as its element is complete and
+    the element is then discarded.  The remaining elements are loaded when
+    their parent is complete.
+    """
+
+    # The stack of incomplete elements.
+    elements = [root]
+
+    # The .sip files of the module currently being loaded.
+    sip_files = []
+
+    for event, element in events:
+        if event == 'start':
+            elements.append(element)
+            continue
+
+        elements.pop()
+
+        if len(elements) == 0:
+            # The project itself is complete.  Note that the UI has already
+            # been initialised and everything that contributes to the load
+            # steps has been removed.
+            adapt(project).load(project, root, project, None)
+
+        elif len(elements) == 1:
+            if element.tag == 'HeaderDirectory':
+                header_directory = HeaderDirectory()
+                adapt(header_directory).load(header_directory, element, project,
+                        ui)
+                project.headers.append(header_directory)
+                root.remove(element)
+
+            elif element.tag == 'Module':
+                # The SipFile elements have already been removed.
+                module = Module()
+                adapt(module).load(module, element, project, ui)
+                module.content = sip_files
+                project.modules.append(module)
+                root.remove(element)
+
+                sip_files = []
+
+        elif len(elements) == 2 and element.tag == 'SipFile':
+            parent = elements[-1]
+
+            if parent.tag == 'Module':
+                sip_file = SipFile()
+                adapt(sip_file).load(sip_file, element, project, ui)
+                sip_files.append(sip_file)
+                parent.remove(element)
+
+
 def _as_int(s):
     """ Return an int from a string or -1 if the string is invalid. """
 
@@ -0,0 +1,138 @@
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
+
+
+from dataclasses import fields, is_dataclass
+import pickle
+
+from ..helpers import interned_tags, interned_version_ranges
+
+
+# The functions that intern the values of the fields of Tagged API items.
+_INTERNED_FIELDS = {
+    'features':     interned_tags,
+    'platforms':    interned_tags,
+    'versions':     interned_version_ranges,
+}
+
+
+class ModelPickler(pickle.Pickler):
+    """ A pickler that pickles an instance of a model class as a call to the
+    class with the values of all of its fields.  Equal strings are pickled once
+    and the tuples of tags and version ranges are interned when they are
+    unpickled.
+    """
+
+    def __init__(self, f, protocol):
+        """ Initialise the pickler. """
+
+        super().__init__(f, protocol)
+
+        # The first of each set of equal strings.
+        self._strings = {}
+
+        # The objects pickled as interned values keyed by the value.  Equal
+        # values are pickled once (even if they aren't shared) so that equal
+        # models are always pickled identically.
+        self._interned = {}
+
+    def reducer_override(self, obj):
+        """ Return the reduced form of an instance of a model class. """
+
+        model_fields = _model_fields().get(type(obj))
+        if model_fields is None:
+            return NotImplemented
+
+        args = []
+
+        for name, interned in model_fields:
+            value = getattr(obj, name)
+
+            if type(value) is str:
+                value = self._strings.setdefault(value, value)
+            elif interned is not None and value:
+                value = self._interned_value(interned, value)
+
+            args.append(value)
+
+        return type(obj), tuple(args)
+
+    def _interned_value(self, interned, value):
+        """ Return the object that will be pickled as a call to a function that
+        interns a value.  The same object is returned for equal values so that
+        the function is only called once when unpickling.
+        """
+
+        interned_value = self._interned.get(value)
+        if interned_value is None:
+            interned_value = _InternedValue(interned, value)
+            self._interned[value] = interned_value
+
+        return interned_value
+
+
+class _InternedValue:
+    """ A value that is pickled as a call to a function that interns it. """
+
+    def __init__(self, interned, value):
+        """ Initialise the object. """
+
+        self._interned = interned
+        self._value = value
+
+    def __reduce__(self):
+        """ Return the reduced form of the value. """
+
+        return self._interned, (self._value, )
+
+
+class ModelUnpickler(pickle.Unpickler):
+    """ An unpickler that will only call the model classes and the functions
+    that intern the values of their fields.
+    """
+
+    # The map of the module and name of each callable to the callable.
+    _callables = None
+
+    def find_class(self, module, name):
+        """ Return a model class or an interning function. """
+
+        if self._callables is None:
+            ModelUnpickler._callables = {
+                    (callable.__module__, callable.__qualname__): callable
+                    for callable in list(_model_fields()) + list(
+                            _INTERNED_FIELDS.values())}
+
+        try:
+            return self._callables[(module, name)]
+        except KeyError:
+            raise pickle.UnpicklingError(
+                    f"'{module}.{name}' is not a model class") from None
+
+
+# The map of each model class to a list of 2-tuples of the name of each field
+# and the optional function that interns its value.
+_model_fields_map = None
+
+def _model_fields():
+    """ Return the map of each model class to its fields. """
+
+    global _model_fields_map
+
+    if _model_fields_map is None:
+        from .. import models
+
+        _model_fields_map = {}
+
+        for cls in vars(models).values():
+            if isinstance(cls, type) and is_dataclass(cls):
+                tagged = issubclass(cls, models.Tagged)
+
+                _model_fields_map[cls] = [
+                        (field.name,
+                                _INTERNED_FIELDS.get(field.name)
+                                        if tagged else None)
+                        for field in fields(cls)]
+
+    return _model_fields_map
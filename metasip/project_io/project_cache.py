@@ -0,0 +1,170 @@
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
+
+
+from dataclasses import fields
+import gc
+import hashlib
+import json
+import os
+import pickle
+
+from .._version import version
+
+from .model_pickler import ModelPickler, ModelUnpickler
+
+
+# The version of the format of the cache file.  This should be incremented
+# whenever the format changes in an incompatible way.
+_CACHE_FORMAT = 4
+
+# The maximum length of the line containing the key of a cache.
+_MAX_KEY_LENGTH = 1024
+
+# The attributes of a project that are not part of the project file.
+_TRANSIENT_ATTRIBUTES = ('name', 'dirty', 'version_index')
+
+
+class ProjectCache:
+    """ This class implements a cache of the model of a project file that is
+    stored alongside the project file.  The cache is only used if it was
+    created from a project file with the same size, modification time and
+    contents.
+
+    The key is stored as a line of JSON at the start of the cache and the model
+    is only unpickled if the key matches.  The model is pickled using a
+    ModelPickler and the unpickler will only create instances of the model
+    classes but, as with the project file itself, the cache should not be
+    trusted if it might have been written by someone else.
+    """
+
+    def __init__(self, project):
+        """ Initialise the cache. """
+
+        self._project = project
+        self._name = project.name + '.cache'
+
+        # The parts of the key of the project file.  These are determined
+        # before the project file is parsed so that a cache is never saved
+        # with a key that is newer than the model.
+        self._stat_key = None
+        self._hash = None
+
+    def load(self, ui=None):
+        """ Populate the project from the cache.  Return True if the cache was
+        valid.  If it was then the optional UI is told that loading the project
+        took a single step.
+        """
+
+        project = self._project
+
+        stat = os.stat(project.name)
+        self._stat_key = (_CACHE_FORMAT, version, stat.st_size,
+                stat.st_mtime_ns)
+
+        cached = self._load_cached(ui)
+
+        if cached is None:
+            # The cache will be saved after the project file has been parsed
+            # so make sure the key is complete before then.
+            if self._hash is None:
+                self._hash = self._hash_project_file()
+
+            return False
+
+        for name, value in zip(_persistent_field_names(project), cached):
+            setattr(project, name, value)
+
+        return True
+
+    def save(self):
+        """ Save the project to the cache after load() has returned False and
+        the project has been loaded from its project file.  Failing to save the
+        cache is not considered an error.
+        """
+
+        tmp_name = self._name + '.tmp'
+
+        try:
+            with open(tmp_name, 'wb') as f:
+                key = json.dumps(self._stat_key + (self._hash, ))
+                f.write(key.encode('ascii') + b'\n')
+
+                project = self._project
+                ModelPickler(f, pickle.HIGHEST_PROTOCOL).dump(
+                        tuple(getattr(project, name)
+                                for name in _persistent_field_names(project)))
+
+            os.replace(tmp_name, self._name)
+        except OSError:
+            try:
+                os.remove(tmp_name)
+            except OSError:
+                pass
+
+    def _load_cached(self, ui):
+        """ Return the values of the fields of the project read from the cache
+        or None if the cache is missing or invalid.
+        """
+
+        try:
+            with open(self._name, 'rb') as f:
+                # The key is read first so that the rest of the cache is only
+                # read if it is valid.
+                key = json.loads(f.readline(_MAX_KEY_LENGTH))
+
+                if tuple(key[:-1]) != self._stat_key:
+                    return None
+
+                self._hash = self._hash_project_file()
+
+                if key[-1] != self._hash:
+                    return None
+
+                # Unpickling creates many objects that will all survive so the
+                # garbage collector would be run many times for no benefit.
+                gc_enabled = gc.isenabled()
+                gc.disable()
+
+                try:
+                    cached = ModelUnpickler(f).load()
+                finally:
+                    if gc_enabled:
+                        gc.enable()
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Anything else means the cache is corrupt or was created with
+            # incompatible models and will be replaced.
+            return None
+
+        if ui is not None:
+            ui.load_starting(self._project, 1)
+            ui.load_step()
+
+        return cached
+
+    def _hash_project_file(self):
+        """ Return the hash of the contents of the project file. """
+
+        sha = hashlib.sha256()
+
+        with open(self._project.name, 'rb') as f:
+            while True:
+                chunk = f.read(1024 * 1024)
+                if not chunk:
+                    break
+
+                sha.update(chunk)
+
+        return sha.hexdigest()
+
+
+def _persistent_field_names(project):
+    """ Return the names of the fields of a project that are part of the
+    project file.
+    """
+
+    return [field.name for field in fields(project)
+            if field.name not in _TRANSIENT_ATTRIBUTES]
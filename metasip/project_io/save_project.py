@@ -13,14 +13,16 @@ def save_project(project, ui):
     """ Save a project to its project file.  Return True if there was no error.
     """
 
+    # The project is written when the file is closed and only if it has
+    # changed.
+    output = IndentFile.create(project.name, indent=2, buffered=True)
+
+    adapt(project).save(project, output)
+
     try:
-        output = IndentFile.create(project.name, indent=2)
+        output.close()
     except UserException as e:
         ui.error_creating_file("Save", e.text, e.detail)
         return False
 
-    adapt(project).save(output)
-
-    output.close()
-
     return True
@@ -0,0 +1,13 @@
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
+
+
+from .abstract_scanner_ui import AbstractScannerUi
+from .cast_xml import CastXMLParser, run_castxml
+from .castxml_cache import CastXMLCache
+from .merge_header_file import ChangeSet, ChangeType, merge_header_file
+from .parse_header_files import (header_file_pathname, parse_header_file,
+        parse_header_files)
+from .read_header import read_header
+from .scan_header_directory import scan_header_directory
@@ -0,0 +1,110 @@
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
+
+
+from abc import ABC, abstractmethod
+
+
+class AbstractScannerUi(ABC):
+    """ This class encapsulates the UI-related methods supporting the scanning
+    of header directories.
+    """
+
+    @abstractmethod
+    def api_added(self, container, api):
+        """ Called when an API has been added to its container. """
+
+        ...
+
+    @abstractmethod
+    def api_removed(self, container, api):
+        """ Called when an API has been removed from its container. """
+
+        ...
+
+    @abstractmethod
+    def api_status_changed(self, api):
+        """ Called when the workflow status of an API has changed. """
+
+        ...
+
+    @abstractmethod
+    def api_versions_changed(self, api):
+        """ Called when the versions of an API have changed. """
+
+        ...
+
+    @abstractmethod
+    def header_directory_status(self, header_directory):
+        """ Called when the status of a header directory has changed. """
+
+        ...
+
+    @abstractmethod
+    def header_file_added(self, header_file, header_directory,
+            working_version):
+        """ Called when a header file has been added to a header directory.
+        """
+
+        ...
+
+    @abstractmethod
+    def header_file_removed(self, header_file):
+        """ Called when a header file has been removed from a header
+        directory.
+        """
+
+        ...
+
+    @abstractmethod
+    def header_file_status(self, header_file):
+        """ Called when the status of a header file has changed. """
+
+        ...
+
+    @abstractmethod
+    def log(self, message):
+        """ Called to log a progress message. """
+
+        ...
+
+    @abstractmethod
+    def parse_starting(self, nr_steps):
+        """ Called to initialise the UI prior to parsing header files that will
+        take a specific number of steps.
+        """
+
+        ...
+
+    @abstractmethod
+    def parse_step(self):
+        """ Called to update the UI once the next step of parsing header files
+        has been completed.  Return True if the user didn't cancel.
+        """
+
+        ...
+
+    @abstractmethod
+    def parse_waiting(self):
+        """ Called periodically while waiting for castxml to parse header
+        files.  Return True if the user didn't cancel.
+        """
+
+        ...
+
+    @abstractmethod
+    def scan_starting(self, header_directory, nr_steps):
+        """ Called to initialise the UI prior to scanning a header directory
+        that will take a specific number of steps.
+        """
+
+        ...
+
+    @abstractmethod
+    def scan_step(self):
+        """ Called to update the UI once the next step of scanning a header
+        directory has been completed.  Return True if the user didn't cancel.
+        """
+
+        ...
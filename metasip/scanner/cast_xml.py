@@ -3,16 +3,19 @@
 # Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
 
 
+import mmap
 import os
+import re
 import subprocess
 import sys
 import tempfile
+from xml.etree import ElementTree
 
-from ....helpers import header_directory_platform
-from ....models import (Function, Argument, Variable, Typedef, OpaqueClass,
+from ..helpers import header_directory_platform
+from ..models import (Function, Argument, Variable, Typedef, OpaqueClass,
         Class, Constructor, Destructor, Method, Enum, EnumValue,
         OperatorFunction, OperatorMethod, Namespace, OperatorCast)
-from ....models.adapters import adapt
+from ..models.adapters import adapt
 
 from .parser_base import ParserBase, optAttribute
 
@@ -68,7 +71,7 @@ def _fixQt(code):
 
         return s
 
-    cs = leading(adapt(code).as_str())
+    cs = leading(adapt(code).as_str(code))
 
     for qo in _Q_OBJECT:
         if cs == leading(qo):
@@ -135,7 +138,7 @@ class _ScopedItem(object):
         except KeyError:
             self.line = None
 
-        parser.scopeditems.append(self)
+        parser.scopeditems.setdefault(self.context, []).append(self)
 
     def asType(self, parser, prefix_ok):
         """
@@ -946,6 +949,84 @@ def _transformArgs(parser, gargs, pargs):
         pargs.append(pa)
 
 
+def _deferred(cls):
+    """
+    Return a start handler for an entity that defers its creation until it is
+    first referenced.
+
+    cls is the class of the entity.
+    """
+    def start(parser, attrs):
+        parser.byid.deferred[attrs["id"]] = (cls, attrs)
+
+    return start
+
+
+def _filtered(cls):
+    """
+    Return a start handler for an entity that creates it if it is in a file
+    being parsed and otherwise defers its creation until it is first
+    referenced.
+
+    cls is the class of the entity.
+    """
+    def start(parser, attrs):
+        if parser.in_target(attrs):
+            cls(parser, attrs)
+        else:
+            parser.byid.deferred[attrs["id"]] = (cls, attrs)
+
+    return start
+
+
+# The XML entity names and their corresponding start handlers.  These are the
+# ones that don't need any special handling.
+_CLASS_MAP = {
+    "class":            _filtered(_Class),
+    "typedef":          _filtered(_Typedef),
+    "fundamentaltype":  _deferred(_FundamentalType),
+    "referencetype":    _deferred(_ReferenceType),
+    "pointertype":      _deferred(_PointerType),
+    "arraytype":        _deferred(_PointerType),
+    "cvqualifiedtype":  _deferred(_CvQualifiedType),
+}
+
+
+# The start tag of a Cast-XML file entity.  Attribute values may be quoted
+# with either quote character and may contain a '>'.
+_FILE_ENTITY = re.compile(rb'<File\s(?:[^>"\']|"[^"]*"|\'[^\']*\')*>')
+
+
+class _Items(dict):
+    """
+    This class implements the dictionary of entities keyed by their ID.  The
+    creation of an entity can be deferred until it is first referenced.
+    """
+    def __init__(self, parser):
+        """
+        Initialise the dictionary.
+
+        parser is the parser instance.
+        """
+        super().__init__()
+
+        self._parser = parser
+
+        # The class and attributes of each deferred entity keyed by its ID.
+        self.deferred = {}
+
+    def __missing__(self, id):
+        """
+        Create a deferred entity.  Note that the entity adds itself to the
+        dictionary.
+
+        id is the ID of the entity.
+        """
+        cls, attrs = self.deferred.pop(id)
+
+        return cls(self._parser, attrs)
+
+
 class _CodeContainer:
     """ An internal class that implements the root of the transformed items.
     """
@@ -957,6 +1038,146 @@ class _CodeContainer:
         self.content = []
 
 
+def run_castxml(input_dir, hdir, pathnames, cache=None):
+    """
+    Run castxml to parse one or more header files.  If there is more than one
+    then castxml is run once on an umbrella header that #includes them all.
+    It may be called concurrently from different threads.  Return a 4-tuple of
+    the command line, the output of castxml, the name of the XML file created
+    (which the caller must remove) and a diagnostic.  The name of the XML file
+    will be None if castxml failed.
+
+    input_dir is the root input directory.
+    hdir is the header directory instance.
+    pathnames is the list of the names of the actual files to parse.
+    cache is an optional CastXMLCache instance.
+    """
+    argv = ['castxml', '-x', 'c++', '--castxml-output=1']
+
+    if sys.platform == 'darwin':
+        # Workaround issues with Xcode v14.3 (and possibly later).
+        argv.append('-Dat_quick_exit=atexit')
+        argv.append('-Dquick_exit=exit')
+
+        xcode = subprocess.check_output(('xcode-select', '-p')).decode().strip()
+
+        argv.append('-isysroot')
+        argv.append(xcode + '/Platforms/MacOSX.platform/Developer/SDKs/MacOSX.sdk')
+
+    argv.append(header_directory_platform(hdir).parserargs)
+
+    # The dependencies are needed to validate any cache entry.
+    if cache is not None and not cache.castxml_creates_depfiles(argv[0]):
+        cache = None
+
+    if cache is not None:
+        key = cache.key(argv, input_dir, pathnames)
+
+        cached = cache.lookup(key)
+        if cached is not None:
+            iname, output = cached
+            args = ' '.join(argv + pathnames) + ' (cached)'
+
+            return args, output, iname, None
+
+    if len(pathnames) == 1:
+        umbrella = None
+        pathname = pathnames[0]
+    else:
+        fd, umbrella = tempfile.mkstemp(suffix='.h')
+
+        with os.fdopen(fd, 'w') as f:
+            for pathname in pathnames:
+                f.write('#include "{0}"\n'.format(os.path.abspath(
+                        os.path.join(input_dir, pathname))))
+
+        pathname = umbrella
+
+    if cache is not None:
+        fd, depfile = tempfile.mkstemp(suffix='.d')
+        os.close(fd)
+    else:
+        depfile = None
+
+    try:
+        castxml_output = _run_castxml(input_dir, argv, pathname, depfile)
+
+        _, output, iname, _ = castxml_output
+
+        # Only cache the output if castxml created the dependencies.
+        if iname is not None and depfile is not None:
+            if os.path.getsize(depfile) != 0:
+                cache.store(key, iname, output, depfile, input_dir,
+                        umbrella)
+    finally:
+        if umbrella is not None:
+            os.remove(umbrella)
+
+        if depfile is not None:
+            os.remove(depfile)
+
+    return castxml_output
+
+
+def _run_castxml(input_dir, argv, pathname, depfile):
+    """
+    Run castxml to parse a single file and return the 4-tuple described by
+    run_castxml().
+
+    input_dir is the root input directory.
+    argv is the list of arguments excluding the names of any files.
+    pathname is the name of the file to parse.
+    depfile is the name of the dependency file to create or None.
+    """
+    # Each invocation needs a unique XML file.
+    fd, iname = tempfile.mkstemp(suffix='.xml')
+    os.close(fd)
+
+    # The parser arguments are last.
+    parserargs = argv[-1]
+    argv = argv[:-1] + ['-o', iname]
+
+    if depfile is not None:
+        argv.extend(['-MD', '-MF', depfile])
+
+    argv.append(parserargs)
+    argv.append(pathname)
+
+    # We use shell=True and a string argv for macOS - but I don't
+    # understand why it's needed.
+    args = ' '.join(argv)
+
+    # Note that the current directory isn't changed as it is shared by all
+    # threads.
+    try:
+        output = subprocess.check_output(args, shell=True, cwd=input_dir,
+                stderr=subprocess.STDOUT)
+        rc = 0
+    except subprocess.CalledProcessError as exc:
+        output = exc.output
+        rc = exc.returncode
+
+    diagnostic = None
+
+    if rc != 0:
+        try:
+            os.remove(iname)
+        except:
+            pass
+
+        iname = None
+
+        sig = rc & 0x7f
+        rc >>= 8
+
+        if sig:
+            diagnostic = "{0} killed by signal {1}".format(argv[0], sig)
+        else:
+            diagnostic = "{0} failed with exit code {1}".format(argv[0], rc)
+
+    return args, output.decode(), iname, diagnostic
+
+
 class CastXMLParser(ParserBase):
     """
     This class implements a C++ parser based on Cast-XML.  It should be used as
@@ -964,18 +1185,12 @@ class CastXMLParser(ParserBase):
     """
     def classMap(self):
         """
-        Return a dictionary of XML entity names and their corresponding
-        classes.  These are the ones that don't need any special handling.
+        Return a dictionary of XML entity names and their corresponding start
+        handlers.  These are the ones that don't need any special handling.
         """
-        return {"class":            _Class,
-                "typedef":          _Typedef,
-                "fundamentaltype":  _FundamentalType,
-                "referencetype":    _ReferenceType,
-                "pointertype":      _PointerType,
-                "arraytype":        _PointerType,
-                "cvqualifiedtype":  _CvQualifiedType}
+        return _CLASS_MAP
 
-    def parse(self, project, input_dir, hdir, hf, pathname, log):
+    def parse(self, project, input_dir, hdir, hf, pathname, log, cache=None):
         """
         Parse a file and return the parsed file instance or None if there was
         an error.
@@ -985,97 +1200,85 @@ class CastXMLParser(ParserBase):
         hdir is the header directory instance.
         hf is the header file instance.
         pathname is the name of the actual file to parse.
+        cache is an optional CastXMLCache instance.
         """
-        self._pathname = pathname
-        iname = os.path.join(tempfile.gettempdir(), hf.name + '.tmp')
-
-        argv = ['castxml', '-x', 'c++', '--castxml-output=1']
+        parsed = self.parse_castxml_output(project, [pathname],
+                run_castxml(input_dir, hdir, [pathname], cache=cache), log)
 
-        if sys.platform == 'darwin':
-            # Workaround issues with Xcode v14.3 (and possibly later).
-            argv.append('-Dat_quick_exit=atexit')
-            argv.append('-Dquick_exit=exit')
+        return None if parsed is None else parsed[0]
 
-            xcode = subprocess.check_output(('xcode-select', '-p')).decode().strip()
-
-            argv.append('-isysroot')
-            argv.append(xcode + '/Platforms/MacOSX.platform/Developer/SDKs/MacOSX.sdk')
+    def parse_castxml_output(self, project, pathnames, castxml_output, log):
+        """
+        Parse the output of run_castxml() and return a list of the parsed file
+        instances corresponding to each file or None if there was an error.
 
-        argv.append('-o')
-        argv.append(iname)
-        argv.append(header_directory_platform(hdir).parserargs)
-        argv.append(self._pathname)
+        project is the project.
+        pathnames is the list of the names of the actual files parsed.
+        castxml_output is the value returned by run_castxml().
+        """
+        self._pathnames = pathnames
 
-        # We use shell=True and a string argv for macOS - but I don't
-        # understand why it's needed.
-        args = ' '.join(argv)
+        args, output, iname, diagnostic = castxml_output
 
         log(args)
 
-        cwd = os.getcwd()
-        os.chdir(input_dir)
-
-        try:
-            output = subprocess.check_output(args, shell=True,
-                    stderr=subprocess.STDOUT)
-            rc = 0
-        except subprocess.CalledProcessError as exc:
-            output = exc.output
-            rc = exc.returncode
-
-        os.chdir(cwd)
-
         # Log any output.
-        for line in output.decode().rstrip().split('\n'):
+        for line in output.rstrip().split('\n'):
             log(line.rstrip())
 
-        if rc != 0:
-            try:
-                os.remove(iname)
-            except:
-                pass
-
-            sig = rc & 0x7f
-            rc >>= 8
-
-            if sig:
-                self.diagnostic = "{0} killed by signal {1}".format(argv[0],
-                        sig)
-            else:
-                self.diagnostic = "{0} failed with exit code {1}".format(
-                        argv[0], rc)
-
+        if iname is None:
+            self.diagnostic = diagnostic
             log(self.diagnostic)
 
             return None
 
-        log("Parsing XML for {0}".format(self._pathname))
+        log("Parsing XML for {0}".format(', '.join(pathnames)))
 
         # Initialise the parser state.  The first pass is to read in the
         # Cast-XML output filtering out stuff we definately don't need.  The
         # second pass is to convert it into the internal project format.  We
         # need to do two passes because Cast-XML does not ensure that
-        # everything is defined by the time it is referenced.
-        self.byid = {}
-        self.scopeditems = []
-        self._rootns = None
-        self._args = None
-        self._evalues = None
-        self._fileid = None
+        # everything is defined by the time it is referenced.  Entities that
+        # are not in the files being parsed are only created if they are
+        # referenced during the second pass.
+        try:
+            self._fileids = self._find_file_ids(iname)
+
+            rc = self._parse_xml(iname, set(self._fileids.values()))
+
+            # The file IDs found by the first pass are definitive.  If the
+            # ones found beforehand are different then entities may have been
+            # wrongly discarded so parse again without filtering them.
+            if rc:
+                fileids = self._match_file_ids(self._file_entities)
 
-        rc = super().parse(iname)
+                if fileids != self._fileids:
+                    log("The file IDs found before parsing were wrong so "
+                            "parsing again")
 
-        #os.remove(iname)
+                    self._fileids = fileids
+
+                    rc = self._parse_xml(iname, None)
+        finally:
+            os.remove(iname)
 
         if not rc:
             return None
 
-        # Now convert it to the internal format.
-        phf = _CodeContainer(project)
+        # Now convert the items of each file to the internal format.
+        parsed = []
+
+        for pathname in pathnames:
+            self._fileid = self._fileids.get(pathname)
+            self._sorted_scopes = {}
+
+            phf = _CodeContainer(project)
 
-        self.transformScope(phf, self._rootns)
+            self.transformScope(phf, self._rootns)
 
-        return phf.content
+            parsed.append(phf.content)
+
+        return parsed
 
     def namespaceStart(self, attrs):
         """
@@ -1095,6 +1298,9 @@ class CastXMLParser(ParserBase):
 
         attrs is the dictionary of attributes.
         """
+        if not self.in_target(attrs):
+            return
+
         # At the moment we only support public variables.  We could support
         # protected ones in the future, but we will never support private ones.
         if optAttribute(attrs, "access") == "private":
@@ -1108,6 +1314,9 @@ class CastXMLParser(ParserBase):
 
         attrs is the dictionary of attributes.
         """
+        if not self.in_target(attrs):
+            return
+
         # At the moment we only support public variables.  We could support
         # protected ones in the future, but we will never support private ones.
         if optAttribute(attrs, "access") == "private":
@@ -1124,6 +1333,10 @@ class CastXMLParser(ParserBase):
 
         attrs is the dictionary of attributes.
         """
+        if not self.in_target(attrs):
+            self.byid.deferred[attrs["id"]] = (_Union, attrs)
+            return
+
         _Union(self, attrs)
 
     def structStart(self, attrs):
@@ -1132,6 +1345,10 @@ class CastXMLParser(ParserBase):
 
         attrs is the dictionary of attributes.
         """
+        if not self.in_target(attrs):
+            self.byid.deferred[attrs["id"]] = (_Struct, attrs)
+            return
+
         _Struct(self, attrs)
 
     def constructorStart(self, attrs):
@@ -1140,6 +1357,10 @@ class CastXMLParser(ParserBase):
 
         attrs is the dictionary of attributes.
         """
+        if not self.in_target(attrs):
+            self._args = None
+            return
+
         if optAttribute(attrs, "artificial", None) is not None:
             return
 
@@ -1157,6 +1378,9 @@ class CastXMLParser(ParserBase):
 
         attrs is the dictionary of attributes.
         """
+        if not self.in_target(attrs):
+            return
+
         if optAttribute(attrs, "artificial", None) is not None:
             return
 
@@ -1168,6 +1392,9 @@ class CastXMLParser(ParserBase):
 
         attrs is the dictionary of attributes.
         """
+        if not self.in_target(attrs):
+            return
+
         _Converter(self, attrs)
 
     def methodStart(self, attrs):
@@ -1176,6 +1403,10 @@ class CastXMLParser(ParserBase):
 
         attrs is the dictionary of attributes.
         """
+        if not self.in_target(attrs):
+            self._args = None
+            return
+
         self._args = _Method(self, attrs).args
 
     def methodEnd(self):
@@ -1190,6 +1421,10 @@ class CastXMLParser(ParserBase):
 
         attrs is the dictionary of attributes.
         """
+        if not self.in_target(attrs):
+            self._args = None
+            return
+
         self._args = _OperatorMethod(self, attrs).args
 
     def operatormethodEnd(self):
@@ -1204,6 +1439,10 @@ class CastXMLParser(ParserBase):
 
         attrs is the dictionary of attributes.
         """
+        if not self.in_target(attrs):
+            self._args = None
+            return
+
         self._args = _Function(self, attrs).args
 
     def functionEnd(self):
@@ -1232,6 +1471,10 @@ class CastXMLParser(ParserBase):
 
         attrs is the dictionary of attributes.
         """
+        if not self.in_target(attrs):
+            self._args = None
+            return
+
         self._args = _OperatorFunction(self, attrs).args
 
     def operatorfunctionEnd(self):
@@ -1264,6 +1507,11 @@ class CastXMLParser(ParserBase):
 
         attrs is the dictionary of attributes.
         """
+        if not self.in_target(attrs):
+            self.byid.deferred[attrs["id"]] = (_Enumeration, attrs)
+            self._evalues = None
+            return
+
         self._evalues = _Enumeration(self, attrs).values
 
     def enumvalueStart(self, attrs):
@@ -1272,7 +1520,8 @@ class CastXMLParser(ParserBase):
 
         attrs is the dictionary of attributes.
         """
-        self._evalues.append(_EnumValue(self, attrs))
+        if self._evalues is not None:
+            self._evalues.append(_EnumValue(self, attrs))
 
     def fileStart(self, attrs):
         """
@@ -1280,14 +1529,93 @@ class CastXMLParser(ParserBase):
 
         attrs is the dictionary of attributes.
         """
-        # Remember the file ID of the file being parsed.
-        name = attrs["name"]
-        if os.path.isabs(name):
-            if name == self._pathname:
-                self._fileid = attrs["id"]
-        else:
-            if self._pathname.endswith(name[1:]):
-                self._fileid = attrs["id"]
+        self._file_entities.append((attrs["id"], attrs["name"]))
+
+    def in_target(self, attrs):
+        """
+        Return True if an entity is in one of the files being parsed.  An
+        entity without a file is assumed to be, as is every entity if the
+        target file IDs are not known.
+
+        attrs is the dictionary of attributes.
+        """
+        if self._target_fileids is None:
+            return True
+
+        file_id = attrs.get("file")
+
+        return file_id is None or file_id in self._target_fileids
+
+    def _parse_xml(self, iname, target_fileids):
+        """
+        Do the first pass of the XML and return True if there was no error.
+
+        iname is the name of the XML file.
+        target_fileids is the set of the file IDs of the files being parsed
+        or None if they are not known.
+        """
+        self.byid = _Items(self)
+        self.scopeditems = {}   # The scoped items keyed by their context.
+        self._rootns = None
+        self._args = None
+        self._evalues = None
+        self._file_entities = []
+        self._target_fileids = target_fileids
+
+        return super().parse(iname)
+
+    def _find_file_ids(self, iname):
+        """
+        Return a dictionary of the file IDs of the files being parsed keyed by
+        the name of the file.  Cast-XML puts the file entities at the end so
+        they are found before the first pass.  Only the start tags of the file
+        entities are parsed as XML.
+
+        iname is the name of the XML file.
+        """
+        file_entities = []
+
+        with open(iname, 'rb') as f:
+            try:
+                xml = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # The file is empty.
+                return {}
+
+            with xml:
+                for file_entity in _FILE_ENTITY.finditer(xml):
+                    # Make sure the start tag is also an end tag.
+                    tag = file_entity.group().rstrip(b'/>') + b'/>'
+
+                    try:
+                        attrs = ElementTree.fromstring(tag).attrib
+                        file_entities.append((attrs['id'], attrs['name']))
+                    except (ElementTree.ParseError, KeyError):
+                        # The first pass will find the entity.
+                        pass
+
+        return self._match_file_ids(file_entities)
+
+    def _match_file_ids(self, file_entities):
+        """
+        Return a dictionary of the file IDs of the files being parsed keyed by
+        the name of the file.
+
+        file_entities is a list of the 2-tuples of the ID and name of each file
+        entity.
+        """
+        fileids = {}
+
+        for file_id, name in file_entities:
+            for pathname in self._pathnames:
+                if os.path.isabs(name):
+                    if name == pathname:
+                        fileids[pathname] = file_id
+                else:
+                    if pathname.endswith(name[1:]):
+                        fileids[pathname] = file_id
+
+        return fileids
 
     def transformScope(self, container, scope):
         """
@@ -1298,31 +1626,33 @@ class CastXMLParser(ParserBase):
         scope is the scope to convert.
         """
         # Transform each scoped item.
-        for si in self._sorted_scope(scope):
+        for si, _ in self._sorted_scope(scope):
             si.transform(self, container)
 
     def _sorted_scope(self, unsorted):
         """
-        Return a list of the items in a scope sorted by line number.
+        Return a list of the items, and their line numbers, in a scope sorted
+        by line number.
 
         unsorted is the scope.
         """
         # Return the cached list if we have already built it.
         try:
-            return unsorted._cache
-        except AttributeError:
+            return self._sorted_scopes[id(unsorted)]
+        except KeyError:
             pass
 
         ssl = []
 
-        for si in self.scopeditems:
-            # Skip if this item is part of the scope.
-            if si is unsorted or si.context != unsorted.id:
+        for si in self.scopeditems.get(unsorted.id, ()):
+            # Skip the scope itself.
+            if si is unsorted:
                 continue
 
             # If we don't know the item's position then it must be a namespace
             # so sort it's contents and take the position of it's first
-            # "child".
+            # "child".  Note that the position depends on the file being
+            # transformed so the item itself isn't updated.
             if si.file is None or si.line is None:
                 si_sorted = self._sorted_scope(si)
 
@@ -1330,14 +1660,13 @@ class CastXMLParser(ParserBase):
                 if len(si_sorted) == 0:
                     continue
 
-                si.file = si_sorted[0].file
-                si.line = si_sorted[0].line
-
-            if si.file == self._fileid:
-                ssl.append(si)
+                # The children are all in the file being transformed.
+                ssl.append((si, si_sorted[0][1]))
+            elif si.file == self._fileid:
+                ssl.append((si, si.line))
 
-        ssl.sort(key=lambda k: k.line)
-        unsorted._cache = ssl
+        ssl.sort(key=lambda k: k[1])
+        self._sorted_scopes[id(unsorted)] = ssl
 
         return ssl
 
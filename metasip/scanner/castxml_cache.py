@@ -0,0 +1,341 @@
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
+
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+
+
+# The version of the format of the cache entries.  This should be incremented
+# whenever the format changes in an incompatible way.
+_CACHE_FORMAT = 1
+
+# The default maximum size of the cache in bytes.
+_DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+
+# The fraction of the maximum size that the cache is reduced to when entries
+# are evicted.  This means that eviction (which needs to examine every entry)
+# isn't needed every time an entry is stored once the cache is full.
+_EVICTED_SIZE_RATIO = 0.9
+
+
+class CastXMLCache:
+    """ This class implements a cache of the XML output of castxml.  An entry
+    is keyed by the castxml version, its arguments and the header files being
+    parsed.  An entry is only used if every file included when the XML was
+    created still has the same contents.  The XML is stored compressed and the
+    least recently used entries are discarded when the cache exceeds a maximum
+    size.  An instance may be used concurrently from different threads.
+    """
+
+    def __init__(self, directory, max_size=_DEFAULT_MAX_SIZE):
+        """ Initialise the cache. """
+
+        self._directory = directory
+        self._max_size = max_size
+
+        self._lock = threading.Lock()
+        self._total_size = None
+        self._castxml_version = None
+        self._castxml_creates_depfiles = None
+
+    def key(self, argv, input_dir, pathnames):
+        """ Return the key of an entry given the castxml arguments (excluding
+        the names of any input and output files), the root input directory and
+        the names of the header files being parsed.
+        """
+
+        key = hashlib.sha256()
+
+        for part in [str(_CACHE_FORMAT), self._get_castxml_version(argv[0]),
+                os.path.abspath(input_dir)] + argv + pathnames:
+            key.update(part.encode())
+            key.update(b'\0')
+
+        return key.hexdigest()
+
+    def castxml_creates_depfiles(self, castxml):
+        """ Return True if castxml creates the dependency files needed to
+        validate an entry.  If not then the cache cannot be used.
+        """
+
+        with self._lock:
+            if self._castxml_creates_depfiles is None:
+                self._castxml_creates_depfiles = _probe_depfiles(castxml)
+
+        return self._castxml_creates_depfiles
+
+    def lookup(self, key):
+        """ Return a 2-tuple of the name of a temporary file containing the XML
+        (which the caller must remove) and the output of castxml when the XML
+        was created, or None if there is no valid entry.
+        """
+
+        meta_name, xml_name = self._entry_names(key)
+
+        try:
+            with open(meta_name, encoding='UTF-8') as f:
+                meta = json.load(f)
+
+            for include in meta['includes']:
+                if not self._include_is_unchanged(*include):
+                    return None
+
+            fd, iname = tempfile.mkstemp(suffix='.xml')
+
+            with os.fdopen(fd, 'wb') as f_out:
+                with gzip.open(xml_name, 'rb') as f_in:
+                    shutil.copyfileobj(f_in, f_out)
+        except Exception:
+            # Anything else means the entry is missing, corrupt or has just
+            # been evicted.
+            return None
+
+        # Record the use of the entry.
+        try:
+            os.utime(meta_name)
+        except OSError:
+            pass
+
+        return iname, meta['output']
+
+    def store(self, key, iname, output, depfile, input_dir, exclude):
+        """ Store the XML created by castxml in a file as an entry.  depfile
+        is the name of the dependency file created by castxml.  input_dir is
+        the directory that castxml was run in.  exclude is the name of any
+        temporary file included in the dependencies.  Failing to store the
+        entry is not considered an error.
+        """
+
+        meta_name, xml_name = self._entry_names(key)
+
+        # Any existing (and now invalid) entry will be replaced.
+        old_size = self._entry_size(meta_name, xml_name)
+
+        try:
+            includes = []
+
+            for name in _read_depfile(depfile):
+                if name == exclude:
+                    continue
+
+                # Note that the name isn't normalised as it may contain '..'
+                # after a symbolic link.
+                name = os.path.join(input_dir, name)
+
+                stat = os.stat(name)
+                includes.append((name, stat.st_size, stat.st_mtime_ns,
+                        _hash_file(name)))
+
+            entry_dir = os.path.dirname(meta_name)
+            os.makedirs(entry_dir, exist_ok=True)
+
+            # The XML is written before the meta-data so that an entry is never
+            # visible before it is complete.  The temporary files are unique
+            # because the same entry may be stored concurrently by another
+            # thread or process.
+            fd, tmp_name = tempfile.mkstemp(dir=entry_dir)
+
+            try:
+                with os.fdopen(fd, 'wb') as f, open(iname, 'rb') as f_in:
+                    with gzip.open(f, 'wb') as f_out:
+                        shutil.copyfileobj(f_in, f_out)
+
+                os.replace(tmp_name, xml_name)
+
+                fd, tmp_name = tempfile.mkstemp(dir=entry_dir)
+
+                with os.fdopen(fd, 'w', encoding='UTF-8') as f:
+                    json.dump({'includes': includes, 'output': output}, f)
+
+                os.replace(tmp_name, meta_name)
+            except OSError:
+                try:
+                    os.remove(tmp_name)
+                except OSError:
+                    pass
+
+                raise
+        except OSError:
+            return
+
+        size = self._entry_size(meta_name, xml_name) - old_size
+
+        with self._lock:
+            # The size of the cache is only calculated in full when the first
+            # entry is stored and when entries are evicted.  Otherwise it is an
+            # estimate (as other processes may be using the same cache).
+            if self._total_size is None:
+                self._total_size = self._calculate_size()
+            else:
+                self._total_size += size
+
+            if self._total_size > self._max_size:
+                self._evict()
+
+    def _entry_names(self, key):
+        """ Return a 2-tuple of the names of the meta-data and XML files of an
+        entry.
+        """
+
+        base_name = os.path.join(self._directory, key[:2], key)
+
+        return base_name + '.json', base_name + '.xml.gz'
+
+    def _calculate_size(self):
+        """ Return the total size of the entries in the cache. """
+
+        return sum(size for _, size, _, _ in self._entries())
+
+    def _entries(self):
+        """ Return a list of the entries in the cache.  Each entry is a 4-tuple
+        of the time it was last used, its size, and the names of its meta-data
+        and XML files.
+        """
+
+        entries = []
+
+        for dirpath, _, filenames in os.walk(self._directory):
+            for filename in filenames:
+                if not filename.endswith('.json'):
+                    continue
+
+                meta_name = os.path.join(dirpath, filename)
+                xml_name = meta_name[:-5] + '.xml.gz'
+
+                try:
+                    meta_stat = os.stat(meta_name)
+                    size = meta_stat.st_size + os.stat(xml_name).st_size
+                except OSError:
+                    continue
+
+                entries.append((meta_stat.st_mtime_ns, size, meta_name,
+                        xml_name))
+
+        return entries
+
+    @staticmethod
+    def _entry_size(meta_name, xml_name):
+        """ Return the size of an entry or 0 if it doesn't exist. """
+
+        try:
+            return os.stat(meta_name).st_size + os.stat(xml_name).st_size
+        except OSError:
+            return 0
+
+    def _evict(self):
+        """ Remove the least recently used entries until the cache is no
+        larger than a fraction of its maximum size.  The lock must be held.
+        """
+
+        entries = self._entries()
+        entries.sort()
+
+        total_size = sum(size for _, size, _, _ in entries)
+        evicted_size = self._max_size * _EVICTED_SIZE_RATIO
+
+        for _, size, meta_name, xml_name in entries:
+            if total_size <= evicted_size:
+                break
+
+            for name in (meta_name, xml_name):
+                try:
+                    os.remove(name)
+                except OSError:
+                    pass
+
+            total_size -= size
+
+        self._total_size = total_size
+
+    def _get_castxml_version(self, castxml):
+        """ Return the version of castxml. """
+
+        with self._lock:
+            if self._castxml_version is None:
+                try:
+                    output = subprocess.check_output([castxml, '--version'],
+                            stderr=subprocess.STDOUT)
+                except (OSError, subprocess.CalledProcessError):
+                    output = b''
+
+                lines = output.decode(errors='replace').split('\n')
+                self._castxml_version = lines[0].strip()
+
+        return self._castxml_version
+
+    @staticmethod
+    def _include_is_unchanged(name, size, mtime_ns, sha256):
+        """ Return True if an included file is unchanged. """
+
+        try:
+            stat = os.stat(name)
+        except OSError:
+            return False
+
+        if stat.st_size != size:
+            return False
+
+        # Only read the file if it has been touched.
+        if stat.st_mtime_ns == mtime_ns:
+            return True
+
+        return _hash_file(name) == sha256
+
+
+def _hash_file(name):
+    """ Return the SHA256 hash of the contents of a file. """
+
+    with open(name, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _probe_depfiles(castxml):
+    """ Return True if castxml creates a dependency file when parsing an empty
+    header file.
+    """
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        header = os.path.join(temp_dir, 'probe.h')
+        depfile = os.path.join(temp_dir, 'probe.d')
+
+        with open(header, 'w'):
+            pass
+
+        try:
+            subprocess.check_output(
+                    [castxml, '-x', 'c++', '--castxml-output=1', '-o',
+                            os.path.join(temp_dir, 'probe.xml'), '-MD',
+                            '-MF', depfile, header],
+                    stderr=subprocess.STDOUT)
+        except (OSError, subprocess.CalledProcessError):
+            return False
+
+        try:
+            return len(_read_depfile(depfile)) != 0
+        except OSError:
+            return False
+
+
+def _read_depfile(depfile):
+    """ Return the list of dependencies in a make-style dependency file. """
+
+    with open(depfile, encoding='UTF-8', errors='surrogateescape') as f:
+        contents = f.read()
+
+    # Remove the line continuations and the target.
+    contents = contents.replace('\\\n', ' ')
+    _, _, contents = contents.partition(': ')
+
+    # Spaces in names are escaped.
+    return [name.replace('\\ ', ' ')
+            for name in re.split(r'(?<!\\)\s+', contents.strip())
+                    if name != '']
@@ -0,0 +1,260 @@
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
+
+
+import argparse
+
+from ..exceptions import handle_exception, UserException
+from ..models import Project
+from ..project_io import AbstractProjectUi, load_project, save_project
+from .._version import version
+
+from .abstract_scanner_ui import AbstractScannerUi
+from .castxml_cache import CastXMLCache
+from .parse_header_files import parse_header_files
+from .scan_header_directory import scan_header_directory
+
+
+def main():
+    """ The entry point for the msipscan console script. """
+
+    # Parse the command line.
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument('-V', '--version', action='version', version=version)
+    parser.add_argument('project', help="the project to scan", nargs='?')
+    parser.add_argument('--castxml-cache',
+            help="cache the output of castxml in DIR",
+            metavar='DIR', dest='castxml_cache')
+    parser.add_argument('--header-directory',
+            help="scan the header directory NAME",
+            metavar='NAME', dest='header_directories', action='append')
+    parser.add_argument('--jobs',
+            help="read or parse the header files using N concurrent jobs",
+            metavar='N', type=int, default=1)
+    parser.add_argument('--parse',
+            help="parse the header files that need parsing after scanning",
+            dest='parse', default=False, action='store_true')
+    parser.add_argument('--source-dir',
+            help="the header directories are in DIR",
+            metavar='DIR', required=True)
+    parser.add_argument('--use-scan-cache',
+            help="only read header files changed since the last scan",
+            dest='use_scan_cache', default=False, action='store_true')
+    parser.add_argument('--verbose', help="display progress messages",
+            dest='verbose', default=False, action='store_true')
+    parser.add_argument('--whole-directories',
+            help="parse the header files of each header directory using a "
+                    "single invocation of castxml",
+            dest='whole_directories', default=False, action='store_true')
+    parser.add_argument('--working-version',
+            help="scan for VERSION rather than the latest version",
+            metavar='VERSION')
+
+    args = parser.parse_args()
+
+    try:
+        _scan(args.project, args.source_dir, args.header_directories,
+                args.working_version, args.jobs, args.use_scan_cache, args.parse,
+                args.whole_directories, args.castxml_cache, args.verbose)
+    except Exception as e:
+        handle_exception(e)
+
+
+def _scan(project_name, source_directory, header_directory_names,
+        working_version, jobs, use_scan_cache, parse, whole_directories,
+        castxml_cache_dir, verbose):
+    """ Scan, and optionally parse, the header directories of a project and
+    save the project if it was changed.
+    """
+
+    if not project_name:
+        raise UserException("Specify the name of an existing project file")
+
+    if jobs < 1:
+        raise UserException("The number of jobs must be at least 1")
+
+    project = Project(project_name)
+    load_project(project)
+
+    if working_version is None:
+        working_version = project.versions[-1] if project.versions else ''
+    elif working_version not in project.versions:
+        raise UserException(f"'{working_version}' is not a defined version")
+
+    if header_directory_names is None:
+        header_directories = project.headers
+    else:
+        header_directories = []
+
+        for name in header_directory_names:
+            for header_directory in project.headers:
+                if header_directory.name == name:
+                    header_directories.append(header_directory)
+                    break
+            else:
+                raise UserException(
+                        f"'{name}' is not the name of a header directory")
+
+    ui = _ScannerUi(verbose)
+    changed = False
+
+    for header_directory in header_directories:
+        if scan_header_directory(project, header_directory, source_directory,
+                working_version, ui, jobs=jobs, use_cache=use_scan_cache):
+            changed = True
+
+    diagnostics = []
+
+    if parse:
+        if castxml_cache_dir is None:
+            cache = None
+        else:
+            cache = CastXMLCache(castxml_cache_dir)
+
+        parse_changed, diagnostics = parse_header_files(project,
+                header_directories, source_directory, working_version, ui,
+                jobs=jobs, cache=cache, whole_directories=whole_directories)
+
+        if parse_changed:
+            changed = True
+
+    if changed:
+        save_project(project, _ProjectUi())
+
+    if diagnostics:
+        raise UserException(
+                f"{len(diagnostics)} header file(s) could not be parsed",
+                detail='\n'.join(diagnostics))
+
+
+class _ProjectUi(AbstractProjectUi):
+    """ The project UI used when saving a scanned project. """
+
+    def error_creating_file(self, title, text, detail):
+        """ Called when there was an error when creating a file. """
+
+        raise UserException(text, detail=detail)
+
+    def load_starting(self, project, nr_steps):
+        """ Called to initialise the UI prior to loading the project that will
+        take a specific number of steps.
+        """
+
+        pass
+
+    def load_step(self):
+        """ Called to update the UI once the next step of loading the project
+        has been completed.
+        """
+
+        pass
+
+    def update_project_format(self, root_element, from_version, to_version):
+        """ Called to update the project from it's current major version before
+        it is parsed.  Return True if the user didn't cancel.
+        """
+
+        return False
+
+    def warn_minor_version_update(self, from_version, to_version):
+        """ Called to warn the user that the project will be updated to the
+        current minor version if saved.
+        """
+
+        pass
+
+
+class _ScannerUi(AbstractScannerUi):
+    """ The scanner UI that optionally displays progress messages. """
+
+    def __init__(self, verbose):
+        """ Initialise the UI. """
+
+        self._verbose = verbose
+
+    def api_added(self, container, api):
+        """ Called when an API has been added to its container. """
+
+        pass
+
+    def api_removed(self, container, api):
+        """ Called when an API has been removed from its container. """
+
+        pass
+
+    def api_status_changed(self, api):
+        """ Called when the workflow status of an API has changed. """
+
+        pass
+
+    def api_versions_changed(self, api):
+        """ Called when the versions of an API have changed. """
+
+        pass
+
+    def header_directory_status(self, header_directory):
+        """ Called when the status of a header directory has changed. """
+
+        pass
+
+    def header_file_added(self, header_file, header_directory,
+            working_version):
+        """ Called when a header file has been added to a header directory.
+        """
+
+        pass
+
+    def header_file_removed(self, header_file):
+        """ Called when a header file has been removed from a header
+        directory.
+        """
+
+        pass
+
+    def header_file_status(self, header_file):
+        """ Called when the status of a header file has changed. """
+
+        pass
+
+    def log(self, message):
+        """ Called to log a progress message. """
+
+        if self._verbose:
+            print(message)
+
+    def parse_starting(self, nr_steps):
+        """ Called to initialise the UI prior to parsing header files that will
+        take a specific number of steps.
+        """
+
+        pass
+
+    def parse_step(self):
+        """ Called to update the UI once the next step of parsing header files
+        has been completed.  Return True if the user didn't cancel.
+        """
+
+        return True
+
+    def parse_waiting(self):
+        """ Called periodically while waiting for castxml to parse header
+        files.  Return True if the user didn't cancel.
+        """
+
+        return True
+
+    def scan_starting(self, header_directory, nr_steps):
+        """ Called to initialise the UI prior to scanning a header directory
+        that will take a specific number of steps.
+        """
+
+        pass
+
+    def scan_step(self):
+        """ Called to update the UI once the next step of scanning a header
+        directory has been completed.  Return True if the user didn't cancel.
+        """
+
+        return True
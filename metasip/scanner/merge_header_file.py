@@ -0,0 +1,269 @@
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
+
+
+from enum import auto, Enum as _Enum
+
+from ..helpers import (interned_version_range, interned_version_ranges,
+        VersionMap)
+from ..models import (Callable, CodeContainer, Constructor, Enum, ManualCode,
+        SipFile)
+from ..models.adapters import adapt
+
+
+class ChangeType(_Enum):
+    """ The different types of change made to a project when merging a parsed
+    header file.
+    """
+
+    # An API model has been added to a container model.  The change argument
+    # is a 2-tuple of the container and API.
+    API_ADDED = auto()
+
+    # An API model has been removed from a container model.  The change
+    # argument is a 2-tuple of the container and API.
+    API_REMOVED = auto()
+
+    # The status of an API model has changed.  The change argument is the API.
+    API_STATUS_CHANGED = auto()
+
+    # The versions of an API model have changed.  The change argument is the
+    # API.
+    API_VERSIONS_CHANGED = auto()
+
+    # The status of a header file has changed.  The change argument is the
+    # header file.
+    HEADER_FILE_STATUS_CHANGED = auto()
+
+
+class ChangeSet(list):
+    """ This class is a list of the 2-tuples of the type and argument of each
+    change made to a project in the order that they were made.
+    """
+
+    def add(self, change_type, argument):
+        """ Add a change. """
+
+        self.append((change_type, argument))
+
+    def arguments(self, change_type):
+        """ Return a list of the arguments of the changes of a particular type.
+        """
+
+        return [argument for ct, argument in self if ct is change_type]
+
+    @property
+    def added(self):
+        """ The 2-tuples of container and API of each added API. """
+
+        return self.arguments(ChangeType.API_ADDED)
+
+    @property
+    def removed(self):
+        """ The 2-tuples of container and API of each removed API. """
+
+        return self.arguments(ChangeType.API_REMOVED)
+
+    @property
+    def status_changed(self):
+        """ The APIs whose status has changed. """
+
+        return self.arguments(ChangeType.API_STATUS_CHANGED)
+
+    @property
+    def versions_changed(self):
+        """ The APIs whose versions have changed. """
+
+        return self.arguments(ChangeType.API_VERSIONS_CHANGED)
+
+
+def merge_header_file(project, header_file, parsed_header_file,
+        working_version):
+    """ Merge the code parsed from a header file for a working version into the
+    corresponding .sip file of a project.  Return the ChangeSet describing the
+    changes made to the project.
+    """
+
+    changes = ChangeSet()
+
+    # Find the corresponding .sip file creating it if is a new header file.
+    # FIXME: Assuming we ultimately want to be able to create a complete
+    #        project without parsing .h files then we will need the ability
+    #        (in the main editor) to manually create a SipFile instance.
+    for module in project.modules:
+        if module.name == header_file.module:
+            for sip_file in module.content:
+                if sip_file.name == header_file.name:
+                    break
+            else:
+                sip_file = SipFile(name=header_file.name)
+                module.content.append(sip_file)
+                changes.add(ChangeType.API_ADDED, (module, sip_file))
+
+            _merge_code(project, sip_file, parsed_header_file,
+                    working_version, changes)
+            break
+
+    # The file version no longer needs parsing.
+    for header_file_version in header_file.versions:
+        if header_file_version.version == working_version:
+            header_file_version.parse = False
+            changes.add(ChangeType.HEADER_FILE_STATUS_CHANGED, header_file)
+            break
+
+    return changes
+
+
+def _merge_code(project, dst_code, src_code, working_version, changes):
+    """ Merge source code into destination code. """
+
+    # Index the potentially new code APIs by their signature.  APIs with the
+    # same signature are matched in the order they were parsed.
+    src_apis = {}
+    for src_api in src_code:
+        src_apis.setdefault(adapt(src_api).signature(src_api), []).append(
+                src_api)
+
+    matched = set()
+
+    # Go though each existing code API.
+    for dst_api in list(dst_code.content):
+        # Manual code is always retained.
+        if isinstance(dst_api, ManualCode):
+            continue
+
+        candidates = src_apis.get(adapt(dst_api).signature(dst_api))
+        if candidates:
+            src_api = candidates.pop(0)
+
+            # Make sure the versions include the working version.
+            if working_version != '':
+                _add_working_version(project, dst_api, working_version,
+                        changes)
+
+            # Discard the new code API.
+            matched.add(id(src_api))
+
+            # Merge any child code.
+            if isinstance(dst_api, (CodeContainer, Enum)):
+                _merge_code(project, dst_api, src_api.content,
+                        working_version, changes)
+        else:
+            # The existing one doesn't exist in the working version.
+            if working_version == '':
+                # If it is ignored then forget about it because there are no
+                # other versions that might refer to it.
+                if dst_api.status == 'ignored':
+                    dst_code.content.remove(dst_api)
+                    changes.add(ChangeType.API_REMOVED, (dst_code, dst_api))
+                else:
+                    dst_api.status = 'removed'
+                    changes.add(ChangeType.API_STATUS_CHANGED, dst_api)
+            else:
+                version_status = _remove_working_version(project, dst_api,
+                        working_version, changes)
+                if version_status == 'no_longer_working':
+                    # It's removal needs checking.
+                    if dst_api.status == '':
+                        dst_api.status = 'unknown'
+                        changes.add(ChangeType.API_STATUS_CHANGED, dst_api)
+                elif version_status == 'no_longer_any':
+                    # Forget about it because there are no other versions that
+                    # refer to it.
+                    dst_code.content.remove(dst_api)
+                    changes.add(ChangeType.API_REMOVED, (dst_code, dst_api))
+
+    # Anything left in the source code is new.
+    src_code[:] = [src_api for src_api in src_code
+            if id(src_api) not in matched]
+
+    if working_version == '':
+        startversion = endversion = ''
+    else:
+        versions = project.versions
+        working_idx = versions.index(working_version)
+
+        # If the working version is the first then assume that the new API
+        # will appear in earlier versions, otherwise it is restricted to this
+        # version.
+        startversion = '' if working_idx == 0 else working_version
+
+        # If the working version is the latest then assume that the new API
+        # will appear in later versions, otherwise it is restricted to this
+        # version.
+        try:
+            endversion = versions[working_idx + 1]
+        except IndexError:
+            endversion = ''
+
+    for src_api in src_code:
+        if startversion != '' or endversion != '':
+            src_api.versions = interned_version_ranges(
+                    src_api.versions + (
+                            interned_version_range(startversion, endversion),
+                    ))
+            changes.add(ChangeType.API_VERSIONS_CHANGED, src_api)
+
+        # Try and place the new API with any similar one.
+        pos = -1
+        for idx, code in enumerate(dst_code.content):
+            if type(code) is not type(src_api):
+                continue
+
+            if isinstance(src_api, Constructor):
+                pos = idx
+                break
+
+            if isinstance(src_api, Callable) and code.name == src_api.name:
+                pos = idx
+                break
+
+        if pos >= 0:
+            dst_code.content.insert(pos, src_api)
+        else:
+            dst_code.content.append(src_api)
+
+        changes.add(ChangeType.API_ADDED, (dst_code, src_api))
+
+
+def _add_working_version(project, api, working_version, changes):
+    """ Add the working version to an API's version ranges. """
+
+    # There is only something to do if the API is currently versioned.
+    if len(api.versions) != 0:
+        # Add the working version.
+        vmap = VersionMap(project, api.versions)
+        vmap[working_version] = True
+        api.versions = vmap.as_version_ranges()
+
+        changes.add(ChangeType.API_VERSIONS_CHANGED, api)
+
+
+def _remove_working_version(project, api, working_version, changes):
+    """ Remove the working version from an API's version ranges.  Returns
+    'wasnt_working' if the API wasn't in the working version,
+    'no_longer_working' if the API is no longer in the working version and
+    'no_longer_any' if the API is no longer in any version.
+    """
+
+    # Construct the existing list of version ranges to a version map.
+    vmap = VersionMap(project, api.versions)
+
+    # Update the version map appropriately using the working version.  First
+    # take a shortcut to see if anything has changed.
+    if not vmap[working_version]:
+        return 'wasnt_working'
+
+    vmap[working_version] = False
+
+    # Convert the version map back to a list of version ranges.
+    versions = vmap.as_version_ranges()
+
+    if versions is None:
+        return 'no_longer_any'
+
+    api.versions = versions
+    changes.add(ChangeType.API_VERSIONS_CHANGED, api)
+
+    return 'no_longer_working'
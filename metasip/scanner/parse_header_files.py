@@ -0,0 +1,416 @@
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
+
+
+from concurrent.futures import ThreadPoolExecutor, wait
+import os
+
+from ..exceptions import UserException
+from ..helpers import get_platform_name, header_directory_platform
+from ..models import ManualCode
+from ..models.adapters import adapt
+
+from .cast_xml import CastXMLParser, run_castxml
+from .merge_header_file import ChangeType, merge_header_file
+from .read_header import read_header
+
+
+# The interval in seconds at which the UI is told that castxml is still being
+# waited for.
+_WAIT_INTERVAL = 0.05
+
+
+def header_file_pathname(source_directory, header_directory, header_file):
+    """ Return the name of the file that should actually be parsed for a header
+    file of a header directory in a source directory or None if it can't be
+    read.
+    """
+
+    header_directory_name = os.path.dirname(
+            header_directory_platform(header_directory).inputdirpattern)
+    name = os.path.join(source_directory, header_directory_name,
+            header_file.name)
+
+    if not os.access(name, os.R_OK):
+        return None
+
+    _, name, _ = read_header(name)
+
+    return name
+
+
+def parse_header_file(project, header_directory, header_file,
+        source_directory, working_version, ui, cache=None):
+    """ Parse a header file of a header directory for a working version, even
+    if it doesn't need parsing, and merge it into the project.
+    source_directory is the directory containing the header directory.  cache
+    is an optional CastXMLCache instance.  A UserException is raised if the
+    header file couldn't be parsed.
+    """
+
+    if header_directory_platform(header_directory) is None:
+        raise UserException(
+                f"Header directory '{header_directory.name}' has no "
+                f"configuration for the {get_platform_name()} platform")
+
+    source_directory = os.path.abspath(source_directory)
+
+    pathname = header_file_pathname(source_directory, header_directory,
+            header_file)
+
+    if pathname is None:
+        raise UserException(
+                f"Unable to read the '{header_file.name}' header file")
+
+    parser = CastXMLParser()
+
+    parsed_header_file = parser.parse(project, source_directory,
+            header_directory, header_file, pathname, ui.log, cache=cache)
+
+    if parsed_header_file is None:
+        raise UserException(parser.diagnostic)
+
+    _report_changes(
+            merge_header_file(project, header_file, parsed_header_file,
+                    working_version),
+            ui)
+
+    ui.log(f"Parsed '{pathname}'")
+
+
+def parse_header_files(project, header_directories, source_directory,
+        working_version, ui, jobs=1, cache=None, whole_directories=False):
+    """ Parse the header files of a sequence of header directories that need
+    parsing for a working version and merge them into the project.
+    source_directory is the directory containing the header directories.
+    castxml is run by jobs concurrent threads but the header files are merged
+    in order.  cache is an optional CastXMLCache instance.  If
+    whole_directories is set then castxml is run once for all the header files
+    of a header directory that have been parsed before, rather than once for
+    each header file.  Return a 2-tuple of True if the project was changed and
+    a list of diagnostics for the header files that couldn't be parsed, or None
+    if the user cancelled (in which case the project may have been partially
+    changed).
+    """
+
+    source_directory = os.path.abspath(source_directory)
+
+    # Find the header files that need parsing for the working version.
+    to_parse = []
+    diagnostics = []
+
+    for header_directory in header_directories:
+        for header_file in header_directory.content:
+            if header_file.ignored or header_file.module == '':
+                continue
+
+            for header_file_version in header_file.versions:
+                if header_file_version.version == working_version:
+                    break
+            else:
+                continue
+
+            if not header_file_version.parse:
+                continue
+
+            if header_directory_platform(header_directory) is None:
+                raise UserException(
+                        f"Header directory '{header_directory.name}' has no "
+                        f"configuration for the {get_platform_name()} "
+                        "platform")
+
+            pathname = header_file_pathname(source_directory,
+                    header_directory, header_file)
+
+            if pathname is None:
+                diagnostics.append(
+                        f"{header_file.name}: unable to read the file")
+            else:
+                to_parse.append((header_directory, header_file, pathname))
+
+    ui.parse_starting(len(to_parse))
+
+    changed = False
+
+    parsed = _parse(project, source_directory, to_parse, whole_directories,
+            jobs, cache, diagnostics, ui)
+
+    try:
+        for header_file, pathname, parsed_header_file in parsed:
+            if parsed_header_file is not None:
+                changes = merge_header_file(project, header_file,
+                        parsed_header_file, working_version)
+                _report_changes(changes, ui)
+                changed = True
+
+                ui.log(f"Parsed '{pathname}'")
+
+            if not ui.parse_step():
+                return None
+    except _Cancelled:
+        return None
+    finally:
+        parsed.close()
+
+    return changed, diagnostics
+
+
+class _Cancelled(Exception):
+    """ Raised when the user cancels while waiting for castxml. """
+
+
+def _parse(project, source_directory, to_parse, whole_directories, jobs,
+        cache, diagnostics, ui):
+    """ A generator for the parsed header files.  to_parse is the list of
+    3-tuples of header directory, header file and the name of the file to
+    parse.  A 3-tuple of the header file, the name of the file and the parsed
+    header file (or None if there was an error) is returned for each in the
+    same order.
+    """
+
+    # castxml only attributes a declaration that is repeated in several header
+    # files parsed as a whole to one of them.  These lost declarations are
+    # detected by comparing with the existing .sip file so a header file that
+    # doesn't have one is always parsed separately.
+    wholes = {}
+
+    if whole_directories:
+        for header_directory, header_file, pathname in to_parse:
+            if _find_sip_file(project, header_file) is not None:
+                wholes.setdefault(id(header_directory), []).append(
+                        (header_file, pathname))
+
+    # Each run is a 2-tuple of the header directory and the list of 2-tuples
+    # of header file and file name parsed by an invocation of castxml.  Note
+    # where each header file will be found in the results.
+    runs = []
+    locations = []
+    whole_run_nrs = {}
+
+    for header_directory, header_file, pathname in to_parse:
+        whole = wholes.get(id(header_directory), ())
+        if len(whole) < 2:
+            whole = ()
+
+        for position, (whole_header_file, _) in enumerate(whole):
+            if whole_header_file is header_file:
+                run_nr = whole_run_nrs.get(id(header_directory))
+                if run_nr is None:
+                    run_nr = len(runs)
+                    whole_run_nrs[id(header_directory)] = run_nr
+                    runs.append((header_directory, whole))
+
+                locations.append((run_nr, position))
+                break
+        else:
+            locations.append((len(runs), 0))
+            runs.append((header_directory, [(header_file, pathname)]))
+
+    # The executor isn't used as a context manager because that would wait for
+    # any running invocations if the generator was closed early.
+    executor = ThreadPoolExecutor(max_workers=jobs)
+
+    futures = [
+            executor.submit(run_castxml, source_directory, header_directory,
+                    [pathname for _, pathname in header_files], cache=cache)
+            for header_directory, header_files in runs]
+
+    results = [None] * len(runs)
+    consumed = [False] * len(runs)
+
+    try:
+        for (_, header_file, pathname), (run_nr, position) in zip(to_parse,
+                locations):
+            if not consumed[run_nr]:
+                consumed[run_nr] = True
+                header_directory, header_files = runs[run_nr]
+                results[run_nr] = _parse_run(project, source_directory,
+                        header_directory, header_files, futures[run_nr],
+                        executor, cache, diagnostics, ui)
+
+            yield header_file, pathname, results[run_nr][position]
+    finally:
+        # Discard the output of any invocations that won't be parsed.
+        _discard_castxml_output(
+                [future for future, c in zip(futures, consumed) if not c])
+        executor.shutdown(wait=False)
+
+
+def _parse_run(project, source_directory, header_directory, run, future,
+        executor, cache, diagnostics, ui):
+    """ Parse the output of an invocation of castxml for a list of header files
+    and return the list of the parsed header files (which will be None if there
+    was an error).
+    """
+
+    castxml_output = _wait_for_castxml(future, ui)
+
+    parser = CastXMLParser()
+
+    parsed_header_files = parser.parse_castxml_output(project,
+            [pathname for _, pathname in run], castxml_output, ui.log)
+
+    if parsed_header_files is None:
+        if len(run) == 1:
+            diagnostics.append(f"{run[0][0].name}: {parser.diagnostic}")
+            return [None]
+
+        # Fallback to parsing each header file separately.
+        ui.log(f"Parsing the header files of {header_directory.name} "
+                "separately")
+
+        return _parse_separately(project, source_directory, header_directory,
+                run, executor, cache, diagnostics, ui)
+
+    if len(run) > 1:
+        lost = _find_lost_declarations(project, run, parsed_header_files)
+
+        if lost:
+            for index in lost:
+                ui.log(f"{run[index][0].name}: declarations may have been "
+                        "attributed to another header file so parsing it "
+                        "separately")
+
+            reparsed_header_files = _parse_separately(project,
+                    source_directory, header_directory,
+                    [run[index] for index in lost], executor, cache,
+                    diagnostics, ui)
+
+            parsed_header_files = list(parsed_header_files)
+
+            for index, reparsed_header_file in zip(lost,
+                    reparsed_header_files):
+                parsed_header_files[index] = reparsed_header_file
+
+    return parsed_header_files
+
+
+def _parse_separately(project, source_directory, header_directory,
+        header_files, executor, cache, diagnostics, ui):
+    """ Parse each of a list of header files separately and return a list of
+    the parsed header files (which will be None if there was an error).
+    """
+
+    futures = [
+            executor.submit(run_castxml, source_directory, header_directory,
+                    [pathname], cache=cache)
+            for _, pathname in header_files]
+
+    parsed_header_files = []
+    nr_consumed = 0
+
+    try:
+        for header_file_pathname, future in zip(header_files, futures):
+            nr_consumed += 1
+            parsed_header_files.extend(
+                    _parse_run(project, source_directory, header_directory,
+                            [header_file_pathname], future, executor, cache,
+                            diagnostics, ui))
+    finally:
+        _discard_castxml_output(futures[nr_consumed:])
+
+    return parsed_header_files
+
+
+def _discard_castxml_output(futures):
+    """ Discard the output of a sequence of castxml invocations.  Any
+    invocations that haven't started are cancelled and the output of any that
+    are running is discarded when they finish.
+    """
+
+    for future in futures:
+        if not future.cancel():
+            future.add_done_callback(_remove_castxml_output)
+
+
+def _report_changes(changes, ui):
+    """ Report the changes made by merging a parsed header file to the UI. """
+
+    for change_type, argument in changes:
+        if change_type is ChangeType.API_ADDED:
+            ui.api_added(*argument)
+        elif change_type is ChangeType.API_REMOVED:
+            ui.api_removed(*argument)
+        elif change_type is ChangeType.API_STATUS_CHANGED:
+            ui.api_status_changed(argument)
+        elif change_type is ChangeType.API_VERSIONS_CHANGED:
+            ui.api_versions_changed(argument)
+        elif change_type is ChangeType.HEADER_FILE_STATUS_CHANGED:
+            ui.header_file_status(argument)
+
+
+def _wait_for_castxml(future, ui):
+    """ Wait for an invocation of castxml to finish, while allowing the user to
+    cancel, and return the 4-tuple returned by run_castxml().
+    """
+
+    while True:
+        done, _ = wait((future, ), timeout=_WAIT_INTERVAL)
+        if done:
+            return future.result()
+
+        if not ui.parse_waiting():
+            # The invocation has already been consumed so its output must be
+            # discarded here.
+            _discard_castxml_output((future, ))
+            raise _Cancelled()
+
+
+def _find_lost_declarations(project, header_files, parsed_header_files):
+    """ Return the indexes of the header files parsed as a whole that appear
+    to have lost a declaration to another header file, i.e. the corresponding
+    .sip file contains an API that wasn't parsed from the header file but was
+    parsed from another one.
+    """
+
+    # The indexes of the header files that each API signature was parsed from.
+    parsed_from = {}
+
+    for index, parsed_header_file in enumerate(parsed_header_files):
+        for api in parsed_header_file:
+            parsed_from.setdefault(adapt(api).signature(api), set()).add(index)
+
+    lost = []
+
+    for index, (header_file, _) in enumerate(header_files):
+        sip_file = _find_sip_file(project, header_file)
+        if sip_file is None:
+            continue
+
+        for api in sip_file.content:
+            if isinstance(api, ManualCode):
+                continue
+
+            indexes = parsed_from.get(adapt(api).signature(api), ())
+            if index not in indexes and len(indexes) != 0:
+                lost.append(index)
+                break
+
+    return lost
+
+
+def _find_sip_file(project, header_file):
+    """ Return the .sip file corresponding to a header file or None if there
+    isn't one.
+    """
+
+    for module in project.modules:
+        if module.name == header_file.module:
+            for sip_file in module.content:
+                if sip_file.name == header_file.name:
+                    return sip_file
+
+            break
+
+    return None
+
+
+def _remove_castxml_output(future):
+    """ Remove the XML file created by a finished invocation of castxml. """
+
+    if not future.cancelled() and future.exception() is None:
+        _, _, iname, _ = future.result()
+
+        if iname is not None:
+            os.remove(iname)
@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
+
+
+from xml.parsers import expat
+
+
+class ParserBase:
+    """
+    The base class for all MetaSIP XML parsers.  Sub-classes implement methods
+    with the same name as the elements they deal with (with "Start" or "End"
+    appended).
+    """
+    def __init__(self):
+        """
+        Initialise the parser instance.
+        """
+        self.diagnostic = None
+
+        # The handlers are looked up once per element name for each parser
+        # class rather than for each element.
+        cls = type(self)
+
+        try:
+            self._handlers = cls.__dict__['_handler_table']
+        except KeyError:
+            self._handlers = cls._handler_table = ({}, {})
+
+    def classMap(self):
+        """
+        The default implementation to return an empty class map.
+        """
+        return {}
+
+    def _add_handlers(self, name):
+        """
+        Add the start and end handlers for an element name to the handler
+        table and return them.  A handler will be None if the element is
+        ignored.
+
+        name is the element name.
+        """
+        start_handlers, end_handlers = self._handlers
+        cls = type(self)
+
+        lname = name.lower()
+
+        # A class is called with the parser and the attributes in the same way
+        # as an unbound start method.
+        start = self.classMap().get(lname)
+
+        if start is None:
+            start = getattr(cls, lname + "Start", None)
+            end = getattr(cls, lname + "End", None)
+        else:
+            end = None
+
+        start_handlers[name] = start
+        end_handlers[name] = end
+
+        return start, end
+
+    def parse(self, ifname):
+        """ Parse an XML file.
+
+        :param ifname:
+            is the name of a file or a file object to parse.
+        :return:
+            ``True`` if the file was parsed successfully.
+        """
+
+        start_handlers, end_handlers = self._handlers
+
+        def start_element(name, attrs):
+            try:
+                start = start_handlers[name]
+            except KeyError:
+                start, _ = self._add_handlers(name)
+
+            if start is not None:
+                start(self, attrs)
+
+        def end_element(name):
+            try:
+                end = end_handlers[name]
+            except KeyError:
+                _, end = self._add_handlers(name)
+
+            if end is not None:
+                end(self)
+
+        parser = expat.ParserCreate()
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+
+        try:
+            if hasattr(ifname, 'read'):
+                parser.ParseFile(ifname)
+            else:
+                with open(ifname, 'rb') as f:
+                    parser.ParseFile(f)
+        except expat.ExpatError as e:
+            self.diagnostic = str(e)
+            return False
+
+        return True
+
+
+def optAttribute(attrs, name, default=''):
+    """ Return the value of an optional attribute.
+
+    :param attrs:
+        is the dictionary of attributes.
+    :param name:
+        is the name of the attribute to return.
+    :param default:
+        is the value to return if the attribute wasn't specified.
+    :return:
+        the value of the attribute.
+    """
+
+    return attrs.get(name, default)
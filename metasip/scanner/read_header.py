@@ -0,0 +1,43 @@
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
+
+
+import os
+
+
+def read_header(name, files=None):
+    """ Read the contents of a header file and return a 3-tuple of the
+    contents, the name of the file actually read and its encoding.  Handle the
+    special case of the file just being a #include redirect to another header
+    file.  If files is a list then the name and the result of os.stat() of
+    each file is appended to it before the file is read.
+    """
+
+    contents, actual_name, encoding = _read_single_header(name, files)
+    while actual_name != name:
+        name = actual_name
+        contents, actual_name, encoding = _read_single_header(name, files)
+
+    return contents, actual_name, encoding
+
+
+def _read_single_header(name, files):
+    """ Read the contents of a single header file. """
+
+    if files is not None:
+        files.append((name, os.stat(name)))
+
+    with open(name, 'r') as f:
+        contents = f.read()
+        encoding = f.encoding
+
+    lines = contents.strip().split('\n')
+    if len(lines) == 1:
+        words = lines[0].split()
+        if len(words) == 2 and words[0] == '#include':
+            include_name = words[1]
+            if include_name.startswith('".') and include_name.endswith('"'):
+                name = os.path.dirname(name) + '/' + include_name[1:-1]
+
+    return contents, name, encoding
@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
+
+
+import json
+import locale
+import os
+
+
+# The version of the format of the cache file.  This should be incremented
+# whenever the format changes in an incompatible way.
+_CACHE_FORMAT = 1
+
+
+class ScanCache:
+    """ This class implements a cache of the MD5 signatures of the header files
+    scanned for a project that is stored alongside the project file.  A
+    signature is only used if every file read when it was calculated (i.e.
+    including those read because of a #include redirect) has the same path,
+    size, modification time and inode.
+    """
+
+    def __init__(self, project):
+        """ Initialise the cache. """
+
+        self._name = project.name + '.scancache'
+
+        # The signatures depend on the encoding used to read the header files
+        # which is the default encoding.
+        self._encoding = locale.getpreferredencoding(False)
+
+        # The entries keyed by the absolute path of the header file.  Each
+        # entry is a 2-tuple of the signature and a list of the path, size,
+        # modification time and inode of each file read.
+        self._entries = {}
+
+        self._changed = False
+
+    def load(self):
+        """ Load the cache.  A missing, corrupt or incompatible cache is
+        treated as being empty.
+        """
+
+        try:
+            with open(self._name, encoding='UTF-8') as f:
+                cached = json.load(f)
+
+            if cached['format'] != _CACHE_FORMAT:
+                return
+
+            if cached['encoding'] != self._encoding:
+                return
+
+            self._entries = {path: (md5, files)
+                    for path, (md5, files) in cached['entries'].items()}
+        except Exception:
+            pass
+
+    def md5(self, header_path):
+        """ Return the cached signature of a header file or None if there is
+        no valid signature.
+        """
+
+        entry = self._entries.get(header_path)
+        if entry is None:
+            return None
+
+        md5, files = entry
+
+        for path, size, mtime_ns, ino in files:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return None
+
+            if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+                return None
+
+            if stat.st_ino != ino:
+                return None
+
+        return md5
+
+    def save(self):
+        """ Save the cache if it has changed.  Entries for header files that no
+        longer exist are discarded.  Failing to save the cache is not
+        considered an error.
+        """
+
+        for header_path in list(self._entries.keys()):
+            if not os.path.exists(header_path):
+                del self._entries[header_path]
+                self._changed = True
+
+        if not self._changed:
+            return
+
+        tmp_name = self._name + '.tmp'
+
+        try:
+            with open(tmp_name, 'w', encoding='UTF-8') as f:
+                json.dump(
+                        {
+                            'format': _CACHE_FORMAT,
+                            'encoding': self._encoding,
+                            'entries': self._entries
+                        },
+                        f)
+
+            os.replace(tmp_name, self._name)
+        except OSError:
+            try:
+                os.remove(tmp_name)
+            except OSError:
+                pass
+
+        self._changed = False
+
+    def update(self, header_path, md5, files):
+        """ Update the signature of a header file given the path and the result
+        of os.stat() of each file read when the signature was calculated.
+        """
+
+        self._entries[header_path] = (md5,
+                [(path, stat.st_size, stat.st_mtime_ns, stat.st_ino)
+                        for path, stat in files])
+        self._changed = True
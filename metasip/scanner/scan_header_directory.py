@@ -0,0 +1,300 @@
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Copyright (c) 2024 Phil Thompson <phil@riverbankcomputing.com>
+
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import glob
+import os
+
+from ..exceptions import UserException
+from ..helpers import get_platform_name, header_directory_platform, header_md5
+from ..models import HeaderFile, HeaderFileVersion
+
+from .read_header import read_header
+from .scan_cache import ScanCache
+
+
+def scan_header_directory(project, header_directory, source_directory,
+        working_version, ui, jobs=1, use_cache=False, use_threads=False):
+    """ Scan a header directory of a project for new, changed and removed
+    header files of a working version.  source_directory is the directory
+    containing the header directory.  If jobs is greater than 1 then the
+    header files are read by that number of processes, or threads if
+    use_threads is set.  Threads should be used by a GUI as forking a process
+    that uses Qt isn't supported.  If use_cache is set then header files that
+    haven't changed since the last scan are not read.  Return True if the
+    project was changed, False if it wasn't, or None if the user cancelled (in
+    which case the project may have been partially changed).
+    """
+
+    platform = header_directory_platform(header_directory)
+    if platform is None:
+        raise UserException(
+                f"Header directory '{header_directory.name}' has no "
+                f"configuration for the {get_platform_name()} platform")
+
+    source_directory = os.path.abspath(source_directory)
+    source_pattern = os.path.join(source_directory, platform.inputdirpattern)
+
+    header_directory_path = os.path.dirname(source_pattern)
+    ui.log(f"Scanning header directory '{header_directory_path}'")
+
+    # The header files are sorted so that any new ones are always added in the
+    # same order.  Note that readability is only checked here so that it is
+    # consistent with the signatures that are read.
+    header_paths = [header_path
+            for header_path in sorted(glob.iglob(source_pattern))
+                    if os.path.isfile(header_path)]
+    readable_paths = [header_path for header_path in header_paths
+            if os.access(header_path, os.R_OK)]
+
+    # Get the signatures of any header files that haven't changed.  The
+    # signatures of the others are None until they are read.
+    if use_cache:
+        cache = ScanCache(project)
+        cache.load()
+
+        md5s = {header_path: cache.md5(header_path)
+                for header_path in readable_paths}
+    else:
+        cache = None
+        md5s = dict.fromkeys(readable_paths)
+
+    uncached_paths = [header_path
+            for header_path, md5 in md5s.items() if md5 is None]
+
+    ui.scan_starting(header_directory, len(header_paths))
+
+    if jobs > 1 and len(uncached_paths) > 1:
+        executor_factory = (ThreadPoolExecutor if use_threads
+                else ProcessPoolExecutor)
+
+        with executor_factory(max_workers=jobs) as executor:
+            futures = {header_path: executor.submit(_header_file_md5,
+                            header_path)
+                    for header_path in uncached_paths}
+
+            # Apply the results in order so that the project is updated in
+            # the same way as if the files were read serially.
+            scanned = _scan_header_files(project, header_directory,
+                    header_paths,
+                    _header_file_md5_getter(md5s, cache,
+                            lambda header_path: futures[header_path].result()),
+                    working_version, ui)
+
+            if scanned is None:
+                for future in futures.values():
+                    future.cancel()
+    else:
+        scanned = _scan_header_files(project, header_directory, header_paths,
+                _header_file_md5_getter(md5s, cache, _header_file_md5),
+                working_version, ui)
+
+    if cache is not None:
+        cache.save()
+
+    # Don't do anything else if the user cancelled.
+    if scanned is None:
+        return None
+
+    saved, changed = scanned
+
+    # Anything left in the saved list has gone missing or was already missing.
+    for header_file in saved:
+        for header_file_version in header_file.versions:
+            if header_file_version.version == working_version:
+                header_file.versions.remove(header_file_version)
+
+                # If there is only one version left then remove the file
+                # itself.
+                if len(header_file.versions) == 0:
+                    header_directory.content.remove(header_file)
+                    _remove_from_module(project, header_file, ui)
+                else:
+                    # FIXME: Go through the corresponding SipFile and make
+                    # sure that all top-level APIs have an upper version set.
+                    pass
+
+                ui.log(f"'{header_file.name}' is no longer in the header directory")
+
+                ui.header_file_removed(header_file)
+                changed = True
+                break
+
+    # This version no longer needs scanning.
+    if working_version in header_directory.scan:
+        header_directory.scan.remove(working_version)
+        ui.header_directory_status(header_directory)
+        changed = True
+
+    return changed
+
+
+def _remove_from_module(project, header_file, ui):
+    """ Handle the removal of a header file from the project. """
+
+    # Find the corresponding .sip file.
+    for mod in project.modules:
+        if mod.name == header_file.module:
+            for sip_file in mod.content:
+                if sip_file.name == header_file.name:
+                    for code in list(sip_file.content):
+                        if code.status == 'ignored':
+                            # Remove any ignored API elements.
+                            sip_file.content.remove(code)
+                            ui.api_removed(sip_file, code)
+                        else:
+                            # Mark any non-ignored API elements so that the
+                            # user can decide what to do.
+                            code.status = 'removed'
+                            ui.api_status_changed(code)
+
+
+def _header_file_md5(header_path):
+    """ Return a 2-tuple of the MD5 signature of a header file ignoring any
+    comments and a list of the path and the result of os.stat() of each file
+    that was read.
+    """
+
+    files = []
+    src, _, encoding = read_header(header_path, files)
+
+    return header_md5(src, encoding), files
+
+
+def _header_file_md5_getter(md5s, cache, get_md5):
+    """ Return a function that takes the path of a header file and returns its
+    MD5 signature, or None if the header file isn't readable, given a dict of
+    the signatures keyed by the path of each readable header file.  An unknown
+    signature is obtained by calling get_md5() and any cache is updated.
+    """
+
+    def getter(header_path):
+        try:
+            md5 = md5s[header_path]
+        except KeyError:
+            return None
+
+        if md5 is None:
+            md5, files = get_md5(header_path)
+            md5s[header_path] = md5
+
+            if cache is not None:
+                cache.update(header_path, md5, files)
+
+        return md5
+
+    return getter
+
+
+def _scan_header_files(project, header_directory, header_paths, get_md5,
+        working_version, ui):
+    """ Update the header files of a header directory from their paths.
+    get_md5() is called with the path of each header file and returns its MD5
+    signature or None if it isn't readable.  Return a 2-tuple of the list of
+    existing header files that weren't found and True if the project was
+    changed, or None if the user cancelled.
+    """
+
+    changed = False
+
+    # Save the files that were in the directory.
+    saved = list(header_directory.content)
+
+    for header_path in header_paths:
+        md5 = get_md5(header_path)
+
+        if md5 is not None:
+            header_file, header_file_changed = _scan_header_file(project,
+                    header_directory, header_path, md5, working_version, ui)
+
+            if header_file_changed:
+                changed = True
+
+            for saved_header_file in saved:
+                if saved_header_file is header_file:
+                    saved.remove(saved_header_file)
+                    break
+            else:
+                # It's a new header file.
+                header_directory.content.append(header_file)
+                changed = True
+
+            ui.log(f"Scanned '{header_path}'")
+        else:
+            ui.log(f"Skipping unreadable header file '{header_path}'")
+
+        if not ui.scan_step():
+            return None
+
+    return saved, changed
+
+
+def _scan_header_file(project, header_directory, header_path, md5,
+        working_version, ui):
+    """ Update a header file from its MD5 signature and return a 2-tuple of the
+    header file instance and True if the project was changed.
+    """
+
+    changed = False
+
+    # See if we already know about the file.
+    header_file_name = os.path.basename(header_path)
+
+    for header_file in header_directory.content:
+        if header_file.name == header_file_name:
+            new_header_file = False
+            break
+    else:
+        # It's a new file.
+        header_file = HeaderFile(name=header_file_name)
+        new_header_file = True
+
+    # See if we already know about this version.
+    for header_file_version in header_file.versions:
+        if header_file_version.version == working_version:
+            # See if the version's contents have changed.
+            if header_file_version.md5 != md5:
+                header_file_version.md5 = md5
+                header_file_version.parse = True
+                ui.header_file_status(header_file)
+                changed = True
+
+            break
+    else:
+        # It's a new version.
+        header_file_version = HeaderFileVersion(md5=md5, parse=True,
+                version=working_version)
+        header_file.versions.append(header_file_version)
+
+        # Check that the project has versions.
+        if len(project.versions) != 0:
+            # Find the immediately preceding version if there is one.
+            versions_sorted = sorted(header_file.versions,
+                    key=lambda v: project.versions.index(v.version))
+
+            prev_md5 = ''
+            prev_parse = True
+            for hfv in versions_sorted:
+                if hfv.version == working_version:
+                    break
+
+                prev_md5 = hfv.md5
+                prev_parse = hfv.parse
+
+            if prev_md5 == md5:
+                header_file_version.parse = prev_parse
+        else:
+            # It must be a new file of an unversioned project.
+            header_file_version.parse = True
+
+        if new_header_file:
+            ui.header_file_added(header_file, header_directory,
+                    working_version)
+        else:
+            ui.header_file_status(header_file)
+
+        changed = True
+
+    return header_file, changed